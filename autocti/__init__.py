@@ -61,14 +61,17 @@ from .dataset_1d.fit import FitDataset1D
 from .dataset_1d.model.analysis import AnalysisDataset1D
 from .dataset_1d.model.result import ResultDataset1D
 from .charge_injection.model.analysis import AnalysisImagingCI
+from .charge_injection.model.analysis_binned import AnalysisImagingCIBinned
 from .charge_injection.model.result import ResultImagingCI
 from .model.analysis import AnalysisCTI
+from .model.analysis_pool import CombinedAnalysisPool
 from .model.model_util import CTI1D
 from .model.model_util import CTI2D
 from .model.settings import SettingsCTI1D
 from .model.settings import SettingsCTI2D
 from .clocker.one_d import Clocker1D
 from .clocker.two_d import Clocker2D
+from .clocker.express import ExpressCalibration
 from . import aggregator as agg
 from . import util
 from . import plot
@@ -1,5 +1,6 @@
 import copy
-from typing import Dict, Optional
+import numpy as np
+from typing import Dict, Optional, Tuple
 
 
 import autoarray as aa
@@ -52,6 +53,33 @@ class FitImagingCI(aa.FitImaging):
 
         return self.dataset.noise_map
 
+    @property
+    def noise_map_unmasked(self) -> np.ndarray:
+        """
+        Returns the values of the noise-map, scaled by the hyper noise scalars if they are used, in every unmasked
+        pixel of the preloaded `unmasked_indexes`.
+
+        If the noise-map and sparse noise-scaling maps in these pixels are preloaded, the hyper noise-map is computed
+        via `hyper_noise_map_unmasked_from` and a scaled native noise-map is never created.
+        """
+        if self.hyper_noise_scalar_dict is None:
+            if self.preloads.noise_map_unmasked is not None:
+                return self.preloads.noise_map_unmasked
+
+        elif (
+            self.preloads.noise_map_unmasked is not None
+            and self.preloads.sparse_noise_scaling_map_dict is not None
+        ):
+            return hyper_noise_map_unmasked_from(
+                hyper_noise_scalar_dict=self.hyper_noise_scalar_dict,
+                sparse_noise_scaling_map_dict=self.preloads.sparse_noise_scaling_map_dict,
+                noise_map_unmasked=self.preloads.noise_map_unmasked,
+            )
+
+        return np.take(
+            native_array_from(array=self.noise_map), self.preloads.unmasked_indexes
+        )
+
     @property
     def model_data(self) -> aa.Array2D:
         return self.post_cti_data
@@ -78,7 +106,30 @@ class FitImagingCI(aa.FitImaging):
 
         This function computes the `chi_squared` directly from the data, avoiding the need to store the data in memory
         and offering faster tune times.
+
+        If the indexes of the unmasked pixels and the data in these pixels are preloaded, the `chi_squared` is computed
+        via `chi_squared_via_unmasked_indexes_from`, which only reads the model data in these pixels. For a fixed
+        noise-map the inverse noise variance in these pixels is also preloaded.
         """
+        if self.preloads.unmasked_indexes is not None:
+            inverse_noise_variance_unmasked = (
+                self.preloads.inverse_noise_variance_unmasked
+            )
+
+            if (
+                inverse_noise_variance_unmasked is None
+                or self.hyper_noise_scalar_dict is not None
+            ):
+                inverse_noise_variance_unmasked = 1.0 / np.square(
+                    self.noise_map_unmasked
+                )
+
+            return chi_squared_via_unmasked_indexes_from(
+                model_data=self.model_data,
+                unmasked_indexes=self.preloads.unmasked_indexes,
+                data_unmasked=self.preloads.data_unmasked,
+                inverse_noise_variance_unmasked=inverse_noise_variance_unmasked,
+            )
 
         return aa.util.fit.chi_squared_with_mask_fast_from(
             data=self.dataset.data,
@@ -98,6 +149,14 @@ class FitImagingCI(aa.FitImaging):
         if self.preloads.noise_normalization is not None:
             return self.preloads.noise_normalization
 
+        if self.preloads.unmasked_indexes is not None:
+            return float(
+                np.sum(
+                    np.log(2 * np.pi * np.square(self.noise_map_unmasked)),
+                    dtype="float64",
+                )
+            )
+
         return aa.util.fit.noise_normalization_with_mask_from(
             noise_map=self.noise_map, mask=self.mask
         )
@@ -144,3 +203,130 @@ def hyper_noise_map_from(hyper_noise_scalar_dict, noise_scaling_map_dict, noise_
         )
 
     return noise_map
+
+
+def sparse_noise_scaling_map_dict_from(
+    noise_scaling_map_dict: Dict, unmasked_indexes: np.ndarray
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Returns a sparse representation of every noise-scaling map in a dictionary, for the unmasked pixels of the input
+    `unmasked_indexes`.
+
+    A noise-scaling map is zero outside of the region it scales the noise of (e.g. the parallel EPERs), therefore
+    only its non-zero values and their positions in the array of unmasked pixels are stored.
+
+    Parameters
+    ----------
+    noise_scaling_map_dict
+        The noise-scaling maps of the dataset, which are multiplied by the hyper noise scalars to scale the noise-map.
+    unmasked_indexes
+        The flat (row-major) indexes of every unmasked pixel of the native dataset.
+    """
+    sparse_noise_scaling_map_dict = {}
+
+    for key, noise_scaling_map in noise_scaling_map_dict.items():
+        noise_scaling_unmasked = np.take(
+            native_array_from(array=noise_scaling_map), unmasked_indexes
+        )
+
+        non_zero_indexes = np.flatnonzero(noise_scaling_unmasked)
+
+        sparse_noise_scaling_map_dict[key] = (
+            non_zero_indexes,
+            noise_scaling_unmasked[non_zero_indexes],
+        )
+
+    return sparse_noise_scaling_map_dict
+
+
+def hyper_noise_map_unmasked_from(
+    hyper_noise_scalar_dict: Dict,
+    sparse_noise_scaling_map_dict: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    noise_map_unmasked: np.ndarray,
+) -> np.ndarray:
+    """
+    For the values of a noise-map in its unmasked pixels, use the model hyper noise and sparse noise-scaling maps to
+    compute the scaled noise-map in these pixels.
+
+    Every hyper noise scalar only updates the pixels where its noise-scaling map is non-zero, therefore this gives
+    the same values as `hyper_noise_map_from` without copying and adding native-sized arrays.
+
+    Parameters
+    ----------
+    hyper_noise_scalar_dict
+        The hyper noise scalars which the noise-scaling maps are multiplied by to scale the noise-map.
+    sparse_noise_scaling_map_dict
+        The non-zero values of every noise-scaling map and their positions in the unmasked pixels, computed via
+        `sparse_noise_scaling_map_dict_from`.
+    noise_map_unmasked
+        The values of the noise-map in every unmasked pixel.
+    """
+    noise_map_unmasked = np.array(noise_map_unmasked)
+
+    for key, hyper_noise_scalar in hyper_noise_scalar_dict.items():
+        non_zero_indexes, noise_scaling = sparse_noise_scaling_map_dict[key]
+
+        noise_map_unmasked[
+            non_zero_indexes
+        ] += hyper_noise_scalar.scaled_noise_map_from(noise_scaling=noise_scaling)
+
+    return noise_map_unmasked
+
+
+def native_array_from(array) -> np.ndarray:
+    """
+    Returns the values of an array (e.g. an `Array2D` which may be stored in its slim representation) as a flattened
+    ndarray of its native representation, without copying the values if they are already stored natively.
+    """
+    values = np.asarray(array)
+
+    if values.ndim == 1:
+        values = np.asarray(array.native)
+
+    return values.ravel()
+
+
+def unmasked_indexes_from(mask) -> np.ndarray:
+    """
+    Returns the flat (row-major) indexes of every unmasked pixel of the native representation of a mask.
+    """
+    return np.flatnonzero(~np.asarray(mask, dtype="bool"))
+
+
+def chi_squared_via_unmasked_indexes_from(
+    model_data, unmasked_indexes, data_unmasked, inverse_noise_variance_unmasked
+) -> float:
+    """
+    Returns the chi-squared of a fit of model data to data, computed only from the unmasked pixels of the data.
+
+    The model data is read in the unmasked pixels only and the residuals are squared in place and summed weighted by
+    the inverse noise variance via a single dot product, such that no native-sized temporary arrays (e.g. a residual
+    or chi-squared map) are created.
+
+    For data which is not `float64` (see `dtype_util.dtype_from`) the weighted residuals are instead summed with a
+    `float64` accumulator, as a dot product accumulates in the data type and loses precision over many pixels.
+
+    Parameters
+    ----------
+    model_data
+        The model data (e.g. the post-cti data output by a clocker) which is fitted to the data.
+    unmasked_indexes
+        The flat (row-major) indexes of every unmasked pixel of the native data.
+    data_unmasked
+        The values of the data in every pixel of `unmasked_indexes`.
+    inverse_noise_variance_unmasked
+        The inverse of the noise-map squared in every pixel of `unmasked_indexes`.
+    """
+    residual_unmasked = np.take(native_array_from(array=model_data), unmasked_indexes)
+
+    np.subtract(data_unmasked, residual_unmasked, out=residual_unmasked)
+    np.square(residual_unmasked, out=residual_unmasked)
+
+    if residual_unmasked.dtype == np.float64:
+        return float(np.dot(residual_unmasked, inverse_noise_variance_unmasked))
+
+    np.multiply(
+        residual_unmasked, inverse_noise_variance_unmasked, out=residual_unmasked
+    )
+
+    return float(np.sum(residual_unmasked, dtype="float64"))
@@ -1,44 +1,80 @@
+import json
 import numpy as np
+import warnings
+from astropy.io import fits
 from pathlib import Path
 from typing import Optional, List, Dict, Union
 
+from autoconf import conf
+from autoconf.dictable import from_dict, to_dict
+
 import autoarray as aa
 
+from autocti.charge_injection.imaging.lazy import LazyArray2D
+from autocti.charge_injection.imaging.lazy import array_2d_via_hdu_list_from
 from autocti.charge_injection.imaging.settings import SettingsImagingCI
 from autocti.charge_injection.layout import Layout2DCI
 from autocti.extract.settings import SettingsExtract
 from autocti.mask import mask_2d
+from autocti.util import dtype_util
 from autocti import exc
 
 
+def native_array_2d_from(
+    array: Union[aa.Array2D, LazyArray2D],
+) -> Union[aa.Array2D, LazyArray2D]:
+    """
+    Returns an array of a charge injection imaging dataset in its `native` representation with the configured data
+    type (see `dtype_util.dtype_from`), where an array which is loaded lazily is returned as it is and has the data
+    type when it is loaded.
+    """
+    if isinstance(array, LazyArray2D):
+        return array
+
+    return dtype_util.native_array_2d_from(array=array)
+
+
 class ImagingCI(aa.Imaging):
     def __init__(
         self,
-        data: aa.Array2D,
-        noise_map: aa.Array2D,
-        pre_cti_data: aa.Array2D,
+        data: Union[aa.Array2D, LazyArray2D],
+        noise_map: Union[aa.Array2D, LazyArray2D],
+        pre_cti_data: Union[aa.Array2D, LazyArray2D],
         layout: Layout2DCI,
-        cosmic_ray_map: Optional[aa.Array2D] = None,
+        cosmic_ray_map: Optional[Union[aa.Array2D, LazyArray2D]] = None,
         mask_persistence=None,
         noise_scaling_map_dict: Optional[Dict] = None,
         fpr_value: Optional[float] = None,
         settings_dict: Optional[Dict] = None,
     ):
-        super().__init__(data=data, noise_map=noise_map)
+        lazy_dict = {
+            name: array
+            for name, array in (
+                ("data", data),
+                ("noise_map", noise_map),
+                ("pre_cti_data", pre_cti_data),
+                ("cosmic_ray_map", cosmic_ray_map),
+            )
+            if isinstance(array, LazyArray2D)
+        }
+
+        super().__init__(
+            data=data, noise_map=noise_map, check_noise_map="noise_map" not in lazy_dict
+        )
 
-        self.data = self.data.native
-        self.noise_map = self.noise_map.native
-        self.pre_cti_data = pre_cti_data.native
+        self.data = native_array_2d_from(array=self.data)
+        self.noise_map = native_array_2d_from(array=self.noise_map)
+        self.pre_cti_data = native_array_2d_from(array=pre_cti_data)
 
         if cosmic_ray_map is not None:
-            cosmic_ray_map = cosmic_ray_map.native
+            cosmic_ray_map = native_array_2d_from(array=cosmic_ray_map)
 
         self.cosmic_ray_map = cosmic_ray_map
         self.mask_persistence = mask_persistence
 
         if noise_scaling_map_dict is not None:
             noise_scaling_map_dict = {
-                key: noise_scaling_map.native
+                key: native_array_2d_from(array=noise_scaling_map)
                 for key, noise_scaling_map in noise_scaling_map_dict.items()
             }
 
@@ -46,24 +82,67 @@ class ImagingCI(aa.Imaging):
 
         self.layout = layout
 
-        if fpr_value is None:
-            fpr_value = np.round(
-                np.mean(
-                    self.layout.extract.parallel_fpr.median_list_from(
-                        array=self.data,
-                        settings=SettingsExtract(
-                            pixels_from_end=min(
-                                10, self.layout.smallest_parallel_rows_within_ci_regions
-                            )
-                        ),
-                    )
-                ),
-                2,
-            )
+        self._lazy_dict = lazy_dict
+
+        for name in lazy_dict:
+            delattr(self, name)
+
+        if fpr_value is None and "data" in lazy_dict:
+            lazy_dict["fpr_value"] = None
+        elif fpr_value is None:
+            fpr_value = self.fpr_value_from()
+
+        if fpr_value is not None:
+            self.fpr_value = fpr_value
 
-        self.fpr_value = fpr_value
         self.settings_dict = settings_dict
 
+        self._norm_columns_cache = None
+
+    def __getattr__(self, item):
+        """
+        Load a component of the dataset which is loaded lazily (see `from_fits`) the first time it is used, after
+        which it is a normal attribute of the dataset.
+
+        If the data is loaded lazily and the `fpr_value` is not input, it is estimated from the data the first time
+        it is used (its entry in the lazy dictionary is `None`).
+        """
+        lazy_dict = self.__dict__.get("_lazy_dict", {})
+
+        if item not in lazy_dict:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{item}'"
+            )
+
+        if lazy_dict[item] is None:
+            value = self.fpr_value_from()
+        else:
+            value = lazy_dict[item].native_from()
+
+        setattr(self, item, value)
+
+        return value
+
+    def fpr_value_from(self) -> float:
+        """
+        Estimate the normalization of the FPR of the charge injection, as the mean of the median of every column of
+        the last 10 rows (or fewer if a charge injection region has fewer rows) of every FPR, which is used as the
+        `fpr_value` if it is not input.
+        """
+        return np.round(
+            np.mean(
+                self.layout.extract.parallel_fpr.median_list_from(
+                    array=self.data,
+                    settings=SettingsExtract(
+                        pixels_from_end=min(
+                            10, self.layout.smallest_parallel_rows_within_ci_regions
+                        )
+                    ),
+                )
+            ),
+            2,
+        )
+
     @property
     def mask(self):
         return self.data.mask
@@ -83,17 +162,51 @@ class ImagingCI(aa.Imaging):
         This function estimates the normalization of every column of data in the 2D regions, by taking the median
         of each column. If a mask is applied (e.g. to remove cosmic rays) these pixels are omitted from the median.
 
+        The columns of every region are stacked side-by-side into one array, where masked pixels (and the rows of
+        regions with fewer rows than the tallest region) are NaN, such that the medians of all columns are computed
+        via a single `np.nanmedian` call. The list is cached with the data and mask it was computed from, and is
+        recomputed if either is replaced (e.g. `dataset.data = dataset.data + 1.0`). Changing the values of the data
+        in-place is not detected.
+
+        A column whose pixels are all masked has a normalization of NaN.
+
         Returns
         -------
         A list of the normalization of every column of the charge regions
         """
-        masked_image = np.ma.array(data=self.data, mask=self.data.mask)
+        if self._norm_columns_cache is not None:
+            data, mask, norm_columns_list = self._norm_columns_cache
 
-        return [
-            np.ma.median(masked_image[region.y0 : region.y1, column_index])
-            for region in self.region_list
-            for column_index in range(region.x0, region.x1)
-        ]
+            if data is self.data and mask is self.data.mask:
+                return list(norm_columns_list)
+
+        data = np.where(self.data.mask, np.nan, np.asarray(self.data.native))
+
+        stacked_columns = np.full(
+            (
+                max(region.total_rows for region in self.region_list),
+                sum(region.total_columns for region in self.region_list),
+            ),
+            np.nan,
+        )
+
+        column_index = 0
+
+        for region in self.region_list:
+            stacked_columns[
+                : region.total_rows,
+                column_index : column_index + region.total_columns,
+            ] = data[region.slice]
+
+            column_index += region.total_columns
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            norm_columns_list = np.nanmedian(stacked_columns, axis=0).tolist()
+
+        self._norm_columns_cache = (self.data, self.data.mask, norm_columns_list)
+
+        return list(norm_columns_list)
 
     @property
     def pre_cti_data_residual_map(self) -> aa.Array2D:
@@ -110,18 +223,37 @@ class ImagingCI(aa.Imaging):
         return self.data - self.pre_cti_data
 
     def apply_mask(self, mask: mask_2d.Mask2D) -> "ImagingCI":
-        image = aa.Array2D(values=self.data.native, mask=mask)
-        noise_map = aa.Array2D(values=self.noise_map.native, mask=mask)
+        """
+        Returns the dataset with a mask applied to its data, noise-map, cosmic ray map and noise scaling maps.
+
+        The masked arrays are views of the arrays of this dataset (see `dtype_util.array_2d_view_from`), such that
+        only the mask is new and masking the dataset (e.g. many times for different masks) does not copy its arrays.
+        Masked pixels therefore keep their values, with every calculation on the masked dataset using its mask.
+
+        Because the arrays are shared, writing to the arrays of the masked dataset in-place (e.g.
+        `masked_dataset.data[0, 0] = 1.0`), or to those of a parallel calibration dataset extracted from it via
+        `apply_settings`, changes the arrays of this dataset. Copy an array before changing it in-place if this
+        dataset must be left unchanged.
+
+        Parameters
+        ----------
+        mask
+            The mask applied to the dataset.
+        """
+        image = dtype_util.array_2d_view_from(array=self.data, mask=mask)
+        noise_map = dtype_util.array_2d_view_from(array=self.noise_map, mask=mask)
 
         if self.cosmic_ray_map is not None:
-            cosmic_ray_map = aa.Array2D(values=self.cosmic_ray_map.native, mask=mask)
+            cosmic_ray_map = dtype_util.array_2d_view_from(
+                array=self.cosmic_ray_map, mask=mask
+            )
 
         else:
             cosmic_ray_map = None
 
         if self.noise_scaling_map_dict is not None:
             noise_scaling_map_dict = {
-                key: aa.Array2D(values=noise_scaling_map.native, mask=mask)
+                key: dtype_util.array_2d_view_from(array=noise_scaling_map, mask=mask)
                 for key, noise_scaling_map in self.noise_scaling_map_dict.items()
             }
 
@@ -131,7 +263,7 @@ class ImagingCI(aa.Imaging):
         return ImagingCI(
             data=image,
             noise_map=noise_map,
-            pre_cti_data=self.pre_cti_data.native,
+            pre_cti_data=self.pre_cti_data,
             layout=self.layout,
             cosmic_ray_map=cosmic_ray_map,
             mask_persistence=self.mask_persistence,
@@ -141,34 +273,33 @@ class ImagingCI(aa.Imaging):
         )
 
     def apply_settings(self, settings: SettingsImagingCI):
+        """
+        Returns the parallel or serial calibration dataset of the columns or rows specified by the settings, which
+        has the extracted mask of this dataset applied.
+
+        The arrays of a parallel calibration dataset are views of the arrays of this dataset. The arrays of a serial
+        calibration dataset are copied once, when the rows of every charge injection region are joined together.
+
+        Parameters
+        ----------
+        settings
+            The settings which specify the calibration columns or rows which are extracted.
+        """
         if settings.parallel_pixels is not None:
-            dataset = self.layout.extract.parallel_calibration.imaging_ci_from(
+            return self.layout.extract.parallel_calibration.imaging_ci_from(
                 dataset=self, columns=settings.parallel_pixels
             )
 
-            mask = self.layout.extract.parallel_calibration.mask_2d_from(
-                mask=self.mask, columns=settings.parallel_pixels
-            )
-
-        elif settings.serial_pixels is not None:
-            dataset = self.layout.extract.serial_calibration.imaging_ci_from(
+        if settings.serial_pixels is not None:
+            return self.layout.extract.serial_calibration.imaging_ci_from(
                 dataset=self, rows=settings.serial_pixels
             )
 
-            mask = self.layout.extract.serial_calibration.mask_2d_from(
-                mask=self.mask, rows=settings.serial_pixels
-            )
-
-        else:
-            return self
-
-        dataset = dataset.apply_mask(mask=mask)
-
-        return dataset
+        return self
 
     def set_noise_scaling_map_dict(self, noise_scaling_map_dict: Dict):
         self.noise_scaling_map_dict = {
-            key: noise_scaling_map.native
+            key: native_array_2d_from(array=noise_scaling_map)
             for key, noise_scaling_map in noise_scaling_map_dict.items()
         }
 
@@ -189,6 +320,7 @@ class ImagingCI(aa.Imaging):
         cosmic_ray_map_path: Optional[Union[Path, str]] = None,
         cosmic_ray_map_hdu: int = 0,
         settings_dict: Optional[Dict] = None,
+        lazy: bool = False,
     ) -> "ImagingCI":
         """
         Load charge injection imaging from multiple .fits file.
@@ -236,23 +368,38 @@ class ImagingCI(aa.Imaging):
         settings_dict
             A dictionary of settings associated with the charge injeciton imaging (e.g. voltage settings) which is
             used for visualization.
+        lazy
+            If `True`, every component loaded from a .fits file (and a noise-map from a single value) is loaded the
+            first time it is used (see `LazyArray2D`), such that a dataset can be opened without holding every
+            component in memory. The .fits files are read via memory maps and a noise-map loaded lazily is not
+            checked for values of zero or below.
         """
+        array_from = LazyArray2D.from_fits if lazy else aa.Array2D.from_fits
+
         if data_path is not None and data is None:
-            data = aa.Array2D.from_fits(
+            data = array_from(
                 file_path=data_path, hdu=data_hdu, pixel_scales=pixel_scales
             )
 
         if noise_map_path is not None:
-            noise_map = aa.util.array_2d.numpy_array_2d_via_fits_from(
-                file_path=noise_map_path, hdu=noise_map_hdu
+            noise_map = array_from(
+                file_path=noise_map_path, hdu=noise_map_hdu, pixel_scales=pixel_scales
+            )
+        elif lazy:
+            noise_map = LazyArray2D.full(
+                fill_value=noise_map_from_single_value,
+                shape_native=data.shape_native,
+                pixel_scales=pixel_scales,
             )
         else:
-            noise_map = np.ones(data.shape_native) * noise_map_from_single_value
-
-        noise_map = aa.Array2D.no_mask(values=noise_map, pixel_scales=pixel_scales)
+            noise_map = aa.Array2D.full(
+                fill_value=noise_map_from_single_value,
+                shape_native=data.shape_native,
+                pixel_scales=pixel_scales,
+            )
 
         if pre_cti_data_path is not None and pre_cti_data is None:
-            pre_cti_data = aa.Array2D.from_fits(
+            pre_cti_data = array_from(
                 file_path=pre_cti_data_path,
                 hdu=pre_cti_data_hdu,
                 pixel_scales=pixel_scales,
@@ -262,12 +409,13 @@ class ImagingCI(aa.Imaging):
                 "Cannot load pre_cti_data from .fits and pass explicit pre_cti_data."
             )
 
-        pre_cti_data = aa.Array2D.no_mask(
-            values=pre_cti_data.native, pixel_scales=pixel_scales
-        )
+        if not isinstance(pre_cti_data, LazyArray2D):
+            pre_cti_data = aa.Array2D.no_mask(
+                values=pre_cti_data.native, pixel_scales=pixel_scales
+            )
 
         if cosmic_ray_map_path is not None:
-            cosmic_ray_map = aa.Array2D.from_fits(
+            cosmic_ray_map = array_from(
                 file_path=cosmic_ray_map_path,
                 hdu=cosmic_ray_map_hdu,
                 pixel_scales=pixel_scales,
@@ -331,3 +479,163 @@ class ImagingCI(aa.Imaging):
             self.cosmic_ray_map.output_to_fits(
                 file_path=cosmic_ray_map_path, overwrite=overwrite
             )
+
+    def output_to_multi_hdu_fits(
+        self,
+        file_path: Union[Path, str],
+        overwrite: bool = False,
+        dtype: str = "float64",
+        compress: bool = False,
+    ):
+        """
+        Output the charge injection imaging dataset to a single multi-extension .fits file, which is loaded via
+        `from_multi_hdu_fits`.
+
+        Every array is output to its own named hdu (`DATA`, `NOISE_MAP`, `PRE_CTI_DATA`, `MASK` and, if the dataset
+        has them, `COSMIC_RAY_MAP` and a `NOISE_SCALING_MAP` hdu per noise scaling map, whose key is in its header).
+        The layout, settings dictionary, `fpr_value` and pixel scales are output to the header of the primary hdu,
+        such that the whole dataset is stored in one file rather than one file per array.
+
+        Parameters
+        ----------
+        file_path
+            The path to the .fits file the dataset is output to (e.g. '/path/to/dataset.fits').
+        overwrite
+            If `True`, the .fits file is overwritten if it already exists, if `False` it is not and an exception is
+            raised.
+        dtype
+            The data type the arrays are output as, where "float32" halves the size of the file.
+        compress
+            If `True`, every array is output to a losslessly compressed (GZIP) hdu.
+        """
+        flip_for_ds9 = conf.instance["general"]["fits"]["flip_for_ds9"]
+
+        def hdu_from(array: np.ndarray, name: str, dtype: str):
+            array = np.asarray(array).astype(dtype)
+
+            if flip_for_ds9:
+                array = np.flipud(array)
+
+            if compress:
+                return fits.CompImageHDU(
+                    data=array,
+                    name=name,
+                    compression_type="GZIP_2",
+                    quantize_level=0.0,
+                )
+
+            return fits.ImageHDU(data=array, name=name)
+
+        primary_hdu = fits.PrimaryHDU()
+
+        primary_hdu.header["PIXSCAY"] = self.data.pixel_scales[0]
+        primary_hdu.header["PIXSCAX"] = self.data.pixel_scales[1]
+        primary_hdu.header["FPRVALUE"] = float(self.fpr_value)
+        primary_hdu.header["LAYOUT"] = json.dumps(to_dict(self.layout))
+
+        if self.settings_dict is not None:
+            primary_hdu.header["SETTINGS"] = json.dumps(self.settings_dict)
+
+        hdu_list = [
+            primary_hdu,
+            hdu_from(array=self.data.native, name="DATA", dtype=dtype),
+            hdu_from(array=self.noise_map.native, name="NOISE_MAP", dtype=dtype),
+            hdu_from(array=self.pre_cti_data.native, name="PRE_CTI_DATA", dtype=dtype),
+            hdu_from(array=self.mask, name="MASK", dtype="uint8"),
+        ]
+
+        if self.cosmic_ray_map is not None:
+            hdu_list.append(
+                hdu_from(
+                    array=self.cosmic_ray_map.native, name="COSMIC_RAY_MAP", dtype=dtype
+                )
+            )
+
+        if self.noise_scaling_map_dict is not None:
+            for key, noise_scaling_map in self.noise_scaling_map_dict.items():
+                hdu = hdu_from(
+                    array=noise_scaling_map.native,
+                    name="NOISE_SCALING_MAP",
+                    dtype=dtype,
+                )
+                hdu.header["MAPKEY"] = key
+
+                hdu_list.append(hdu)
+
+        fits.HDUList(hdu_list).writeto(file_path, overwrite=overwrite)
+
+    @classmethod
+    def from_multi_hdu_fits(
+        cls, file_path: Union[Path, str], lazy: bool = False
+    ) -> "ImagingCI":
+        """
+        Load charge injection imaging from a single multi-extension .fits file output by `output_to_multi_hdu_fits`,
+        including its layout, mask, settings dictionary and `fpr_value`.
+
+        Arrays are loaded with the configured data type (see `dtype_util.dtype_from`), whatever type they were output as.
+
+        Parameters
+        ----------
+        file_path
+            The path to the .fits file the dataset is loaded from (e.g. '/path/to/dataset.fits').
+        lazy
+            If `True`, the data, noise-map, pre-cti data and cosmic ray map are loaded the first time they are used
+            (see `from_fits`), where the file is opened via a memory map.
+        """
+        with fits.open(file_path, memmap=True) as hdu_list:
+            header = hdu_list[0].header
+
+            pixel_scales = (header["PIXSCAY"], header["PIXSCAX"])
+
+            mask = hdu_list["MASK"].data.astype("bool")
+
+            if conf.instance["general"]["fits"]["flip_for_ds9"]:
+                mask = np.flipud(mask)
+
+            mask = mask_2d.Mask2D(mask=mask, pixel_scales=pixel_scales)
+
+            def array_from(hdu: str, mask=mask):
+                if lazy:
+                    return LazyArray2D.from_fits(
+                        file_path=file_path,
+                        hdu=hdu,
+                        pixel_scales=pixel_scales,
+                        mask=mask,
+                    )
+
+                return array_2d_via_hdu_list_from(
+                    hdu_list=hdu_list, hdu=hdu, pixel_scales=pixel_scales, mask=mask
+                )
+
+            hdu_name_list = [hdu.name for hdu in hdu_list]
+
+            if "COSMIC_RAY_MAP" in hdu_name_list:
+                cosmic_ray_map = array_from(hdu="COSMIC_RAY_MAP")
+            else:
+                cosmic_ray_map = None
+
+            noise_scaling_map_dict = {
+                hdu.header["MAPKEY"]: array_2d_via_hdu_list_from(
+                    hdu_list=hdu_list,
+                    hdu=index,
+                    pixel_scales=pixel_scales,
+                    mask=mask,
+                )
+                for index, hdu in enumerate(hdu_list)
+                if hdu.name == "NOISE_SCALING_MAP"
+            }
+
+            settings_dict = (
+                json.loads(header["SETTINGS"]) if "SETTINGS" in header else None
+            )
+
+            return ImagingCI(
+                data=array_from(hdu="DATA"),
+                noise_map=array_from(hdu="NOISE_MAP"),
+                pre_cti_data=array_from(hdu="PRE_CTI_DATA", mask=None),
+                layout=from_dict(json.loads(header["LAYOUT"])),
+                cosmic_ray_map=cosmic_ray_map,
+                noise_scaling_map_dict=noise_scaling_map_dict or None,
+                fpr_value=header["FPRVALUE"],
+                settings_dict=settings_dict,
+            )
@@ -0,0 +1,172 @@
+import numpy as np
+from astropy.io import fits
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from autoconf import conf
+import autoarray as aa
+
+from autocti.util import dtype_util
+
+
+def array_2d_via_hdu_list_from(
+    hdu_list: fits.HDUList,
+    hdu: Union[int, str],
+    pixel_scales: aa.type.PixelScales,
+    mask: Optional[aa.Mask2D] = None,
+) -> aa.Array2D:
+    """
+    Returns an `Array2D` stored in its `native` representation from an hdu of an open .fits file, which is flipped
+    upside-down if the .fits files are flipped for DS9 (the same as `Array2D.from_fits`) and has the configured data
+    type (see `dtype_util.dtype_from`).
+
+    The array is copied once from the hdu, therefore if the .fits file is opened via a memory map only the copy is
+    held in memory.
+
+    Parameters
+    ----------
+    hdu_list
+        The open .fits file.
+    hdu
+        The index or name of the hdu containing the array.
+    pixel_scales
+        The (y,x) arcsecond-to-pixel units conversion factor of every pixel.
+    mask
+        The mask of the array, which is an all `False` mask if not input.
+    """
+    values = hdu_list[hdu].data
+
+    if conf.instance["general"]["fits"]["flip_for_ds9"]:
+        values = np.flipud(values)
+
+    if mask is None:
+        mask = aa.Mask2D.all_false(shape_native=values.shape, pixel_scales=pixel_scales)
+
+    return aa.Array2D(
+        values=values.astype(dtype_util.dtype_from()),
+        mask=mask,
+        header=aa.Header(
+            header_sci_obj=hdu_list[0].header, header_hdu_obj=hdu_list[hdu].header
+        ),
+        store_native=True,
+    )
+
+
+class LazyArray2D:
+    def __init__(
+        self,
+        pixel_scales: aa.type.PixelScales,
+        file_path: Optional[Union[Path, str]] = None,
+        hdu: Union[int, str] = 0,
+        value: Optional[float] = None,
+        shape_native: Optional[Tuple[int, int]] = None,
+        mask: Optional[aa.Mask2D] = None,
+    ):
+        """
+        A 2D array of a charge injection imaging dataset which is not loaded until it is first used, which is either
+        an array in a .fits file or an array of a constant value (e.g. a noise-map from a single value).
+
+        An `ImagingCI` loaded via `from_fits` with `lazy=True` stores its components as lazy arrays, such that a
+        dataset can be opened (e.g. to inspect its layout or extract a calibration sub-region) without every
+        component being held in memory. The constant value of a noise-map is stored as a single float until it is
+        used.
+
+        A .fits file is opened via a memory map, such that only the shape is read from its header before the array
+        is used, and the array is copied once from the memory map into the `Array2D` it is loaded as.
+
+        Parameters
+        ----------
+        pixel_scales
+            The (y,x) arcsecond-to-pixel units conversion factor of every pixel.
+        file_path
+            The path to the .fits file containing the array, which is `None` for an array of a constant value.
+        hdu
+            The index or name of the hdu the array is contained in the .fits file specified by `file_path`.
+        value
+            The value of every pixel of an array of a constant value.
+        shape_native
+            The 2D shape of an array of a constant value.
+        mask
+            The mask of the array when it is loaded, which is an all `False` mask if not input.
+        """
+        self.pixel_scales = pixel_scales
+        self.file_path = file_path
+        self.hdu = hdu
+        self.value = value
+        self._shape_native = shape_native
+        self.mask = mask
+
+    @classmethod
+    def from_fits(
+        cls,
+        file_path: Union[Path, str],
+        hdu: Union[int, str],
+        pixel_scales: aa.type.PixelScales,
+        mask: Optional[aa.Mask2D] = None,
+    ) -> "LazyArray2D":
+        return LazyArray2D(
+            pixel_scales=pixel_scales, file_path=file_path, hdu=hdu, mask=mask
+        )
+
+    @classmethod
+    def full(
+        cls,
+        fill_value: float,
+        shape_native: Tuple[int, int],
+        pixel_scales: aa.type.PixelScales,
+        mask: Optional[aa.Mask2D] = None,
+    ) -> "LazyArray2D":
+        return LazyArray2D(
+            pixel_scales=pixel_scales,
+            value=fill_value,
+            shape_native=shape_native,
+            mask=mask,
+        )
+
+    @property
+    def shape_native(self) -> Tuple[int, int]:
+        """
+        The 2D shape of the array, which for a .fits file is read from its header without loading the array.
+        """
+        if self._shape_native is None:
+            with fits.open(self.file_path, memmap=True) as hdu_list:
+                self._shape_native = tuple(hdu_list[self.hdu].shape)
+
+        return self._shape_native
+
+    @property
+    def native(self) -> "LazyArray2D":
+        """
+        A lazy array is loaded in its `native` representation, so is returned as it is.
+        """
+        return self
+
+    def native_from(self) -> aa.Array2D:
+        """
+        Load the array, returning it as an `Array2D` stored in its `native` representation (the same as the `native`
+        attribute of an `Array2D` loaded via `Array2D.from_fits`).
+        """
+        if self.file_path is not None:
+            with fits.open(self.file_path, memmap=True) as hdu_list:
+                return array_2d_via_hdu_list_from(
+                    hdu_list=hdu_list,
+                    hdu=self.hdu,
+                    pixel_scales=self.pixel_scales,
+                    mask=self.mask,
+                )
+
+        mask = self.mask
+
+        if mask is None:
+            mask = aa.Mask2D.all_false(
+                shape_native=self.shape_native, pixel_scales=self.pixel_scales
+            )
+
+        return aa.Array2D(
+            values=np.broadcast_to(
+                np.asarray(self.value, dtype=dtype_util.dtype_from()),
+                self.shape_native,
+            ),
+            mask=mask,
+            store_native=True,
+        )
@@ -53,7 +53,9 @@ class ReadoutPersistence:
         self.rows_per_persistence_range = rows_per_persistence_range
         self.seed = seed
 
-    def data_with_readout_persistence_from(self, data: aa.Array2D) -> aa.Array2D:
+    def data_with_readout_persistence_from(
+        self, data: aa.Array2D, generator: Optional[np.random.Generator] = None
+    ) -> aa.Array2D:
         """
         Returns the input data with readout persistence added to it.
 
@@ -63,30 +65,41 @@ class ReadoutPersistence:
 
         The `__init__` method describes how the readout persistence is simulated.
 
+        If a `generator` is input the rows and values are drawn from it, otherwise numpy's global random state is
+        seeded for every row via the `seed`.
+
         Parameters
         ----------
         data
             The 2D array of data to which readout persistence is added.
+        generator
+            The random number generator the rows and values are drawn from, which does not use numpy's global random
+            state.
 
         Returns
         -------
         The input data with readout persistence added to it.
         """
         for i in range(self.total_rows):
-            if self.seed == -1:
-                seed = np.random.randint(0, int(1e9))
-            else:
-                seed = self.seed + i
+            if generator is None:
+                if self.seed == -1:
+                    seed = np.random.randint(0, int(1e9))
+                else:
+                    seed = self.seed + i
 
-            np.random.seed(seed)
+                np.random.seed(seed)
+
+                normal, integers = np.random.normal, np.random.randint
+            else:
+                normal, integers = generator.normal, generator.integers
 
             row_value = 0.0
 
             while row_value <= 0.0:
-                row_value = np.random.normal(self.mean, self.sigma)
+                row_value = normal(self.mean, self.sigma)
 
-            row_index = np.random.randint(0, data.shape[0])
-            row_range = np.random.randint(
+            row_index = integers(0, data.shape[0])
+            row_range = integers(
                 self.rows_per_persistence_range[0], self.rows_per_persistence_range[1]
             )
 
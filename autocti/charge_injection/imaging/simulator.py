@@ -1,6 +1,6 @@
 import copy
 import numpy as np
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import autoarray as aa
 
@@ -12,6 +12,8 @@ from autocti.charge_injection.layout import Layout2DCI
 from autocti.clocker.two_d import Clocker2D
 from autocti.extract.settings import SettingsExtract
 from autocti.model.model_util import CTI2D
+from autocti.util import dtype_util
+from autocti.util import random_util
 
 from typing import Optional
 
@@ -33,6 +35,7 @@ class SimulatorImagingCI(SimulatorImaging):
         noise_if_add_noise_false: float = 0.1,
         noise_seed: int = -1,
         ci_seed: int = -1,
+        rng: Optional[random_util.RandomState] = None,
     ):
         """A class representing a Imaging observation, using the shape of the image, the pixel scale,
         psf, exposure time, etc.
@@ -41,6 +44,15 @@ class SimulatorImagingCI(SimulatorImaging):
         ----------
         exposure_time_map
             The exposure time of an observation using this data_type.
+        rng
+            The master seed (an integer, `np.random.SeedSequence` or `np.random.Generator`) of the random numbers of
+            every simulated frame. If input, the `frame_index` passed to a simulation selects the frame's stream,
+            which is the sequence at that index of `random_util.seed_sequence_list_from`, and every random component
+            of a frame (the injection normalizations, charge noise, readout persistence, flat field Poisson noise and
+            read noise) draws from an independent stream spawned from it, without using numpy's global random state.
+            A frame therefore only depends on the master seed and its `frame_index`, such that frames are
+            reproducible when simulated in any order or concurrently by copies of the simulator in different
+            processes. If not input, the `noise_seed` and `ci_seed` seed numpy's global random state.
         """
 
         super().__init__(
@@ -64,14 +76,59 @@ class SimulatorImagingCI(SimulatorImaging):
 
         self.ci_seed = ci_seed
 
+        self.seed_sequence = (
+            None if rng is None else random_util.seed_sequence_from(rng=rng)
+        )
+
+    def generator_dict_from(
+        self, frame_index: int = 0
+    ) -> Optional[Dict[str, np.random.Generator]]:
+        """
+        Returns the random number generators of every random component of a simulated frame, which are spawned from
+        the stream of the simulator's `seed_sequence` at `frame_index`, or `None` if the simulator has no `rng`.
+
+        The generators only depend on the `seed_sequence` and `frame_index`, not on how many frames the simulator
+        has simulated before.
+
+        Parameters
+        ----------
+        frame_index
+            The index of the simulated frame, which selects its random number stream.
+        """
+        if self.seed_sequence is None:
+            return None
+
+        component_list = [
+            "ci",
+            "charge_noise",
+            "readout_persistence",
+            "flat_field",
+            "read_noise",
+        ]
+
+        frame_sequence = random_util.seed_sequence_at_index_from(
+            rng=self.seed_sequence, index=frame_index
+        )
+
+        return {
+            component: np.random.default_rng(seed_sequence)
+            for component, seed_sequence in zip(
+                component_list, frame_sequence.spawn(len(component_list))
+            )
+        }
+
     @property
     def _ci_seed(self) -> int:
         if self.ci_seed == -1:
             return np.random.randint(0, int(1e9))
         return self.ci_seed
 
-    def median_list_from(self, total_columns: int) -> List[float]:
-        np.random.seed(self._ci_seed)
+    def median_list_from(
+        self, total_columns: int, generator: Optional[np.random.Generator] = None
+    ) -> List[float]:
+        if generator is None:
+            np.random.seed(self._ci_seed)
+            generator = np.random
 
         injection_norm_list = []
 
@@ -79,21 +136,26 @@ class SimulatorImagingCI(SimulatorImaging):
             injection_norm = 0
 
             while injection_norm <= 0 or injection_norm >= self.max_norm:
-                injection_norm = np.random.normal(self.norm, self.column_sigma)
+                injection_norm = generator.normal(self.norm, self.column_sigma)
 
             injection_norm_list.append(injection_norm)
 
         return injection_norm_list
 
-    def injection_norm_list_with_limit_from(self, total_columns: int) -> List[float]:
+    def injection_norm_list_with_limit_from(
+        self, total_columns: int, generator: Optional[np.random.Generator] = None
+    ) -> List[float]:
         injection_norm_list = self.median_list_from(
-            total_columns=self.non_uniform_norm_limit
+            total_columns=self.non_uniform_norm_limit, generator=generator
         )
 
+        if generator is None:
+            generator = np.random
+
         injection_norm_limited_list = []
 
         for i in range(total_columns):
-            injection_norm = np.random.choice(injection_norm_list)
+            injection_norm = generator.choice(injection_norm_list)
 
             injection_norm_limited_list.append(injection_norm)
 
@@ -113,7 +175,9 @@ class SimulatorImagingCI(SimulatorImaging):
             norm=self.norm, pixel_scales=self.pixel_scales
         )
 
-    def pre_cti_data_non_uniform_from(self, layout: Layout2DCI) -> aa.Array2D:
+    def pre_cti_data_non_uniform_from(
+        self, layout: Layout2DCI, generator: Optional[np.random.Generator] = None
+    ) -> aa.Array2D:
         """
         Use this charge injection layout to generate a pre-cti charge injection image. This is performed by going
         to its charge injection regions and adding an input normalization value to each column, which are
@@ -136,16 +200,19 @@ class SimulatorImagingCI(SimulatorImaging):
         ci_seed
             Input ci_seed for the random number generator to give reproducible results. A new ci_seed is always used for each \
             pre_cti_datas, ensuring each non-uniform ci_region has the same column non-uniformity layout_ci.
+        generator
+            The random number generator the injection normalizations are drawn from, instead of seeding numpy's
+            global random state via the `ci_seed`.
         """
 
         for region in layout.region_list:
             if self.non_uniform_norm_limit is None:
                 injection_norm_list = self.median_list_from(
-                    total_columns=region.total_columns
+                    total_columns=region.total_columns, generator=generator
                 )
             else:
                 injection_norm_list = self.injection_norm_list_with_limit_from(
-                    total_columns=region.total_columns
+                    total_columns=region.total_columns, generator=generator
                 )
 
         return layout.pre_cti_data_non_uniform_from(
@@ -160,6 +227,7 @@ class SimulatorImagingCI(SimulatorImaging):
         clocker: Optional[Clocker2D],
         cti: Optional[CTI2D],
         cosmic_ray_map: Optional[aa.Array2D] = None,
+        frame_index: int = 0,
     ) -> ImagingCI:
         """Simulate a charge injection image, including effects like noises.
 
@@ -181,18 +249,26 @@ class SimulatorImagingCI(SimulatorImaging):
             The FWHM of the Gaussian read-noises added to the image.
         noise_seed
             Seed for the read-noises added to the image.
+        frame_index
+            The index of the simulated frame, which selects its random number stream if the simulator has an `rng`.
         """
 
+        generator_dict = self.generator_dict_from(frame_index=frame_index)
+
         if self.flat_field_mode:
             return self.via_flat_field_mode(
                 layout=layout,
                 clocker=clocker,
                 cti=cti,
                 cosmic_ray_map=cosmic_ray_map,
+                generator_dict=generator_dict,
             )
 
         if self.column_sigma is not None:
-            pre_cti_data = self.pre_cti_data_non_uniform_from(layout=layout)
+            pre_cti_data = self.pre_cti_data_non_uniform_from(
+                layout=layout,
+                generator=None if generator_dict is None else generator_dict["ci"],
+            )
         else:
             pre_cti_data = self.pre_cti_data_uniform_from(layout=layout)
 
@@ -202,6 +278,7 @@ class SimulatorImagingCI(SimulatorImaging):
             clocker=clocker,
             cti=cti,
             cosmic_ray_map=cosmic_ray_map,
+            generator_dict=generator_dict,
         )
 
     def via_pre_cti_data_from(
@@ -211,7 +288,12 @@ class SimulatorImagingCI(SimulatorImaging):
         clocker: Optional[Clocker2D],
         cti: Optional[CTI2D],
         cosmic_ray_map: Optional[aa.Array2D] = None,
+        generator_dict: Optional[Dict[str, np.random.Generator]] = None,
+        frame_index: int = 0,
     ) -> ImagingCI:
+        if generator_dict is None:
+            generator_dict = self.generator_dict_from(frame_index=frame_index)
+
         pre_cti_data = pre_cti_data.native
 
         if cosmic_ray_map is not None:
@@ -234,6 +316,9 @@ class SimulatorImagingCI(SimulatorImaging):
                 settings=SettingsExtract(
                     pixels_from_end=layout.extract.parallel_fpr.total_rows_min
                 ),
+                generator=(
+                    None if generator_dict is None else generator_dict["charge_noise"]
+                ),
             )
 
         if cti is not None:
@@ -243,7 +328,12 @@ class SimulatorImagingCI(SimulatorImaging):
 
         if self.readout_persistance is not None:
             post_cti_data = self.readout_persistance.data_with_readout_persistence_from(
-                data=post_cti_data
+                data=post_cti_data,
+                generator=(
+                    None
+                    if generator_dict is None
+                    else generator_dict["readout_persistence"]
+                ),
             )
 
         if cosmic_ray_map is not None:
@@ -254,6 +344,7 @@ class SimulatorImagingCI(SimulatorImaging):
             pre_cti_data=pre_cti_data,
             layout=layout,
             cosmic_ray_map=cosmic_ray_map,
+            generator_dict=generator_dict,
         )
 
     def via_post_cti_data_from(
@@ -262,11 +353,21 @@ class SimulatorImagingCI(SimulatorImaging):
         pre_cti_data: aa.Array2D,
         layout: Layout2DCI,
         cosmic_ray_map: Optional[aa.Array2D] = None,
+        generator_dict: Optional[Dict[str, np.random.Generator]] = None,
+        frame_index: int = 0,
     ) -> ImagingCI:
+        if generator_dict is None:
+            generator_dict = self.generator_dict_from(frame_index=frame_index)
+
         if self.read_noise is not None:
-            ci_image = aa.preprocess.data_with_gaussian_noise_added(
-                data=post_cti_data, sigma=self.read_noise, seed=self.noise_seed
-            )
+            if generator_dict is None:
+                ci_image = aa.preprocess.data_with_gaussian_noise_added(
+                    data=post_cti_data, sigma=self.read_noise, seed=self.noise_seed
+                )
+            else:
+                ci_image = post_cti_data + generator_dict["read_noise"].normal(
+                    0.0, self.read_noise, post_cti_data.shape
+                )
 
             ci_image = aa.Array2D.no_mask(
                 values=ci_image, pixel_scales=self.pixel_scales
@@ -306,11 +407,21 @@ class SimulatorImagingCI(SimulatorImaging):
         clocker: Optional[Clocker2D],
         cti: Optional[CTI2D],
         cosmic_ray_map: Optional[aa.Array2D] = None,
+        generator_dict: Optional[Dict[str, np.random.Generator]] = None,
+        frame_index: int = 0,
     ):
+        if generator_dict is None:
+            generator_dict = self.generator_dict_from(frame_index=frame_index)
+
         pre_cti_data = np.zeros(layout.shape_2d)
         pre_cti_data[layout.region_list[0].slice] = self.norm
 
-        pre_cti_data_poisson = np.random.poisson(pre_cti_data, pre_cti_data.shape)
+        if generator_dict is None:
+            pre_cti_data_poisson = np.random.poisson(pre_cti_data, pre_cti_data.shape)
+        else:
+            pre_cti_data_poisson = generator_dict["flat_field"].poisson(
+                pre_cti_data, pre_cti_data.shape
+            )
 
         pre_cti_data_poisson = copy.copy(pre_cti_data_poisson)
 
@@ -335,6 +446,7 @@ class SimulatorImagingCI(SimulatorImaging):
             pre_cti_data=pre_cti_data,
             layout=layout,
             cosmic_ray_map=cosmic_ray_map,
+            generator_dict=generator_dict,
         )
 
         if self.read_noise is None:
@@ -354,6 +466,6 @@ class SimulatorImagingCI(SimulatorImaging):
             + noise_map[layout.region_list[0].slice]
         )
 
-        dataset.noise_map = noise_map
+        dataset.noise_map = dtype_util.native_array_2d_from(array=noise_map)
 
         return dataset
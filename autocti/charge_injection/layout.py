@@ -14,6 +14,7 @@ from autocti.instruments.euclid.layout import Layout2DEuclid
 from autocti.layout.two_d import Layout2D
 
 from autocti.charge_injection import ci_util
+from autocti.util import dtype_util
 
 
 class Layout2DCI(Layout2D):
@@ -144,7 +145,9 @@ class Layout2DCI(Layout2D):
         for region in self.region_list:
             pre_cti_data[region.slice] += norm
 
-        return aa.Array2D.no_mask(values=pre_cti_data, pixel_scales=pixel_scales)
+        return dtype_util.array_2d_no_mask_from(
+            values=pre_cti_data, pixel_scales=pixel_scales
+        )
 
     def pre_cti_data_non_uniform_from(
         self,
@@ -185,7 +188,9 @@ class Layout2DCI(Layout2D):
                 row_slope=row_slope,
             )
 
-        return aa.Array2D.no_mask(values=pre_cti_data, pixel_scales=pixel_scales)
+        return dtype_util.array_2d_no_mask_from(
+            values=pre_cti_data, pixel_scales=pixel_scales
+        )
 
     def pre_cti_data_non_uniform_via_lists_from(
         self,
@@ -226,7 +231,9 @@ class Layout2DCI(Layout2D):
                 row_slope=row_slope,
             )
 
-        return aa.Array2D.no_mask(values=pre_cti_data, pixel_scales=pixel_scales)
+        return dtype_util.array_2d_no_mask_from(
+            values=pre_cti_data, pixel_scales=pixel_scales
+        )
 
     def noise_map_non_uniform_from(
         self,
@@ -258,7 +265,9 @@ class Layout2DCI(Layout2D):
                 np.square(read_noise) + np.square(noise_region)
             )
 
-        return aa.Array2D.no_mask(values=noise_map, pixel_scales=pixel_scales)
+        return dtype_util.array_2d_no_mask_from(
+            values=noise_map, pixel_scales=pixel_scales
+        )
 
     def noise_map_non_uniform_via_lists_from(
         self,
@@ -291,7 +300,9 @@ class Layout2DCI(Layout2D):
                 np.square(read_noise) + np.square(noise_region)
             )
 
-        return aa.Array2D.no_mask(values=noise_map, pixel_scales=pixel_scales)
+        return dtype_util.array_2d_no_mask_from(
+            values=noise_map, pixel_scales=pixel_scales
+        )
 
 
 class ElectronicsCI:
@@ -1,15 +1,247 @@
-from typing import List
+import itertools
+import numpy as np
+from astropy.io import fits
+from astropy.stats import sigma_clip
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
+
+from autoconf import conf
+import autoarray as aa
 
 from autoarray.structures.arrays.uniform_2d import Array2D
 
+from autocti import exc
+
+Frame = Union[Array2D, np.ndarray, Path, str]
+
+
+def is_path(frame: Frame) -> bool:
+    return isinstance(frame, (Path, str))
+
+
+def frame_rows_from(
+    frame: Frame,
+    row_start: int = 0,
+    row_stop: Optional[int] = None,
+    hdu: int = 0,
+) -> np.ndarray:
+    """
+    Returns the rows between `row_start` and `row_stop` of the native values of a charge injection frame, which is
+    an array or the path to a .fits file.
+
+    A .fits file is opened via a memory map, such that only the rows which are returned are read from the file. If
+    the .fits files are flipped for DS9 the rows are flipped upside-down (the same as `Array2D.from_fits`).
+
+    Parameters
+    ----------
+    frame
+        The charge injection frame, or the path to the .fits file containing it.
+    row_start
+        The first row which is returned.
+    row_stop
+        The row after the last row which is returned, which is the last row of the frame if not input.
+    hdu
+        The hdu of the .fits file the frame is contained in.
+    """
+    if not is_path(frame):
+        try:
+            values = frame.values if frame.store_native else frame.native.values
+        except AttributeError:
+            values = np.asarray(frame)
+
+        return values[row_start:row_stop]
+
+    with fits.open(frame, memmap=True) as hdu_list:
+        values = hdu_list[hdu].data
+
+        total_rows = values.shape[0]
+        row_stop = total_rows if row_stop is None else min(row_stop, total_rows)
+
+        if conf.instance["general"]["fits"]["flip_for_ds9"]:
+            return np.flipud(
+                values[total_rows - row_stop : total_rows - row_start]
+            ).astype("float64")
+
+        return values[row_start:row_stop].astype("float64")
+
+
+def shape_native_from(frame: Frame, hdu: int = 0) -> Tuple[int, int]:
+    """
+    Returns the 2D shape of a charge injection frame, which for a .fits file is read from its header without
+    loading the frame.
+    """
+    if is_path(frame):
+        with fits.open(frame, memmap=True) as hdu_list:
+            return tuple(hdu_list[hdu].shape)
+
+    return frame_rows_from(frame=frame).shape
+
+
+def pixel_scales_from(
+    frame: Frame, pixel_scales: Optional[aa.type.PixelScales] = None
+) -> aa.type.PixelScales:
+    """
+    Returns the pixel scales of a master charge injection frame, which are the pixel scales of a charge injection
+    frame if they are not input.
+    """
+    if pixel_scales is not None:
+        return pixel_scales
+
+    try:
+        return frame.pixel_scales
+    except AttributeError:
+        raise exc.ImagingCIException(
+            "The pixel scales of a master charge injection frame must be input if the frames are not `Array2D` "
+            "objects (e.g. they are paths to .fits files)."
+        )
+
+
+class MasterCIStack:
+    def __init__(
+        self, shape_native: Tuple[int, int], pixel_scales: aa.type.PixelScales
+    ):
+        """
+        Accumulates the mean and variance of every pixel of a stack of charge injection frames one frame at a time,
+        via Welford's algorithm, such that only one frame is held in memory at once.
+
+        The mean, the sum of squared differences from the mean and a scratch array of every pixel are stored in one
+        buffer which is allocated once, such that adding a frame creates no temporary arrays. Unlike summing the
+        frames and dividing by their number, the variance is computed without the loss of precision of subtracting
+        two large sums.
+
+        Parameters
+        ----------
+        shape_native
+            The 2D shape of every frame.
+        pixel_scales
+            The (y,x) arcsecond-to-pixel units conversion factor of every pixel.
+        """
+        self.shape_native = tuple(shape_native)
+        self.pixel_scales = pixel_scales
+        self.total_frames = 0
+
+        self._buffer = np.zeros((3,) + self.shape_native)
+
+    def add(self, frame: Frame, hdu: int = 0):
+        """
+        Add a charge injection frame (or the path to the .fits file containing it) to the stack.
+
+        Parameters
+        ----------
+        frame
+            The charge injection frame, or the path to the .fits file containing it.
+        hdu
+            The hdu of the .fits file the frame is contained in.
+        """
+        values = frame_rows_from(frame=frame, hdu=hdu)
+
+        if values.shape != self.shape_native:
+            raise exc.ImagingCIException(
+                f"A charge injection frame of shape {values.shape} cannot be added to a master frame of shape "
+                f"{self.shape_native}."
+            )
 
-def master_ci_from(ci_list: List[Array2D]) -> Array2D:
+        self.total_frames += 1
+
+        mean, squared_difference_sum, delta = self._buffer
+
+        np.subtract(values, mean, out=delta)
+        np.multiply(delta, 1.0 / self.total_frames, out=delta)
+
+        mean += delta
+
+        np.square(delta, out=delta)
+        np.multiply(delta, self.total_frames * (self.total_frames - 1), out=delta)
+
+        squared_difference_sum += delta
+
+    @property
+    def mean(self) -> Array2D:
+        """
+        The mean of every pixel of the frames in the stack.
+        """
+        return Array2D.no_mask(values=self._buffer[0], pixel_scales=self.pixel_scales)
+
+    @property
+    def variance(self) -> Array2D:
+        """
+        The (sample) variance of every pixel of the frames in the stack, which is zero for a stack of one frame.
+        """
+        return Array2D.no_mask(
+            values=self._buffer[1] / max(self.total_frames - 1, 1),
+            pixel_scales=self.pixel_scales,
+        )
+
+
+def master_ci_stack_from(
+    ci_list: Iterable[Frame],
+    pixel_scales: Optional[aa.type.PixelScales] = None,
+    hdu: int = 0,
+) -> MasterCIStack:
+    """
+    Returns the stack of a list (or any iterable, e.g. a generator) of charge injection frames or paths to the .fits
+    files containing them, from which the mean and variance of every pixel is computed (see `MasterCIStack`).
+
+    The frames are iterated over once and only one frame is held in memory at once.
+
+    Parameters
+    ----------
+    ci_list
+        The charge injection frames, or the paths to the .fits files containing them.
+    pixel_scales
+        The (y,x) arcsecond-to-pixel units conversion factor of every pixel, which is the pixel scales of the first
+        frame if not input.
+    hdu
+        The hdu of the .fits files the frames are contained in.
+    """
+    ci_iter = iter(ci_list)
+
+    try:
+        frame = next(ci_iter)
+    except StopIteration:
+        raise exc.ImagingCIException(
+            "A master charge injection frame cannot be computed from no frames."
+        )
+
+    stack = MasterCIStack(
+        shape_native=shape_native_from(frame=frame, hdu=hdu),
+        pixel_scales=pixel_scales_from(frame=frame, pixel_scales=pixel_scales),
+    )
+
+    for frame in itertools.chain([frame], ci_iter):
+        stack.add(frame=frame, hdu=hdu)
+
+    return stack
+
+
+def master_ci_from(
+    ci_list: Iterable[Frame],
+    pixel_scales: Optional[aa.type.PixelScales] = None,
+    hdu: int = 0,
+    method: str = "mean",
+    sigma: float = 3.0,
+    rows_per_block: int = 64,
+) -> Array2D:
     """
     Determine the master charge injection frame from a list of observations of charge injection images, which all use
     the same charge injection parameters and therefore should all be identical except for read noise.
 
-    The master frame is computed by summing all images in the list and dividing by the number of images, e.g. it is
-    the mean value across the images in every pixel.
+    The frames can be input as arrays or as paths to the .fits files containing them, and are combined in every
+    pixel via one of the following methods:
+
+    - `mean`: The mean value across the images, which is accumulated one frame at a time (see `MasterCIStack`),
+    such that the frames can be input as an iterator (e.g. a generator loading every frame) and only one frame is
+    held in memory at once.
+
+    - `median`: The median value across the images.
+
+    - `sigma_clip`: The mean value across the images after values more than `sigma` standard deviations from the
+    median are iteratively removed (e.g. cosmic rays), where a pixel whose values are all removed is NaN.
+
+    The median and sigma clipped combinations need every frame in every pixel, so are computed in blocks of
+    `rows_per_block` rows, where only these rows of every frame are held in memory at once. The frames are iterated
+    over once for every block, therefore an iterator is converted to a list. For frames in .fits files only the rows
+    of the block are read from every file, so a list of paths uses little memory for any number of frames.
 
     There are many effects this function does not account for (bias, NL, cosmics, CTI, etc.) that will most likely
     need to be accounted for before a more realistic implementation is possible.
@@ -18,15 +250,67 @@ def master_ci_from(ci_list: List[Array2D]) -> Array2D:
     ----------
     ci_list
         A list of charge injection images all of which are taken using the same charge injection
-        parameters / electronics.
+        parameters / electronics, or the paths to the .fits files containing them.
+    pixel_scales
+        The (y,x) arcsecond-to-pixel units conversion factor of every pixel, which is the pixel scales of the first
+        image if not input.
+    hdu
+        The hdu of the .fits files the images are contained in.
+    method
+        How the images are combined in every pixel (`mean`, `median` or `sigma_clip`).
+    sigma
+        The number of standard deviations from the median beyond which values are removed for `sigma_clip`.
+    rows_per_block
+        The number of rows of every image held in memory at once for `median` and `sigma_clip`.
 
     Returns
     -------
     The estimated master charge injection image.
     """
+    if method == "mean":
+        return master_ci_stack_from(
+            ci_list=ci_list, pixel_scales=pixel_scales, hdu=hdu
+        ).mean
+
+    if method not in ("median", "sigma_clip"):
+        raise exc.ImagingCIException(
+            f"The method {method} of combining charge injection frames is not one of mean, median or sigma_clip."
+        )
+
+    ci_list = list(ci_list)
+
+    if len(ci_list) == 0:
+        raise exc.ImagingCIException(
+            "A master charge injection frame cannot be computed from no frames."
+        )
+
+    shape_native = shape_native_from(frame=ci_list[0], hdu=hdu)
+
+    master_ci = np.zeros(shape_native)
+
+    for row_start in range(0, shape_native[0], rows_per_block):
+        row_stop = min(row_start + rows_per_block, shape_native[0])
+
+        block = np.stack(
+            [
+                frame_rows_from(
+                    frame=frame, row_start=row_start, row_stop=row_stop, hdu=hdu
+                )
+                for frame in ci_list
+            ]
+        )
+
+        if method == "median":
+            np.median(block, axis=0, out=master_ci[row_start:row_stop])
 
-    master_ci = sum(ci_list) / len(ci_list)
+        else:
+            master_ci[row_start:row_stop] = (
+                sigma_clip(block, sigma=sigma, axis=0, masked=True, copy=False)
+                .mean(axis=0)
+                .filled(np.nan)
+            )
 
     return Array2D.no_mask(
-        values=master_ci.native, pixel_scales=ci_list[0].pixel_scales
+        values=master_ci,
+        pixel_scales=pixel_scales_from(frame=ci_list[0], pixel_scales=pixel_scales),
     )
@@ -1,4 +1,5 @@
 import logging
+import numpy as np
 from typing import List, Optional
 
 from autoconf import conf
@@ -9,16 +10,20 @@ import autofit as af
 
 from autocti.charge_injection.imaging.imaging import ImagingCI
 from autocti.charge_injection.fit import FitImagingCI
+from autocti.charge_injection.fit import native_array_from
+from autocti.charge_injection.fit import sparse_noise_scaling_map_dict_from
+from autocti.charge_injection.fit import unmasked_indexes_from
 from autocti.charge_injection.model.visualizer import VisualizerImagingCI
 from autocti.charge_injection.model.result import ResultImagingCI
 from autocti.clocker.two_d import Clocker2D
+from autocti.clocker import clocker_util
 from autocti.charge_injection.hyper import HyperCINoiseCollection
 from autocti.model.analysis import AnalysisCTI
+from autocti.model.fit_cache import FitCache
+from autocti.model.fit_cache import fit_cache_key_from
 from autocti.model.settings import SettingsCTI2D
 from autocti.preloads import Preloads
 
-from autocti import exc
-
 logger = logging.getLogger(__name__)
 
 logger.setLevel(level="INFO")
@@ -34,6 +39,7 @@ class AnalysisImagingCI(AnalysisCTI):
         clocker: Clocker2D,
         settings_cti: SettingsCTI2D = SettingsCTI2D(),
         dataset_full: Optional[ImagingCI] = None,
+        fit_cache_size: int = 0,
     ):
         """
         Fits a CTI model to a charge injection imaging dataset via a non-linear search.
@@ -58,6 +64,10 @@ class AnalysisImagingCI(AnalysisCTI):
         dataset_full
             The full dataset, which is visualized separate from the `dataset` that is fitted, which for example may
             not have the FPR masked and thus enable visualization of the FPR.
+        fit_cache_size
+            If above 0, the post-cti data and figure of merit of this many fits are stored in a `FitCache`, such that
+            evaluating the likelihood of (or visualizing) an instance with identical parameters to a recent fit does
+            not add CTI via arctic again. The cache's `hits` and `misses` are counted.
         """
         super().__init__(
             dataset=dataset,
@@ -66,36 +76,49 @@ class AnalysisImagingCI(AnalysisCTI):
             dataset_full=dataset_full,
         )
 
+        self.fit_cache = FitCache(size=fit_cache_size) if fit_cache_size > 0 else None
+
         self.preloads = Preloads()
 
         parallel_fast_index_list = None
         parallel_fast_column_lists = None
+        parallel_fast_inverse_indexes = None
 
         serial_fast_index_list = None
         serial_fast_row_lists = None
+        serial_fast_inverse_indexes = None
 
-        if self.clocker.parallel_fast_mode and not self.clocker.serial_fast_mode:
+        if self.clocker.parallel_fast_mode:
             (
                 parallel_fast_index_list,
-                parallel_fast_column_lists,
-            ) = clocker.fast_indexes_from(data=dataset.pre_cti_data, for_parallel=True)
+                parallel_fast_inverse_indexes,
+            ) = clocker.fast_indexes_inverse_from(
+                data=dataset.pre_cti_data, for_parallel=True
+            )
+
+            parallel_fast_column_lists = clocker_util.fast_stripe_lists_from(
+                inverse=parallel_fast_inverse_indexes
+            )
 
-        elif not self.clocker.parallel_fast_mode and self.clocker.serial_fast_mode:
-            serial_fast_index_list, serial_fast_row_lists = clocker.fast_indexes_from(
+        elif self.clocker.serial_fast_mode:
+            (
+                serial_fast_index_list,
+                serial_fast_inverse_indexes,
+            ) = clocker.fast_indexes_inverse_from(
                 data=dataset.pre_cti_data, for_parallel=False
             )
 
-        elif self.clocker.parallel_fast_mode and self.clocker.serial_fast_mode:
-            raise exc.ClockerException(
-                "Both parallel fast model and serial fast mode cannot be turned on.\n"
-                "Only switch on parallel fast mode for parallel + serial clocking."
+            serial_fast_row_lists = clocker_util.fast_stripe_lists_from(
+                inverse=serial_fast_inverse_indexes
             )
 
         self.preloads = Preloads(
             parallel_fast_index_list=parallel_fast_index_list,
             parallel_fast_column_lists=parallel_fast_column_lists,
+            parallel_fast_inverse_indexes=parallel_fast_inverse_indexes,
             serial_fast_index_list=serial_fast_index_list,
             serial_fast_row_lists=serial_fast_row_lists,
+            serial_fast_inverse_indexes=serial_fast_inverse_indexes,
         )
 
     def region_list_from(self, model: af.Collection) -> List:
@@ -134,8 +157,13 @@ class AnalysisImagingCI(AnalysisCTI):
          1) Visualizes the charge injection imaging dataset, which does not change during the analysis and thus can be
             done once.
 
-         2) Checks if the noise-map is fixed (it is not if hyper functionality is on), and if it is fixed it
-            sets the noise-normalization to the preloads for computational speed.
+         2) Preloads the indexes of the unmasked pixels and the data and noise-map in them, such that the chi-squared
+            of every fit only reads the model data in these pixels.
+
+         3) Checks if the noise-map is fixed (it is not if hyper functionality is on), and if it is fixed it
+            sets the noise-normalization and the inverse noise variance of every unmasked pixel to the preloads for
+            computational speed. If it is not fixed, the non-zero values of the noise-scaling maps are preloaded,
+            such that the scaled noise-map is only computed in the pixels it changes.
 
         Parameters
         ----------
@@ -150,6 +178,20 @@ class AnalysisImagingCI(AnalysisCTI):
         if paths.is_complete:
             return self
 
+        unmasked_indexes = unmasked_indexes_from(mask=self.dataset.mask)
+
+        self.preloads.unmasked_indexes = unmasked_indexes
+        self.preloads.data_unmasked = np.take(
+            native_array_from(array=self.dataset.data), unmasked_indexes
+        )
+        self.preloads.noise_map_unmasked = np.take(
+            native_array_from(array=self.dataset.noise_map), unmasked_indexes
+        )
+
+        logger.info(
+            "PRELOADS - Unmasked Indexes, Data and Noise-Map preloaded for model-fit."
+        )
+
         if not model.has(HyperCINoiseCollection):
             noise_normalization = aa.util.fit.noise_normalization_with_mask_from(
                 noise_map=self.dataset.noise_map, mask=self.dataset.mask
@@ -161,6 +203,26 @@ class AnalysisImagingCI(AnalysisCTI):
                 "PRELOADS - Noise Normalization preloaded for model-fit (noise-map is fixed)."
             )
 
+            self.preloads.inverse_noise_variance_unmasked = 1.0 / np.square(
+                self.preloads.noise_map_unmasked
+            )
+
+            logger.info(
+                "PRELOADS - Inverse Noise Variance preloaded for model-fit (noise-map is fixed)."
+            )
+
+        elif self.dataset.noise_scaling_map_dict is not None:
+            self.preloads.sparse_noise_scaling_map_dict = (
+                sparse_noise_scaling_map_dict_from(
+                    noise_scaling_map_dict=self.dataset.noise_scaling_map_dict,
+                    unmasked_indexes=self.preloads.unmasked_indexes,
+                )
+            )
+
+            logger.info(
+                "PRELOADS - Sparse Noise Scaling Maps preloaded for model-fit (noise-map is scaled)."
+            )
+
         return self
 
     def log_likelihood_function(self, instance: af.ModelInstance) -> float:
@@ -182,10 +244,26 @@ class AnalysisImagingCI(AnalysisCTI):
             serial_traps=instance.cti.serial_trap_list,
         )
 
-        fit = self.fit_via_instance_and_dataset_from(
+        if self.fit_cache is None:
+            fit = self.fit_via_instance_and_dataset_from(
+                instance=instance, dataset=self.dataset, hyper_noise_scale=True
+            )
+
+            return fit.figure_of_merit
+
+        key = fit_cache_key_from(instance=instance, hyper_noise_scale=True)
+
+        cached_fit = self.fit_cache.get(key=key)
+
+        if cached_fit is not None:
+            return cached_fit[1]
+
+        fit = self._fit_via_instance_and_dataset_from(
             instance=instance, dataset=self.dataset, hyper_noise_scale=True
         )
 
+        self.fit_cache.set(key=key, value=(fit.post_cti_data, fit.figure_of_merit))
+
         return fit.figure_of_merit
 
     def fit_via_instance_and_dataset_from(
@@ -193,23 +271,67 @@ class AnalysisImagingCI(AnalysisCTI):
         instance: af.ModelInstance,
         dataset: ImagingCI,
         hyper_noise_scale: bool = True,
+    ) -> FitImagingCI:
+        """
+        Returns the fit of an instance of the model to a dataset, which is either the dataset fitted by this analysis
+        or another dataset, for example the full dataset used for visualization.
+
+        If the fit cache is on and the instance has been fitted to the analysis's dataset recently, the cached
+        post-cti data is used instead of adding CTI via arctic again.
+
+        Parameters
+        ----------
+        instance
+            An instance of the model that is fitted to the data by this analysis (whose parameters have been set
+            via a non-linear search).
+        dataset
+            The charge injection dataset the instance is fitted to.
+        hyper_noise_scale
+            If `True`, the noise-map is scaled by the hyper noise scalars of the instance.
+        """
+        post_cti_data = None
+
+        if self.fit_cache is not None and dataset is self.dataset:
+            cached_fit = self.fit_cache.get(
+                key=fit_cache_key_from(
+                    instance=instance, hyper_noise_scale=hyper_noise_scale
+                )
+            )
+
+            if cached_fit is not None:
+                post_cti_data = cached_fit[0]
+
+        return self._fit_via_instance_and_dataset_from(
+            instance=instance,
+            dataset=dataset,
+            hyper_noise_scale=hyper_noise_scale,
+            post_cti_data=post_cti_data,
+        )
+
+    def _fit_via_instance_and_dataset_from(
+        self,
+        instance: af.ModelInstance,
+        dataset: ImagingCI,
+        hyper_noise_scale: bool = True,
+        post_cti_data: Optional[aa.Array2D] = None,
     ) -> FitImagingCI:
         hyper_noise_scalar_dict = None
 
         if hyper_noise_scale and hasattr(instance, "hyper_noise"):
             hyper_noise_scalar_dict = instance.hyper_noise.as_dict
 
-        post_cti_data = self.clocker.add_cti(
-            data=dataset.pre_cti_data,
-            cti=instance.cti,
-            preloads=self.preloads,
-        )
+        if post_cti_data is None:
+            post_cti_data = self.clocker.add_cti(
+                data=dataset.pre_cti_data,
+                cti=instance.cti,
+                preloads=self.preloads,
+            )
 
         return FitImagingCI(
             dataset=dataset,
             post_cti_data=post_cti_data,
             hyper_noise_scalar_dict=hyper_noise_scalar_dict,
-            preloads=self.preloads,
+            preloads=self.preloads if dataset is self.dataset else Preloads(),
         )
 
     def fit_via_instance_from(
@@ -0,0 +1,141 @@
+from typing import Optional, Tuple
+
+import autofit as af
+
+from autocti.charge_injection.model.analysis import AnalysisImagingCI
+from autocti.dataset_1d.dataset_1d.dataset_1d import Dataset1D
+from autocti.dataset_1d.fit import FitDataset1D
+from autocti.dataset_1d.model.analysis import AnalysisDataset1D
+from autocti.model.model_util import CTI1D
+from autocti.model.model_util import CTI2D
+from autocti.model.settings import SettingsCTI1D
+
+from autocti import exc
+
+
+def cti_1d_parallel_from(cti: CTI2D) -> CTI1D:
+    """
+    Returns the `CTI1D` of the parallel traps and ccd of a `CTI2D`, which is used to clock a single column in the
+    same way as parallel clocking.
+    """
+    return CTI1D(trap_list=cti.parallel_trap_list, ccd=cti.parallel_ccd)
+
+
+class AnalysisImagingCIBinned(AnalysisDataset1D):
+    def __init__(
+        self,
+        analysis: AnalysisImagingCI,
+        columns: Optional[Tuple[int, int]] = None,
+    ):
+        """
+        Fits a parallel-only CTI model to a charge injection imaging dataset binned into a 1D dataset, which gives a
+        fast approximation of the likelihood of the full 2D analysis for the early phases of a model-fit.
+
+        The parallel calibration columns of the dataset of the input `AnalysisImagingCI` are binned into one column
+        (see `Extract2DParallelCalibration.dataset_1d_from`), which is clocked via a `Clocker1D` with the parallel
+        settings of the analysis's clocker. For a uniform charge injection every column has the same post-cti data,
+        so a fit to the binned dataset constrains the parallel CTI model almost as well as the full dataset, but
+        clocks one column instead of every column.
+
+        The same model (composed via a `CTI2D`) is fitted by this analysis and the full analysis, such that the
+        posterior of this analysis can be passed to the full analysis via `fit_coarse_to_fine`.
+
+        Parameters
+        ----------
+        analysis
+            The full analysis of the charge injection imaging dataset, which is binned by this analysis.
+        columns
+            The columns of the charge injection regions which are binned, relative to the left column of the first
+            charge injection region. If not input, every column of the first charge injection region is binned.
+        """
+        dataset = analysis.dataset
+
+        if columns is None:
+            columns = (0, dataset.layout.region_list[0].total_columns)
+
+        settings_cti = SettingsCTI1D(
+            total_density_range=analysis.settings_cti.parallel_total_density_range
+        )
+
+        super().__init__(
+            dataset=dataset.layout.extract.parallel_calibration.dataset_1d_from(
+                dataset=dataset, columns=columns
+            ),
+            clocker=analysis.clocker.parallel_clocker_1d_from(),
+            settings_cti=settings_cti,
+        )
+
+        self.analysis_full = analysis
+        self.columns = columns
+
+    def modify_before_fit(self, paths: af.DirectoryPaths, model: af.Collection):
+        """
+        Checks the model is a parallel-only CTI model, which is all the binned dataset can constrain, before the
+        non-linear search begins.
+        """
+        if (
+            model.cti.serial_trap_list is not None
+            or model.cti.serial_ccd is not None
+            or model.cti.pixel_bounce_list is not None
+        ):
+            raise exc.FittingException(
+                "The binned charge injection analysis can only fit a parallel-only CTI model."
+            )
+
+        return super().modify_before_fit(paths=paths, model=model)
+
+    def log_likelihood_function(self, instance: af.ModelInstance) -> float:
+        """
+        Determine the fitness of a particular model
+
+        Parameters
+        ----------
+        instance
+
+        Returns
+        -------
+        fit: Fit
+            How fit the model is and the model
+        """
+        self.settings_cti.check_total_density_within_range(
+            traps=instance.cti.parallel_trap_list
+        )
+
+        fit = self.fit_via_instance_from(instance=instance)
+
+        return fit.log_likelihood
+
+    def fit_via_instance_and_dataset_from(
+        self, instance: af.ModelInstance, dataset: Dataset1D
+    ) -> FitDataset1D:
+        post_cti_data = self.clocker.add_cti(
+            data=dataset.pre_cti_data, cti=cti_1d_parallel_from(cti=instance.cti)
+        )
+
+        return FitDataset1D(dataset=dataset, post_cti_data=post_cti_data)
+
+    def fit_coarse_to_fine(
+        self,
+        model: af.Collection,
+        search_coarse: af.NonLinearSearch,
+        search_fine: af.NonLinearSearch,
+    ):
+        """
+        Fit the model to the binned dataset with a coarse non-linear search and pass its posterior as the priors of a
+        fit of the full analysis with a fine non-linear search, returning the result of the full analysis.
+
+        The early phases of a model-fit (e.g. the burn-in of a sampler) therefore use the fast likelihood of the
+        binned dataset and only the final phase fits the full 2D dataset.
+
+        Parameters
+        ----------
+        model
+            The parallel-only CTI model fitted by both analyses.
+        search_coarse
+            The non-linear search which fits the binned dataset.
+        search_fine
+            The non-linear search which fits the full dataset, with priors set via the posterior of the coarse fit.
+        """
+        result_coarse = search_coarse.fit(model=model, analysis=self)
+
+        return search_fine.fit(model=result_coarse.model, analysis=self.analysis_full)
@@ -1,8 +1,57 @@
+import copy
+import inspect
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+from arcticpy import add_cti
+from arcticpy import remove_cti
+
 from arcticpy import CCD
 from arcticpy import CCDPhase
 
 from autoconf.dictable import from_json, output_to_json
 
+ARCTIC_INPUT_CACHE_SIZE = 128
+
+_arctic_input_cache = OrderedDict()
+
+
+def arctic_unsupported_kwargs_from(func: Callable) -> Tuple[str, ...]:
+    """
+    Returns the optional keyword arguments of the arctic clocking functions which were added in later versions of
+    arctic (`allow_negative_pixels` and `pixel_bounce_list`) and are not supported by the input function of the
+    installed arctic version.
+
+    Parameters
+    ----------
+    func
+        The arctic `add_cti` or `remove_cti` function whose signature is inspected.
+    """
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return ()
+
+    if any(
+        parameter.kind == inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters.values()
+    ):
+        return ()
+
+    return tuple(
+        key
+        for key in ("allow_negative_pixels", "pixel_bounce_list")
+        if key not in parameters
+    )
+
+
+def arctic_key_from(obj) -> Tuple:
+    """
+    Returns a hashable key which is identical for every arctic model object (e.g. a trap or `CCDPhase`) of the same
+    type and parameters.
+    """
+    return type(obj), tuple(sorted(vars(obj).items()))
+
 
 class AbstractClocker:
     def __init__(self, iterations: int = 1, verbosity: int = 0):
@@ -20,6 +69,108 @@ class AbstractClocker:
         self.iterations = iterations
         self.verbosity = verbosity
 
+        self._add_cti_unsupported_kwargs = arctic_unsupported_kwargs_from(func=add_cti)
+        self._remove_cti_unsupported_kwargs = arctic_unsupported_kwargs_from(
+            func=remove_cti
+        )
+
+    def _arctic_kwargs_from(self, kwargs: dict, unsupported_kwargs) -> dict:
+        """
+        Remove the keyword arguments which the installed arctic version does not support from the input keyword
+        arguments of an arctic call.
+
+        A `pixel_bounce_list` is only removed if it is `None`, so that using pixel bounce with a version of arctic
+        which does not support it raises an error.
+        """
+        return {
+            key: value
+            for key, value in kwargs.items()
+            if key not in unsupported_kwargs
+            or (key == "pixel_bounce_list" and value is not None)
+        }
+
+    def add_cti_dict_from(self, clock_dict: dict) -> dict:
+        """
+        Returns the input keyword arguments of an arctic `add_cti` call with every argument which the installed arctic
+        version does not support removed, for example before they are passed to worker processes.
+        """
+        return self._arctic_kwargs_from(
+            kwargs=clock_dict, unsupported_kwargs=self._add_cti_unsupported_kwargs
+        )
+
+    def arctic_add_cti(self, **kwargs):
+        """
+        Add CTI to an image via arctic's `add_cti` function, passing it only the keyword arguments supported by the
+        installed arctic version, which is determined once when the clocker is created.
+        """
+        return add_cti(**self.add_cti_dict_from(clock_dict=kwargs))
+
+    def arctic_remove_cti(self, **kwargs):
+        """
+        Remove CTI from an image via arctic's `remove_cti` function, passing it only the keyword arguments supported
+        by the installed arctic version, which is determined once when the clocker is created.
+        """
+        return remove_cti(
+            **self._arctic_kwargs_from(
+                kwargs=kwargs, unsupported_kwargs=self._remove_cti_unsupported_kwargs
+            )
+        )
+
+    def traps_ccd_from(
+        self, trap_list: Optional[List], ccd_phase: Optional[CCDPhase]
+    ) -> Tuple[Optional[List], Optional[CCD]]:
+        """
+        Returns the list of traps and the `CCD` object which are passed to arctic, for the input traps and ccd phase
+        of a CTI model.
+
+        During a model-fit the same traps and ccd phase are passed to arctic many times (e.g. for every dataset
+        and for every likelihood evaluation of a sampler which revisits a point in parameter space). The arctic inputs
+        are therefore stored in a least-recently-used cache of `ARCTIC_INPUT_CACHE_SIZE` entries, keyed on the types
+        and parameters of the traps and ccd phase, and reused if they are requested again.
+
+        The key is a snapshot of the parameters when the inputs are requested, and the cached inputs are built from
+        copies of the traps and ccd phase. Changing an input trap or ccd phase in-place after it is cached therefore
+        does not change the cached inputs, and the cache does not keep the objects of the CTI model alive.
+
+        The returned objects are shared by every call which uses the same parameters and must not be modified.
+
+        Parameters
+        ----------
+        trap_list
+            The traps of the CTI model, which are passed to arctic as a list.
+        ccd_phase
+            The ccd phase describing the volume-filling behaviour of the CCD.
+        """
+        try:
+            key = (
+                (
+                    None
+                    if trap_list is None
+                    else tuple(arctic_key_from(obj=trap) for trap in trap_list)
+                ),
+                None if ccd_phase is None else arctic_key_from(obj=ccd_phase),
+            )
+            hash(key)
+        except TypeError:
+            key = None
+
+        if key is not None and key in _arctic_input_cache:
+            _arctic_input_cache.move_to_end(key)
+            return _arctic_input_cache[key]
+
+        arctic_inputs = (
+            None if trap_list is None else [copy.copy(trap) for trap in trap_list],
+            self.ccd_from(ccd_phase=copy.copy(ccd_phase)),
+        )
+
+        if key is not None:
+            _arctic_input_cache[key] = arctic_inputs
+
+            if len(_arctic_input_cache) > ARCTIC_INPUT_CACHE_SIZE:
+                _arctic_input_cache.popitem(last=False)
+
+        return arctic_inputs
+
     def ccd_from(self, ccd_phase: CCDPhase) -> CCD:
         """
         Returns a `CCD` object from a `CCDPhase` object.
@@ -0,0 +1,223 @@
+import numpy as np
+from typing import List, Tuple
+
+
+def quantized_stripes_from(
+    data: np.ndarray, for_parallel: bool, decimals: int = 8
+) -> np.ndarray:
+    """
+    Returns the stripes (columns for parallel clocking, rows for serial clocking) of a 2D array as the rows of a
+    contiguous array, with every value rounded to `decimals` decimal places so that stripes which only differ by
+    floating point round-off compare as identical.
+
+    Parameters
+    ----------
+    data
+        The 2D array whose stripes are returned.
+    for_parallel
+        If `True` the columns of the array are returned (parallel clocking), else its rows are (serial clocking).
+    decimals
+        The number of decimal places values are rounded to.
+    """
+    stripes = np.asarray(data, dtype="float")
+
+    if for_parallel:
+        stripes = stripes.T
+
+    # Adding 0.0 maps -0.0 to 0.0, which would otherwise hash to a different byte pattern.
+    return np.ascontiguousarray(np.round(stripes, decimals=decimals) + 0.0)
+
+
+def unique_stripes_from(
+    data: np.ndarray, for_parallel: bool, decimals: int = 8
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group every stripe (column for parallel clocking, row for serial clocking) of a 2D array with all other stripes
+    whose values are identical, in a single vectorized pass.
+
+    The stripes are quantized to `decimals` decimal places (so stripes which differ by floating point round-off are
+    grouped together) and the bytes of every quantized stripe are hashed into a dictionary, which scales as O(N) in
+    the number of stripes as opposed to the O(N^2) pairwise comparison of every stripe with every other stripe.
+
+    Groups are ordered by the index of the first stripe they contain, such that group 0 corresponds to the stripe at
+    index 0, group 1 to the first stripe which differs from it, and so on.
+
+    Parameters
+    ----------
+    data
+        The 2D array whose stripes are grouped.
+    for_parallel
+        If `True` the columns of the array are grouped (parallel clocking), else its rows are (serial clocking).
+    decimals
+        The number of decimal places values are rounded to before stripes are compared.
+
+    Returns
+    -------
+    The index of the first stripe in every group and an array which maps every stripe of the input array to the
+    group it belongs to.
+    """
+    stripes = quantized_stripes_from(
+        data=data, for_parallel=for_parallel, decimals=decimals
+    )
+
+    group_dict = {}
+
+    inverse = np.array(
+        [
+            group_dict.setdefault(stripe.tobytes(), len(group_dict))
+            for stripe in stripes
+        ],
+        dtype="int",
+    )
+
+    _, first_index = np.unique(inverse, return_index=True)
+
+    return first_index, inverse
+
+
+def fast_stripe_lists_from(inverse: np.ndarray) -> List[List[int]]:
+    """
+    Convert the stripe-to-group mapping returned by `unique_stripes_from` into a list of lists, where each inner list
+    contains the indexes of every stripe in that group in ascending order.
+
+    Parameters
+    ----------
+    inverse
+        An array mapping every stripe of an array to the group of identical stripes it belongs to.
+    """
+    order = np.argsort(inverse, kind="stable")
+
+    counts = np.bincount(inverse)
+
+    return [
+        stripe_list.tolist() for stripe_list in np.split(order, np.cumsum(counts)[:-1])
+    ]
+
+
+def inverse_indexes_from(fast_stripe_lists: List[List[int]]) -> np.ndarray:
+    """
+    Convert a list of lists of identical stripes (e.g. the `fast_column_lists` of a `Clocker2D`) into a flat integer
+    array which maps every stripe to the index of the group it belongs to.
+
+    This is the inverse of `fast_stripe_lists_from` and is used to map the output of arctic on the unique stripes
+    back to the full image via a single fancy-indexing operation.
+
+    Parameters
+    ----------
+    fast_stripe_lists
+        A list where each entry lists the indexes of every stripe in that group.
+    """
+    total_stripes = sum(len(fast_stripe_list) for fast_stripe_list in fast_stripe_lists)
+
+    inverse = np.zeros(total_stripes, dtype="int")
+
+    for group_index, fast_stripe_list in enumerate(fast_stripe_lists):
+        inverse[fast_stripe_list] = group_index
+
+    return inverse
+
+
+def stripes_match_groups(
+    data: np.ndarray,
+    for_parallel: bool,
+    first_index: np.ndarray,
+    inverse: np.ndarray,
+    decimals: int = 8,
+) -> bool:
+    """
+    Returns whether a grouping of stripes computed previously (e.g. via `unique_stripes_from` on a different array)
+    is still valid for the input array, meaning every stripe is identical to the first stripe of the group it is
+    mapped to.
+
+    This is checked in a single vectorized comparison and allows a grouping to be reused across arrays whose
+    stripes are expected to group in the same way (e.g. the same image clocked with different CTI models). If the
+    check passes, using the grouping is exact; stripes which have become identical but are in different groups are
+    clocked separately, which is slower but still correct.
+
+    Parameters
+    ----------
+    data
+        The 2D array whose stripes are checked.
+    for_parallel
+        If `True` the columns of the array are checked (parallel clocking), else its rows are (serial clocking).
+    first_index
+        The index of the first stripe in every group.
+    inverse
+        An array which maps every stripe to the group it belongs to.
+    decimals
+        The number of decimal places values are rounded to before stripes are compared.
+    """
+    stripes = quantized_stripes_from(
+        data=data, for_parallel=for_parallel, decimals=decimals
+    )
+
+    if inverse.shape[0] != stripes.shape[0]:
+        return False
+
+    if np.max(first_index) >= stripes.shape[0]:
+        return False
+
+    return np.array_equal(stripes, np.take(stripes[first_index], inverse, axis=0))
+
+
+def trap_column_groups_from(trap_column_list: List[List]) -> List[List[int]]:
+    """
+    Group every column with all other columns whose list of traps have identical densities, for example the Poisson
+    drawn traps of every column used by `Clocker2D.add_cti_poisson_traps`.
+
+    Traps are drawn as an integer number of traps per column, therefore for typical densities many columns draw the
+    same traps and can be clocked in a single arctic call. Groups are ordered by the index of the first column they
+    contain.
+
+    Parameters
+    ----------
+    trap_column_list
+        A list containing the list of traps of every column, where the traps of every column are in the same order
+        and have the same release timescales.
+
+    Returns
+    -------
+    A list where each entry lists the indexes of every column in that group in ascending order.
+    """
+    group_dict = {}
+
+    for column, trap_list in enumerate(trap_column_list):
+        group_dict.setdefault(tuple(trap.density for trap in trap_list), []).append(
+            column
+        )
+
+    return list(group_dict.values())
+
+
+def active_stripe_indexes_from(
+    data: np.ndarray, for_parallel: bool, window_start: int = 0, window_stop: int = -1
+) -> np.ndarray:
+    """
+    Returns the indexes of every column (parallel clocking) or row (serial clocking) of an array which holds charge
+    (has a non-zero value) and is within the window of stripes that arctic clocks.
+
+    When the `ROE` empties the traps between columns, every stripe is clocked independently and a stripe with no
+    charge is not changed by clocking, as there are no electrons to capture and the traps are empty. Only the
+    stripes returned by this function therefore need to be clocked, and every other stripe of the post-cti array is
+    identical to the input array.
+
+    Parameters
+    ----------
+    data
+        The 2D array whose active stripes are found.
+    for_parallel
+        If `True` the columns of the array are returned (parallel clocking), else its rows are (serial clocking).
+    window_start
+        The first stripe which is clocked (e.g. the `serial_window_start` for parallel clocking).
+    window_stop
+        The stripe after the last stripe which is clocked, or -1 for the last stripe of the array.
+    """
+    active = np.any(data != 0.0, axis=0 if for_parallel else 1)
+
+    if window_stop == -1:
+        window_stop = active.shape[0]
+
+    active[:window_start] = False
+    active[window_stop:] = False
+
+    return np.flatnonzero(active)
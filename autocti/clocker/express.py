@@ -0,0 +1,316 @@
+import copy
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Union
+
+import autoarray as aa
+
+from autocti.clocker.one_d import Clocker1D
+from autocti.clocker.two_d import Clocker2D
+from autocti.model.model_util import CTI1D
+from autocti.model.model_util import CTI2D
+
+
+class ExpressTrial:
+    def __init__(
+        self,
+        express: int,
+        time: float,
+        max_residual: float,
+        log_likelihood_error: float,
+    ):
+        """
+        The result of adding CTI with one express value during an `ExpressCalibration`.
+
+        Parameters
+        ----------
+        express
+            The express value CTI was added with.
+        time
+            The wall time in seconds taken to add CTI with this express value.
+        max_residual
+            The maximum absolute difference between the post-cti data and the reference post-cti data, which is
+            computed with an express of 0.
+        log_likelihood_error
+            The absolute change in log likelihood of a fit to the reference post-cti data caused by this express
+            value, which is half the chi-squared of the post-cti data fitted to the reference post-cti data.
+        """
+        self.express = express
+        self.time = time
+        self.max_residual = max_residual
+        self.log_likelihood_error = log_likelihood_error
+
+    def __repr__(self):
+        return (
+            f"ExpressTrial(express={self.express}, time={self.time:.4g}, "
+            f"max_residual={self.max_residual:.4g}, "
+            f"log_likelihood_error={self.log_likelihood_error:.4g})"
+        )
+
+
+class ExpressCalibration:
+    def __init__(
+        self,
+        clocker: Union[Clocker1D, Clocker2D],
+        data: Union[aa.Array1D, aa.Array2D],
+        cti: Union[CTI1D, CTI2D],
+        noise_map: Optional[Union[aa.Array1D, aa.Array2D]] = None,
+        tolerance: float = 0.1,
+        express_list: Tuple[int, ...] = (1, 2, 4, 8, 16, 32),
+        repeats: int = 1,
+    ):
+        """
+        Calibrates the express values of a clocker, by measuring the speed and accuracy of adding CTI to a
+        representative dataset with a representative CTI model for every express value in a list.
+
+        Lower express values combine more pixel-to-pixel transfers into single transfers and are therefore faster,
+        but less accurate. The reference post-cti data is computed with an express of 0 (every transfer is modeled)
+        and every express value is compared to it. The express value chosen is the lowest one whose log likelihood
+        error (half the chi-squared of its post-cti data fitted to the reference post-cti data) is below the
+        `tolerance`, or 0 if no value is accurate enough. The choice therefore does not depend on wall times, which
+        are noisy and only recorded in the trials for inspection.
+
+        For a `Clocker2D` the parallel and serial express values are first calibrated separately, with the other
+        direction clocked at the reference express of 0. The errors of the two directions add up, therefore the
+        combined express values are then compared to the reference, and whilst their log likelihood error is above
+        the `tolerance` the express of the direction with the larger error is stepped up to its next more accurate
+        value.
+
+        Parameters
+        ----------
+        clocker
+            The clocker whose express values are calibrated. It is not modified, and a copy with the calibrated
+            express values is returned by `clocker_from`.
+        data
+            The representative pre-cti data which CTI is added to (e.g. the `pre_cti_data` of a charge injection
+            dataset).
+        cti
+            The representative CTI model added to the data (e.g. the maximum likelihood model of a previous fit).
+        noise_map
+            The noise-map of the dataset, which the residuals are divided by to compute the log likelihood error. If
+            not input, a noise of 1.0 is used in every pixel.
+        tolerance
+            The maximum log likelihood error an express value may cause to be chosen.
+        express_list
+            The express values which are calibrated, in addition to the reference express of 0.
+        repeats
+            The number of times CTI is added for every express value, with the fastest wall time stored in its trial.
+        """
+        self.clocker = clocker
+        self.data = data
+        self.cti = cti
+        self.noise_map = noise_map
+        self.tolerance = tolerance
+        self.express_list = express_list
+        self.repeats = repeats
+
+        self._trial_dict = {}
+        self._reference = None
+
+    @property
+    def express_key_list(self) -> List[str]:
+        """
+        The names of the express attributes of the clocker which are calibrated, omitting a clocking direction of a
+        `Clocker2D` if the CTI model has no traps in that direction.
+        """
+        if isinstance(self.clocker, Clocker1D):
+            return ["express"]
+
+        express_key_list = []
+
+        if self.cti.parallel_trap_list is not None:
+            express_key_list.append("parallel_express")
+
+        if self.cti.serial_trap_list is not None:
+            express_key_list.append("serial_express")
+
+        return express_key_list
+
+    def clocker_with_express_from(self, express_dict: Dict[str, int]):
+        """
+        Returns a copy of the clocker with its express attributes set to the values of the input dictionary.
+        """
+        clocker = copy.deepcopy(self.clocker)
+
+        for express_key, express in express_dict.items():
+            setattr(clocker, express_key, express)
+
+        return clocker
+
+    def _post_cti_data_time_from(self, express_dict: Dict[str, int]):
+        """
+        Returns the post-cti data of the clocker with the input express values and the fastest wall time of adding
+        CTI over `repeats` calls.
+        """
+        clocker = self.clocker_with_express_from(express_dict=express_dict)
+
+        time_list = []
+
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            post_cti_data = clocker.add_cti(data=self.data, cti=self.cti)
+            time_list.append(time.perf_counter() - start)
+
+        return np.asarray(post_cti_data.native), min(time_list)
+
+    @property
+    def express_ladder(self) -> List[int]:
+        """
+        The express values which are calibrated ordered from the least to the most accurate, which ends with the
+        reference express of 0.
+        """
+        return sorted(express for express in self.express_list if express != 0) + [0]
+
+    def _reference_data_time_from(self) -> Tuple[np.ndarray, float]:
+        """
+        Returns the post-cti data and wall time of the clocker with every express attribute set to the reference
+        express of 0, which are computed once and reused by every trial.
+        """
+        if self._reference is None:
+            self._reference = self._post_cti_data_time_from(
+                express_dict={key: 0 for key in self.express_key_list}
+            )
+
+        return self._reference
+
+    def _residual_map_from(self, express_dict: Dict[str, int]):
+        """
+        Returns the residuals of the post-cti data of the clocker with the input express values compared to the
+        reference post-cti data and the wall time of adding CTI, where every express attribute which is not input
+        is set to the reference express of 0.
+        """
+        reference_data, _ = self._reference_data_time_from()
+
+        post_cti_data, express_time = self._post_cti_data_time_from(
+            express_dict={**{key: 0 for key in self.express_key_list}, **express_dict}
+        )
+
+        return post_cti_data - reference_data, express_time
+
+    def log_likelihood_error_from(self, residual_map: np.ndarray) -> float:
+        """
+        Returns the log likelihood error caused by residuals compared to the reference post-cti data, which is half
+        their chi-squared.
+        """
+        if self.noise_map is None:
+            noise_map = 1.0
+        else:
+            noise_map = np.asarray(self.noise_map.native)
+
+        return 0.5 * float(np.sum(np.square(residual_map / noise_map)))
+
+    def trial_list_from(self, express_key: str) -> List[ExpressTrial]:
+        """
+        Returns the trial of every express value of the input express attribute (e.g. `parallel_express`), where
+        every other express attribute is set to the reference express of 0.
+
+        The first trial is the reference express of 0, which has a log likelihood error of zero by definition.
+        """
+        if express_key in self._trial_dict:
+            return self._trial_dict[express_key]
+
+        _, reference_time = self._reference_data_time_from()
+
+        trial_list = [
+            ExpressTrial(
+                express=0,
+                time=reference_time,
+                max_residual=0.0,
+                log_likelihood_error=0.0,
+            )
+        ]
+
+        for express in self.express_list:
+            residual_map, express_time = self._residual_map_from(
+                express_dict={express_key: express}
+            )
+
+            trial_list.append(
+                ExpressTrial(
+                    express=express,
+                    time=express_time,
+                    max_residual=float(np.max(np.abs(residual_map))),
+                    log_likelihood_error=self.log_likelihood_error_from(
+                        residual_map=residual_map
+                    ),
+                )
+            )
+
+        self._trial_dict[express_key] = trial_list
+
+        return trial_list
+
+    def _log_likelihood_error_via_trial_from(self, express_key: str, express: int):
+        """
+        Returns the log likelihood error of the trial of the input express attribute and value.
+        """
+        for trial in self.trial_list_from(express_key=express_key):
+            if trial.express == express:
+                return trial.log_likelihood_error
+
+    def express_from(self, express_key: str) -> int:
+        """
+        Returns the lowest express value of the input express attribute whose log likelihood error is below the
+        `tolerance` when every other express attribute is 0, which is the reference express of 0 if no other value
+        is accurate enough.
+        """
+        for express in self.express_ladder:
+            if (
+                self._log_likelihood_error_via_trial_from(
+                    express_key=express_key, express=express
+                )
+                <= self.tolerance
+            ):
+                return express
+
+    @property
+    def express_dict(self) -> Dict[str, int]:
+        """
+        The calibrated value of every express attribute of the clocker.
+
+        Every attribute starts at the value calibrated separately by `express_from`. If there is more than one
+        attribute, the post-cti data of their combined values is compared to the reference and, whilst its log
+        likelihood error is above the `tolerance`, the attribute with the larger separate log likelihood error is
+        stepped up to its next value of the `express_ladder`. This ends at the latest when every attribute is the
+        reference express of 0.
+        """
+        express_dict = {
+            express_key: self.express_from(express_key=express_key)
+            for express_key in self.express_key_list
+        }
+
+        if len(express_dict) < 2:
+            return express_dict
+
+        express_ladder = self.express_ladder
+
+        while True:
+            step_key_list = [key for key, value in express_dict.items() if value != 0]
+
+            if not step_key_list:
+                return express_dict
+
+            residual_map, _ = self._residual_map_from(express_dict=express_dict)
+
+            if (
+                self.log_likelihood_error_from(residual_map=residual_map)
+                <= self.tolerance
+            ):
+                return express_dict
+
+            step_key = max(
+                step_key_list,
+                key=lambda key: self._log_likelihood_error_via_trial_from(
+                    express_key=key, express=express_dict[key]
+                ),
+            )
+
+            express_dict[step_key] = express_ladder[
+                express_ladder.index(express_dict[step_key]) + 1
+            ]
+
+    def clocker_from(self) -> Union[Clocker1D, Clocker2D]:
+        """
+        Returns a copy of the clocker with its express attributes set to their calibrated values.
+        """
+        return self.clocker_with_express_from(express_dict=self.express_dict)
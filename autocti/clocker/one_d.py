@@ -1,8 +1,5 @@
 from typing import List, Optional
 
-from arcticpy import add_cti
-from arcticpy import remove_cti
-
 from arcticpy import ROE
 from arcticpy import PixelBounce
 
@@ -69,14 +66,9 @@ class Clocker1D(AbstractClocker):
 
     def _traps_ccd_from(self, cti: CTI1D):
         """
-        Unpack the `CTI1D` object to retries its traps and ccd.
+        Unpack the `CTI1D` object to retrieve the traps and ccd which are passed to arctic.
         """
-        if cti.trap_list is not None:
-            trap_list = list(cti.trap_list)
-        else:
-            trap_list = None
-
-        return trap_list, cti.ccd
+        return self.traps_ccd_from(trap_list=cti.trap_list, ccd_phase=cti.ccd)
 
     def add_cti(
         self,
@@ -107,41 +99,22 @@ class Clocker1D(AbstractClocker):
 
         image_pre_cti_2d[:, 0] = data
 
-        ccd = self.ccd_from(ccd_phase=ccd)
-
-        try:
-            image_post_cti = add_cti(
-                image=image_pre_cti_2d,
-                parallel_ccd=ccd,
-                parallel_roe=self.roe,
-                parallel_traps=trap_list,
-                parallel_express=self.express,
-                parallel_window_offset=data.readout_offsets[0],
-                parallel_window_start=self.window_start,
-                parallel_window_stop=self.window_stop,
-                parallel_time_start=self.time_start,
-                parallel_time_stop=self.time_stop,
-                parallel_prune_n_electrons=self.prune_n_electrons,
-                parallel_prune_frequency=self.prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                verbosity=self.verbosity,
-            )
-        except TypeError:
-            image_post_cti = add_cti(
-                image=image_pre_cti_2d,
-                parallel_ccd=ccd,
-                parallel_roe=self.roe,
-                parallel_traps=trap_list,
-                parallel_express=self.express,
-                parallel_window_offset=data.readout_offsets[0],
-                parallel_window_start=self.window_start,
-                parallel_window_stop=self.window_stop,
-                parallel_time_start=self.time_start,
-                parallel_time_stop=self.time_stop,
-                parallel_prune_n_electrons=self.prune_n_electrons,
-                parallel_prune_frequency=self.prune_frequency,
-                verbosity=self.verbosity,
-            )
+        image_post_cti = self.arctic_add_cti(
+            image=image_pre_cti_2d,
+            parallel_ccd=ccd,
+            parallel_roe=self.roe,
+            parallel_traps=trap_list,
+            parallel_express=self.express,
+            parallel_window_offset=data.readout_offsets[0],
+            parallel_window_start=self.window_start,
+            parallel_window_stop=self.window_stop,
+            parallel_time_start=self.time_start,
+            parallel_time_stop=self.time_stop,
+            parallel_prune_n_electrons=self.prune_n_electrons,
+            parallel_prune_frequency=self.prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            verbosity=self.verbosity,
+        )
 
         return aa.Array1D.no_mask(
             values=image_post_cti.flatten(), pixel_scales=data.pixel_scales
@@ -176,43 +149,23 @@ class Clocker1D(AbstractClocker):
 
         image_pre_cti_2d[:, 0] = data
 
-        ccd = self.ccd_from(ccd_phase=ccd)
-
-        try:
-            image_post_cti = remove_cti(
-                image=image_pre_cti_2d,
-                n_iterations=self.iterations,
-                parallel_ccd=ccd,
-                parallel_roe=self.roe,
-                parallel_traps=trap_list,
-                parallel_express=self.express,
-                parallel_window_offset=data.readout_offsets[0],
-                parallel_window_start=self.window_start,
-                parallel_window_stop=self.window_stop,
-                parallel_time_start=self.time_start,
-                parallel_time_stop=self.time_stop,
-                parallel_prune_n_electrons=self.prune_n_electrons,
-                parallel_prune_frequency=self.prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                verbosity=self.verbosity,
-            )
-        except TypeError:
-            image_post_cti = remove_cti(
-                image=image_pre_cti_2d,
-                n_iterations=self.iterations,
-                parallel_ccd=ccd,
-                parallel_roe=self.roe,
-                parallel_traps=trap_list,
-                parallel_express=self.express,
-                parallel_window_offset=data.readout_offsets[0],
-                parallel_window_start=self.window_start,
-                parallel_window_stop=self.window_stop,
-                parallel_time_start=self.time_start,
-                parallel_time_stop=self.time_stop,
-                parallel_prune_n_electrons=self.prune_n_electrons,
-                parallel_prune_frequency=self.prune_frequency,
-                verbosity=self.verbosity,
-            )
+        image_post_cti = self.arctic_remove_cti(
+            image=image_pre_cti_2d,
+            n_iterations=self.iterations,
+            parallel_ccd=ccd,
+            parallel_roe=self.roe,
+            parallel_traps=trap_list,
+            parallel_express=self.express,
+            parallel_window_offset=data.readout_offsets[0],
+            parallel_window_start=self.window_start,
+            parallel_window_stop=self.window_stop,
+            parallel_time_start=self.time_start,
+            parallel_time_stop=self.time_stop,
+            parallel_prune_n_electrons=self.prune_n_electrons,
+            parallel_prune_frequency=self.prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            verbosity=self.verbosity,
+        )
 
         return aa.Array1D.no_mask(
             values=image_post_cti.flatten(), pixel_scales=data.pixel_scales
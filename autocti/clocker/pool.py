@@ -0,0 +1,339 @@
+import numpy as np
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Tuple
+
+from arcticpy import add_cti
+
+_shared_memory_dict = {}
+
+
+def _shared_array_from(name: str, shape: Tuple[int, int], role: str) -> np.ndarray:
+    """
+    Returns a 2D ndarray of doubles backed by the shared memory block of the input name, which a worker process
+    attaches to once and then reuses for every block it clocks.
+
+    A worker keeps one attachment per `role` (the input or output image). When the pool replaces a block (e.g. for
+    an image of a new shape) the worker closes its attachment to the old block, which the pool has unlinked, such
+    that long-lived workers do not keep a mapping of every block they have seen.
+    """
+    shared_memory = _shared_memory_dict.get(role)
+
+    if shared_memory is None or shared_memory.name != name:
+        if shared_memory is not None:
+            shared_memory.close()
+
+        shared_memory = SharedMemory(name=name)
+        _shared_memory_dict[role] = shared_memory
+
+    return np.ndarray(shape, dtype="float", buffer=shared_memory.buf)
+
+
+def window_in_block_from(
+    window_start: int, window_stop: int, block_start: int, block_stop: int
+) -> Tuple[int, int]:
+    """
+    Converts the pixel window of an arctic call (e.g. `serial_window_start` and `serial_window_stop`, which set the
+    columns that are clocked during parallel clocking) to the coordinates of a block of the image, which spans the
+    pixels `block_start` to `block_stop`.
+
+    A `window_stop` of -1 corresponds to the end of the image, following arctic. If the window does not overlap
+    the block, the returned window is empty (its stop is not above its start).
+
+    Parameters
+    ----------
+    window_start
+        The first pixel of the window in the coordinates of the full image.
+    window_stop
+        The pixel after the last pixel of the window in the coordinates of the full image, or -1 for the image end.
+    block_start
+        The first pixel of the block in the coordinates of the full image.
+    block_stop
+        The pixel after the last pixel of the block in the coordinates of the full image.
+    """
+    if window_stop == -1:
+        window_stop = block_stop
+
+    return (
+        max(window_start, block_start) - block_start,
+        min(window_stop, block_stop) - block_start,
+    )
+
+
+def _clock_block(
+    input_name: str,
+    output_name: str,
+    shape: Tuple[int, int],
+    for_parallel: bool,
+    block_start: int,
+    block_stop: int,
+    clock_dict: Dict,
+):
+    """
+    Clocks one block of columns (for parallel clocking) or rows (for serial clocking) of the image stored in shared
+    memory via arctic and writes the result to the same block of the output shared memory.
+
+    This is the function every worker process of a `ClockerPool` runs.
+    """
+    image_in = _shared_array_from(name=input_name, shape=shape, role="input")
+    image_out = _shared_array_from(name=output_name, shape=shape, role="output")
+
+    if for_parallel:
+        block_slice = np.s_[:, block_start:block_stop]
+        window_keys = ("serial_window_start", "serial_window_stop")
+    else:
+        block_slice = np.s_[block_start:block_stop, :]
+        window_keys = ("parallel_window_start", "parallel_window_stop")
+
+    block = np.ascontiguousarray(image_in[block_slice])
+
+    window_start, window_stop = window_in_block_from(
+        window_start=clock_dict.get(window_keys[0], 0),
+        window_stop=clock_dict.get(window_keys[1], -1),
+        block_start=block_start,
+        block_stop=block_stop,
+    )
+
+    if window_stop <= window_start:
+        image_out[block_slice] = block
+        return
+
+    image_out[block_slice] = _add_cti_from(
+        image=block,
+        clock_dict={
+            **clock_dict,
+            window_keys[0]: window_start,
+            window_keys[1]: window_stop,
+        },
+    )
+
+
+def _clock_column_groups(
+    input_name: str,
+    output_name: str,
+    shape: Tuple[int, int],
+    column_group_list: List[Tuple[List[int], Dict]],
+):
+    """
+    Clocks groups of columns of the image stored in shared memory via arctic, where every group is clocked with its
+    own arctic inputs (e.g. Poisson drawn trap densities), and writes the result to the same columns of the output
+    shared memory.
+    """
+    image_in = _shared_array_from(name=input_name, shape=shape, role="input")
+    image_out = _shared_array_from(name=output_name, shape=shape, role="output")
+
+    for column_list, clock_dict in column_group_list:
+        image_out[:, column_list] = _add_cti_from(
+            image=np.take(image_in, column_list, axis=1), clock_dict=clock_dict
+        )
+
+
+def _add_cti_from(image: np.ndarray, clock_dict: Dict) -> np.ndarray:
+    return add_cti(image=image, **clock_dict)
+
+
+def _close(executor_list, shared_memory_list):
+    for executor in executor_list:
+        executor.shutdown(wait=False)
+
+    for shared_memory in shared_memory_list:
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+class ClockerPool:
+    def __init__(self, n_workers: int):
+        """
+        A persistent pool of worker processes which clock an image via arctic in parallel, by splitting it into
+        blocks of columns (for parallel clocking) or rows (for serial clocking) which are each clocked by a
+        different process.
+
+        Parallel clocking is independent for every column and serial clocking independent for every row (provided
+        the `ROE` empties the traps between them), so the stitched output is identical to a single arctic call on
+        the full image.
+
+        The image is passed to and from the worker processes via shared memory, which is allocated once and reused
+        by every call with an image of the same shape, so only the arctic inputs are pickled for each call. The
+        processes and shared memory are created the first time they are needed and released when the pool is
+        closed or garbage collected.
+
+        Parameters
+        ----------
+        n_workers
+            The number of worker processes the image is split over.
+        """
+        self.n_workers = n_workers
+
+        self._executor_list = []
+        self._shared_memory_list = []
+
+        self._finalize = weakref.finalize(
+            self, _close, self._executor_list, self._shared_memory_list
+        )
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if not self._executor_list:
+            self._executor_list.append(ProcessPoolExecutor(max_workers=self.n_workers))
+
+        return self._executor_list[0]
+
+    def shared_memory_for_shape_from(
+        self, shape: Tuple[int, int]
+    ) -> Tuple[SharedMemory, SharedMemory]:
+        """
+        Returns the input and output shared memory blocks used to pass an image of the input shape to and from the
+        worker processes, reusing the existing blocks if they are the correct size.
+        """
+        nbytes = int(np.prod(shape)) * np.dtype("float").itemsize
+
+        if self._shared_memory_list and self._shared_memory_list[0].size == nbytes:
+            return self._shared_memory_list[0], self._shared_memory_list[1]
+
+        _close(executor_list=[], shared_memory_list=self._shared_memory_list)
+        self._shared_memory_list.clear()
+
+        for _ in range(2):
+            self._shared_memory_list.append(SharedMemory(create=True, size=nbytes))
+
+        return self._shared_memory_list[0], self._shared_memory_list[1]
+
+    def _shared_memory_with_image_from(
+        self, image: np.ndarray
+    ) -> Tuple[SharedMemory, SharedMemory]:
+        """
+        Returns the input and output shared memory blocks for the input image, with the image copied to the input.
+        """
+        input_memory, output_memory = self.shared_memory_for_shape_from(
+            shape=image.shape
+        )
+
+        image_in = np.ndarray(image.shape, dtype="float", buffer=input_memory.buf)
+        image_in[:] = image
+
+        return input_memory, output_memory
+
+    def _image_from(self, future_list, output_memory: SharedMemory, shape):
+        """
+        Waits for every block of the image to be clocked and returns a copy of the output image.
+
+        If a block fails (or the wait is interrupted) every block which has not started is cancelled, such that the
+        worker processes are not left clocking an image which is discarded.
+        """
+        try:
+            for future in future_list:
+                future.result()
+        finally:
+            for future in future_list:
+                future.cancel()
+
+        return np.array(np.ndarray(shape, dtype="float", buffer=output_memory.buf))
+
+    def clock_from(
+        self,
+        image: np.ndarray,
+        for_parallel: bool,
+        clock_dict: Dict,
+    ) -> np.ndarray:
+        """
+        Add CTI to an image via arctic by splitting it into blocks of columns (for parallel clocking) or rows (for
+        serial clocking), clocking every block in a different worker process and stitching the result.
+
+        Parameters
+        ----------
+        image
+            The 2D image which is clocked.
+        for_parallel
+            If `True`, the image is split into blocks of columns and must only be clocked in the parallel direction,
+            else it is split into blocks of rows and must only be clocked in the serial direction.
+        clock_dict
+            The keyword arguments passed to arctic's `add_cti` function (e.g. `parallel_traps`, `parallel_ccd`),
+            which must only contain parameters for the direction of clocking and be supported by the installed
+            arctic version (see `AbstractClocker.add_cti_dict_from`).
+        """
+        image = np.asarray(image, dtype="float")
+
+        total_stripes = image.shape[1] if for_parallel else image.shape[0]
+
+        block_edges = np.linspace(
+            0, total_stripes, min(self.n_workers, total_stripes) + 1
+        ).astype("int")
+
+        input_memory, output_memory = self._shared_memory_with_image_from(image=image)
+
+        future_list = [
+            self.executor.submit(
+                _clock_block,
+                input_memory.name,
+                output_memory.name,
+                image.shape,
+                for_parallel,
+                block_start,
+                block_stop,
+                clock_dict,
+            )
+            for block_start, block_stop in zip(block_edges[:-1], block_edges[1:])
+        ]
+
+        return self._image_from(
+            future_list=future_list, output_memory=output_memory, shape=image.shape
+        )
+
+    def clock_column_groups_from(
+        self,
+        image: np.ndarray,
+        column_group_list: List[Tuple[List[int], Dict]],
+    ) -> np.ndarray:
+        """
+        Add parallel CTI to an image via arctic, where groups of columns are each clocked with different arctic
+        inputs (e.g. the Poisson drawn trap densities of `Clocker2D.add_cti_poisson_traps`).
+
+        The groups are distributed over the worker processes such that every process clocks a similar number of
+        columns, and every column of the image must be in one group.
+
+        Parameters
+        ----------
+        image
+            The 2D image which is clocked.
+        column_group_list
+            A list of every group, containing the indexes of its columns and the keyword arguments passed to
+            arctic's `add_cti` function for these columns.
+        """
+        image = np.asarray(image, dtype="float")
+
+        total_workers = min(self.n_workers, len(column_group_list))
+
+        worker_group_lists = [[] for _ in range(total_workers)]
+        worker_columns = np.zeros(total_workers, dtype="int")
+
+        for group_index in np.argsort(
+            [-len(column_list) for column_list, _ in column_group_list], kind="stable"
+        ):
+            worker_index = int(np.argmin(worker_columns))
+
+            worker_group_lists[worker_index].append(column_group_list[group_index])
+            worker_columns[worker_index] += len(column_group_list[group_index][0])
+
+        input_memory, output_memory = self._shared_memory_with_image_from(image=image)
+
+        future_list = [
+            self.executor.submit(
+                _clock_column_groups,
+                input_memory.name,
+                output_memory.name,
+                image.shape,
+                worker_group_list,
+            )
+            for worker_group_list in worker_group_lists
+        ]
+
+        return self._image_from(
+            future_list=future_list, output_memory=output_memory, shape=image.shape
+        )
+
+    def close(self):
+        """
+        Shut down the worker processes and release the shared memory.
+        """
+        self._finalize()
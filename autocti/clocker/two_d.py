@@ -1,16 +1,20 @@
+import copy
 import numpy as np
 from typing import List, Optional
 
-from arcticpy import add_cti
-from arcticpy import remove_cti
-
 from arcticpy import ROE
 
 import autoarray as aa
+from autoarray.structures.header import Header
 
 from autocti.clocker.abstract import AbstractClocker
+from autocti.clocker.one_d import Clocker1D
+from autocti.clocker import clocker_util
+from autocti.clocker.pool import ClockerPool
+from autocti.clocker.pool import window_in_block_from
 from autocti.model.model_util import CTI2D
 from autocti.preloads import Preloads
+from autocti.util import random_util
 
 
 class Clocker2D(AbstractClocker):
@@ -40,7 +44,9 @@ class Clocker2D(AbstractClocker):
         serial_fast_mode: Optional[bool] = None,
         allow_negative_pixels=1,
         verbosity: int = 0,
-        poisson_seed: int = -1,
+        poisson_seed: random_util.RandomState = -1,
+        n_workers: int = 1,
+        active_window_mode: bool = False,
     ):
         """
         Performs clocking of a 2D image via the c++ arctic algorithm.
@@ -92,7 +98,9 @@ class Clocker2D(AbstractClocker):
         serial_fast_mode
             If input, serial CTI is added via arctic efficiently by calling arctic once and mapping the 1D output over
             the full 2D image. This requires every row in the image has the same signal (such that each column gives
-            an identical arctic output).
+            an identical arctic output). If `parallel_fast_mode` is also on, parallel and serial CTI are added in
+            a combined fast mode, where the unique rows of the parallel clocked image are found before serial
+            clocking (see `add_cti_parallel_serial_fast`).
         allow_negative_pixels
             If True, negative electrons in a pixel are allowed and modeled via arCTIc, if Falss they are explicitly
             not allowed.
@@ -100,6 +108,16 @@ class Clocker2D(AbstractClocker):
             Whether to silence print statements and output from the c++ arctic call.
         poisson_seed
             A seed for the random number generator which draws the Poisson trap densities from a Poisson distribution.
+            An integer seeds numpy's global random state (via arctic), whereas a `np.random.Generator` or
+            `np.random.SeedSequence` draws the densities from an independent stream.
+        n_workers
+            If above 1, CTI is added and removed by splitting the image into blocks of columns for parallel clocking
+            and blocks of rows for serial clocking, which are clocked by this many worker processes in parallel (see
+            `add_cti_pool`). The output is identical to clocking the full image in one arctic call.
+        active_window_mode
+            If `True`, only the columns (parallel clocking) and rows (serial clocking) of the image which hold charge
+            are passed to arctic and every other column and row is left unchanged (see `add_cti_active_window`). The
+            output is identical to clocking the full image.
         """
 
         super().__init__(iterations=iterations, verbosity=verbosity)
@@ -131,33 +149,72 @@ class Clocker2D(AbstractClocker):
 
         self.poisson_seed = poisson_seed
 
-    def _parallel_traps_ccd_from(self, cti: CTI2D):
+        self.n_workers = n_workers
+
+        self.active_window_mode = active_window_mode
+
+        self._pool = None
+
+    def __getstate__(self):
         """
-        Unpack the `CTI1D` object to retries its traps and ccd.
+        The worker processes and shared memory of the pool cannot be pickled, so are omitted and created again when
+        the clocker is next used.
         """
-        if cti.parallel_trap_list is not None:
-            trap_list = list(cti.parallel_trap_list)
-        else:
-            trap_list = None
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
 
-        return trap_list, cti.parallel_ccd
+    @property
+    def pool(self) -> ClockerPool:
+        """
+        The pool of `n_workers` worker processes used to clock the image, which is created the first time it is used
+        and persists for every subsequent call.
+        """
+        if self._pool is None:
+            self._pool = ClockerPool(n_workers=self.n_workers)
 
-    def _serial_traps_ccd_from(self, cti: CTI2D):
+        return self._pool
+
+    def parallel_clocker_1d_from(self) -> Clocker1D:
         """
-        Unpack the `CTI1D` object to retries its traps and ccd.
+        Returns a `Clocker1D` which clocks a single column in the same way as parallel clocking by this clocker,
+        for example to fit a parallel CTI model to a binned 1D column of charge injection imaging.
         """
-        if cti.serial_trap_list is not None:
-            trap_list = list(cti.serial_trap_list)
-        else:
-            trap_list = None
+        return Clocker1D(
+            iterations=self.iterations,
+            roe=self.parallel_roe,
+            express=self.parallel_express,
+            window_start=self.parallel_window_start,
+            window_stop=self.parallel_window_stop,
+            time_start=self.parallel_time_start,
+            time_stop=self.parallel_time_stop,
+            prune_n_electrons=self.parallel_prune_n_electrons,
+            prune_frequency=self.parallel_prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            verbosity=self.verbosity,
+        )
+
+    def _parallel_traps_ccd_from(self, cti: CTI2D):
+        """
+        Unpack the `CTI2D` object to retrieve the parallel traps and ccd which are passed to arctic.
+        """
+        return self.traps_ccd_from(
+            trap_list=cti.parallel_trap_list, ccd_phase=cti.parallel_ccd
+        )
 
-        return trap_list, cti.serial_ccd
+    def _serial_traps_ccd_from(self, cti: CTI2D):
+        """
+        Unpack the `CTI2D` object to retrieve the serial traps and ccd which are passed to arctic.
+        """
+        return self.traps_ccd_from(
+            trap_list=cti.serial_trap_list, ccd_phase=cti.serial_ccd
+        )
 
     def add_cti(
         self,
         data: aa.Array2D,
         cti: CTI2D,
-        preloads: Optional[Preloads] = Preloads(),
+        preloads: Optional[Preloads] = None,
     ) -> aa.Array2D:
         """
         Add CTI to a 2D dataset by passing it to the c++ arctic clocking algorithm.
@@ -180,23 +237,34 @@ class Clocker2D(AbstractClocker):
             and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
         """
 
+        if preloads is None:
+            preloads = Preloads()
+
         if self.parallel_poisson_traps:
             return self.add_cti_poisson_traps(data=data, cti=cti)
 
+        if self.parallel_fast_mode and self.serial_fast_mode:
+            return self.add_cti_parallel_serial_fast(
+                data=data, cti=cti, preloads=preloads
+            )
+
         if self.parallel_fast_mode:
             return self.add_cti_parallel_fast(data=data, cti=cti, preloads=preloads)
 
         if self.serial_fast_mode:
             return self.add_cti_serial_fast(data=data, cti=cti, preloads=preloads)
 
+        if self.active_window_mode:
+            return self.add_cti_active_window(data=data, cti=cti)
+
+        if self.n_workers > 1:
+            return self.add_cti_pool(data=data, cti=cti)
+
         data = data.native_skip_mask
 
         parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
         serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
 
-        parallel_ccd = self.ccd_from(ccd_phase=parallel_ccd)
-        serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
-
         try:
             parallel_window_offset = data.readout_offsets[0]
             serial_window_offset = data.readout_offsets[1]
@@ -204,9 +272,99 @@ class Clocker2D(AbstractClocker):
             parallel_window_offset = self.parallel_window_offset
             serial_window_offset = self.serial_window_offset
 
-        try:
-            image_post_cti = add_cti(
-                image=data,
+        image_post_cti = self.arctic_add_cti(
+            image=data,
+            parallel_ccd=parallel_ccd,
+            parallel_roe=self.parallel_roe,
+            parallel_traps=parallel_trap_list,
+            parallel_express=self.parallel_express,
+            parallel_window_offset=parallel_window_offset,
+            parallel_window_start=self.parallel_window_start,
+            parallel_window_stop=self.parallel_window_stop,
+            parallel_time_start=self.parallel_time_start,
+            parallel_time_stop=self.parallel_time_stop,
+            parallel_prune_n_electrons=self.parallel_prune_n_electrons,
+            parallel_prune_frequency=self.parallel_prune_frequency,
+            serial_ccd=serial_ccd,
+            serial_roe=self.serial_roe,
+            serial_traps=serial_trap_list,
+            serial_express=self.serial_express,
+            serial_window_offset=serial_window_offset,
+            serial_window_start=self.serial_window_start,
+            serial_window_stop=self.serial_window_stop,
+            serial_time_start=self.serial_time_start,
+            serial_time_stop=self.serial_time_stop,
+            serial_prune_n_electrons=self.serial_prune_n_electrons,
+            serial_prune_frequency=self.serial_prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            pixel_bounce_list=cti.pixel_bounce_list,
+            verbosity=self.verbosity,
+        )
+
+        return self._post_cti_array_from(values=image_post_cti, data=data)
+
+    def _post_cti_array_from(
+        self,
+        values: np.ndarray,
+        data: aa.Array2D,
+        header: Optional[Header] = None,
+    ) -> aa.Array2D:
+        """
+        Returns the values output by arctic, which are `float64`, as an `Array2D` in its `native` representation
+        with the mask and data type of the input data (see `dtype_util.dtype_from`), without a copy if the data is
+        `float64`.
+
+        If the input data is an ndarray without a mask the values are returned as they are.
+
+        Parameters
+        ----------
+        values
+            The native values output by arctic.
+        data
+            The data which was clocked, whose mask and data type the returned array has.
+        header
+            The header of the returned array.
+        """
+        mask = getattr(data, "mask", None)
+
+        if mask is None:
+            return values
+
+        return aa.Array2D(
+            values=values.astype(data.dtype, copy=False),
+            mask=mask,
+            header=header,
+            store_native=True,
+            skip_mask=True,
+        )
+
+    def _add_cti_from(self, image: np.ndarray, clock_dict: dict) -> np.ndarray:
+        """
+        Add CTI to an image in a single arctic call in this process, using the input arctic keyword arguments.
+        """
+        return self.arctic_add_cti(image=image, **clock_dict)
+
+    def _add_cti_pool_from(
+        self,
+        image: np.ndarray,
+        cti: CTI2D,
+        parallel_window_offset: int,
+        serial_window_offset: int,
+    ) -> np.ndarray:
+        """
+        Add parallel and serial CTI to a 2D image, where parallel clocking is performed on blocks of columns and
+        serial clocking on blocks of rows by the worker processes of the `pool`.
+
+        Columns (and rows) are only clocked independently of one another if the `ROE` empties the traps between
+        them, and pixel bounce is applied to the full image after serial clocking. If this is not the case for a
+        clocking direction, that direction is clocked in a single arctic call in this process instead, so the output
+        is always identical to that of `add_cti` with `n_workers=1`.
+        """
+        parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
+        serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
+
+        if parallel_trap_list is not None:
+            parallel_dict = dict(
                 parallel_ccd=parallel_ccd,
                 parallel_roe=self.parallel_roe,
                 parallel_traps=parallel_trap_list,
@@ -218,24 +376,180 @@ class Clocker2D(AbstractClocker):
                 parallel_time_stop=self.parallel_time_stop,
                 parallel_prune_n_electrons=self.parallel_prune_n_electrons,
                 parallel_prune_frequency=self.parallel_prune_frequency,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=serial_window_offset,
                 serial_window_start=self.serial_window_start,
                 serial_window_stop=self.serial_window_stop,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
                 allow_negative_pixels=self.allow_negative_pixels,
-                pixel_bounce_list=cti.pixel_bounce_list,
                 verbosity=self.verbosity,
             )
-        except TypeError:
-            image_post_cti = add_cti(
-                image=data,
+
+            if self.parallel_roe.empty_traps_between_columns:
+                image = self.pool.clock_from(
+                    image=image,
+                    for_parallel=True,
+                    clock_dict=self.add_cti_dict_from(clock_dict=parallel_dict),
+                )
+            else:
+                image = self._add_cti_from(image=image, clock_dict=parallel_dict)
+
+        if serial_trap_list is None and cti.pixel_bounce_list is None:
+            return np.asarray(image)
+
+        serial_dict = dict(
+            serial_ccd=serial_ccd,
+            serial_roe=self.serial_roe,
+            serial_traps=serial_trap_list,
+            serial_express=self.serial_express,
+            serial_window_offset=serial_window_offset,
+            serial_window_start=self.serial_window_start,
+            serial_window_stop=self.serial_window_stop,
+            serial_time_start=self.serial_time_start,
+            serial_time_stop=self.serial_time_stop,
+            serial_prune_n_electrons=self.serial_prune_n_electrons,
+            serial_prune_frequency=self.serial_prune_frequency,
+            parallel_window_start=self.parallel_window_start,
+            parallel_window_stop=self.parallel_window_stop,
+            allow_negative_pixels=self.allow_negative_pixels,
+            verbosity=self.verbosity,
+        )
+
+        if (
+            cti.pixel_bounce_list is None
+            and self.serial_roe.empty_traps_between_columns
+        ):
+            return self.pool.clock_from(
+                image=image,
+                for_parallel=False,
+                clock_dict=self.add_cti_dict_from(clock_dict=serial_dict),
+            )
+
+        return self._add_cti_from(
+            image=image,
+            clock_dict={**serial_dict, "pixel_bounce_list": cti.pixel_bounce_list},
+        )
+
+    def add_cti_pool(
+        self,
+        data: aa.Array2D,
+        cti: CTI2D,
+    ) -> aa.Array2D:
+        """
+        Add CTI to a 2D dataset by passing it to the c++ arctic clocking algorithm, using `n_workers` processes.
+
+        Parallel clocking is independent for every column of the image and serial clocking for every row. The image
+        is therefore split into `n_workers` blocks of columns, which are each clocked in the parallel direction by
+        a different process of a persistent worker pool, and the result is split into blocks of rows which are
+        clocked in the serial direction in the same way. The image is passed to and from the worker processes via
+        shared memory and the output is identical to clocking the full image in one arctic call.
+
+        Parameters
+        ----------
+        data
+            The 2D data that is clocked via arctic and has CTI added to it.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
+        """
+        data = data.native_skip_mask
+
+        try:
+            parallel_window_offset = data.readout_offsets[0]
+            serial_window_offset = data.readout_offsets[1]
+        except AttributeError:
+            parallel_window_offset = self.parallel_window_offset
+            serial_window_offset = self.serial_window_offset
+
+        image_post_cti = self._add_cti_pool_from(
+            image=data,
+            cti=cti,
+            parallel_window_offset=parallel_window_offset,
+            serial_window_offset=serial_window_offset,
+        )
+
+        return self._post_cti_array_from(values=image_post_cti, data=data)
+
+    def _window_offsets_from(self, data: aa.Array2D):
+        """
+        Returns the parallel and serial window offsets of the data, which are its readout offsets if it has them.
+        """
+        try:
+            return data.readout_offsets[0], data.readout_offsets[1]
+        except AttributeError:
+            return self.parallel_window_offset, self.serial_window_offset
+
+    def _clock_stacked_from(
+        self, image: np.ndarray, for_parallel: bool, clock_dict: dict
+    ) -> np.ndarray:
+        """
+        Add CTI to an image in one clocking direction, where the image is a stack of the columns (parallel) or rows
+        (serial) of many images which are all clocked in full.
+
+        If the fast mode of the clocking direction is on, only the unique stripes of the stack are clocked, else the
+        stack is clocked by the `pool` if `n_workers` is above 1 or in a single arctic call.
+        """
+        fast_mode = self.parallel_fast_mode if for_parallel else self.serial_fast_mode
+
+        axis = 1 if for_parallel else 0
+
+        if fast_mode:
+            fast_index_list, fast_inverse_indexes = self.fast_indexes_inverse_from(
+                data=image, for_parallel=for_parallel
+            )
+
+            image_post_cti_pass = self._add_cti_from(
+                image=np.take(image, fast_index_list, axis=axis), clock_dict=clock_dict
+            )
+
+            return np.take(image_post_cti_pass, fast_inverse_indexes, axis=axis)
+
+        if self.n_workers > 1:
+            return self.pool.clock_from(
+                image=image,
+                for_parallel=for_parallel,
+                clock_dict=self.add_cti_dict_from(clock_dict=clock_dict),
+            )
+
+        return self._add_cti_from(image=image, clock_dict=clock_dict)
+
+    def add_cti_active_window(
+        self,
+        data: aa.Array2D,
+        cti: CTI2D,
+    ) -> aa.Array2D:
+        """
+        Add CTI to a 2D dataset by passing only the columns and rows which hold charge to the c++ arctic clocking
+        algorithm.
+
+        Charge injection data has large regions with no charge before CTI is added (e.g. the serial prescan, or the
+        rows before the first charge injection region). When the `ROE` empties the traps between columns, every
+        column is parallel clocked independently and a column with no charge is not changed by clocking. The columns
+        of the pre-cti data which hold charge (and are within the serial window) are therefore stacked into a smaller
+        image which is parallel clocked, and the rows of the parallel clocked image which hold charge are then
+        serially clocked in the same way. The output is identical to clocking the full image.
+
+        If the `ROE` of a clocking direction does not empty the traps between columns, or pixel bounce is used
+        (which is applied to the full image after serial clocking), that direction clocks the full image.
+
+        Parameters
+        ----------
+        data
+            The 2D data that is clocked via arctic and has CTI added to it.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
+        """
+        data = data.native_skip_mask
+
+        parallel_window_offset, serial_window_offset = self._window_offsets_from(
+            data=data
+        )
+
+        parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
+        serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
+
+        image = np.array(data, dtype="float")
+
+        if parallel_trap_list is not None:
+            parallel_dict = dict(
                 parallel_ccd=parallel_ccd,
                 parallel_roe=self.parallel_roe,
                 parallel_traps=parallel_trap_list,
@@ -247,6 +561,40 @@ class Clocker2D(AbstractClocker):
                 parallel_time_stop=self.parallel_time_stop,
                 parallel_prune_n_electrons=self.parallel_prune_n_electrons,
                 parallel_prune_frequency=self.parallel_prune_frequency,
+                allow_negative_pixels=self.allow_negative_pixels,
+                verbosity=self.verbosity,
+            )
+
+            if self.parallel_roe.empty_traps_between_columns:
+                column_indexes = clocker_util.active_stripe_indexes_from(
+                    data=image,
+                    for_parallel=True,
+                    window_start=self.serial_window_start,
+                    window_stop=self.serial_window_stop,
+                )
+
+                if column_indexes.shape[0] > 0:
+                    image[:, column_indexes] = self._clock_stacked_from(
+                        image=np.take(image, column_indexes, axis=1),
+                        for_parallel=True,
+                        clock_dict=parallel_dict,
+                    )
+
+            else:
+                image = self._add_cti_from(
+                    image=image,
+                    clock_dict={
+                        **parallel_dict,
+                        "serial_window_start": self.serial_window_start,
+                        "serial_window_stop": self.serial_window_stop,
+                    },
+                )
+
+        if serial_trap_list is None and cti.pixel_bounce_list is None:
+            post_cti_data = image
+
+        else:
+            serial_dict = dict(
                 serial_ccd=serial_ccd,
                 serial_roe=self.serial_roe,
                 serial_traps=serial_trap_list,
@@ -258,16 +606,225 @@ class Clocker2D(AbstractClocker):
                 serial_time_stop=self.serial_time_stop,
                 serial_prune_n_electrons=self.serial_prune_n_electrons,
                 serial_prune_frequency=self.serial_prune_frequency,
-                pixel_bounce_list=cti.pixel_bounce_list,
+                allow_negative_pixels=self.allow_negative_pixels,
                 verbosity=self.verbosity,
             )
 
-        try:
-            return aa.Array2D(
-                values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
+            if (
+                cti.pixel_bounce_list is None
+                and self.serial_roe.empty_traps_between_columns
+            ):
+                row_indexes = clocker_util.active_stripe_indexes_from(
+                    data=image,
+                    for_parallel=False,
+                    window_start=self.parallel_window_start,
+                    window_stop=self.parallel_window_stop,
+                )
+
+                if row_indexes.shape[0] > 0:
+                    image[row_indexes, :] = self._clock_stacked_from(
+                        image=np.take(image, row_indexes, axis=0),
+                        for_parallel=False,
+                        clock_dict=serial_dict,
+                    )
+
+                post_cti_data = image
+
+            else:
+                post_cti_data = self._add_cti_from(
+                    image=image,
+                    clock_dict={
+                        **serial_dict,
+                        "parallel_window_start": self.parallel_window_start,
+                        "parallel_window_stop": self.parallel_window_stop,
+                        "pixel_bounce_list": cti.pixel_bounce_list,
+                    },
+                )
+
+        return self._post_cti_array_from(values=post_cti_data, data=data)
+
+    def add_cti_batch(
+        self,
+        data_list: List[aa.Array2D],
+        cti: CTI2D,
+    ) -> List[aa.Array2D]:
+        """
+        Add CTI to many 2D datasets with the same CTI model, for example charge injection imaging at different
+        injection levels, by passing them to the c++ arctic clocking algorithm together.
+
+        Parallel clocking is independent for every column, therefore the columns of every image which are clocked
+        (those in the serial window) are stacked into a single image which is clocked in one arctic call. The rows
+        of every parallel clocked image are then stacked and serially clocked in the same way. The traps and CCD
+        of the CTI model are unpacked once, and if `parallel_fast_mode` or `serial_fast_mode` are on, the unique
+        columns and rows are found across all images at once, such that stripes shared by different images are
+        only clocked once.
+
+        The images are clocked with the same windows and offsets as `add_cti`: the clocker's windows and the
+        readout offsets of the data, or, if `parallel_fast_mode` or `serial_fast_mode` are on, the full image and
+        the clocker's window offsets, as the fast modes clock every pixel and ignore the readout offsets.
+
+        Stacking is exact provided every image has the same shape and readout offsets, the `ROE` empties the traps
+        between columns and there is no pixel bounce. If this is not the case, Poisson traps are used or only
+        `serial_fast_mode` is on (which does not add parallel CTI), every image is passed to `add_cti` separately.
+
+        Parameters
+        ----------
+        data_list
+            The 2D datasets that are clocked via arctic and have CTI added to them.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
+
+        Returns
+        -------
+        A list of the post-cti images, in the same order as the input datasets.
+        """
+        if len(data_list) == 0:
+            return []
+
+        data_list = [data.native_skip_mask for data in data_list]
+
+        fast_mode = self.parallel_fast_mode or self.serial_fast_mode
+
+        if fast_mode:
+            window_offsets_list = [
+                (self.parallel_window_offset, self.serial_window_offset)
+            ] * len(data_list)
+
+            parallel_window_start, parallel_window_stop = 0, -1
+            serial_window_start, serial_window_stop = 0, -1
+        else:
+            window_offsets_list = [
+                self._window_offsets_from(data=data) for data in data_list
+            ]
+
+            parallel_window_start = self.parallel_window_start
+            parallel_window_stop = self.parallel_window_stop
+            serial_window_start = self.serial_window_start
+            serial_window_stop = self.serial_window_stop
+
+        if (
+            self.parallel_poisson_traps
+            or (self.serial_fast_mode and not self.parallel_fast_mode)
+            or cti.pixel_bounce_list is not None
+            or not self.parallel_roe.empty_traps_between_columns
+            or not self.serial_roe.empty_traps_between_columns
+            or len({np.shape(data) for data in data_list}) > 1
+            or len(set(window_offsets_list)) > 1
+        ):
+            return [self.add_cti(data=data, cti=cti) for data in data_list]
+
+        parallel_window_offset, serial_window_offset = window_offsets_list[0]
+
+        parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
+        serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
+
+        image_list = [np.array(data, dtype="float") for data in data_list]
+
+        total_rows, total_columns = image_list[0].shape
+
+        if parallel_trap_list is not None:
+            column_slice = slice(
+                *window_in_block_from(
+                    window_start=serial_window_start,
+                    window_stop=serial_window_stop,
+                    block_start=0,
+                    block_stop=total_columns,
+                )
+            )
+
+            image_stack = self._clock_stacked_from(
+                image=np.concatenate(
+                    [image[:, column_slice] for image in image_list], axis=1
+                ),
+                for_parallel=True,
+                clock_dict=dict(
+                    parallel_ccd=parallel_ccd,
+                    parallel_roe=self.parallel_roe,
+                    parallel_traps=parallel_trap_list,
+                    parallel_express=self.parallel_express,
+                    parallel_window_offset=parallel_window_offset,
+                    parallel_window_start=parallel_window_start,
+                    parallel_window_stop=parallel_window_stop,
+                    parallel_time_start=self.parallel_time_start,
+                    parallel_time_stop=self.parallel_time_stop,
+                    parallel_prune_n_electrons=self.parallel_prune_n_electrons,
+                    parallel_prune_frequency=self.parallel_prune_frequency,
+                    allow_negative_pixels=self.allow_negative_pixels,
+                    verbosity=self.verbosity,
+                ),
+            )
+
+            for image, image_post_cti in zip(
+                image_list, np.split(image_stack, len(image_list), axis=1)
+            ):
+                image[:, column_slice] = image_post_cti
+
+        if serial_trap_list is not None:
+            row_slice = slice(
+                *window_in_block_from(
+                    window_start=parallel_window_start,
+                    window_stop=parallel_window_stop,
+                    block_start=0,
+                    block_stop=total_rows,
+                )
+            )
+
+            image_stack = self._clock_stacked_from(
+                image=np.concatenate(
+                    [image[row_slice, :] for image in image_list], axis=0
+                ),
+                for_parallel=False,
+                clock_dict=dict(
+                    serial_ccd=serial_ccd,
+                    serial_roe=self.serial_roe,
+                    serial_traps=serial_trap_list,
+                    serial_express=self.serial_express,
+                    serial_window_offset=serial_window_offset,
+                    serial_window_start=serial_window_start,
+                    serial_window_stop=serial_window_stop,
+                    serial_time_start=self.serial_time_start,
+                    serial_time_stop=self.serial_time_stop,
+                    serial_prune_n_electrons=self.serial_prune_n_electrons,
+                    serial_prune_frequency=self.serial_prune_frequency,
+                    allow_negative_pixels=self.allow_negative_pixels,
+                    verbosity=self.verbosity,
+                ),
+            )
+
+            for image, image_post_cti in zip(
+                image_list, np.split(image_stack, len(image_list), axis=0)
+            ):
+                image[row_slice, :] = image_post_cti
+
+        post_cti_list = []
+
+        for data, image_post_cti in zip(data_list, image_list):
+            post_cti_list.append(
+                self._post_cti_array_from(values=image_post_cti, data=data)
             )
-        except AttributeError:
-            return image_post_cti
+
+        return post_cti_list
+
+    def _poisson_trap_from(
+        self, trap, total_rows: int, generator: Optional[np.random.Generator] = None
+    ):
+        """
+        Returns a copy of a trap whose density is drawn from a Poisson distribution, for the number of traps in a
+        column of `total_rows` pixels.
+
+        If a generator is input (because the `poisson_seed` is a random number stream) the density is drawn from it,
+        otherwise it is drawn via arctic, which seeds numpy's global random state with the `poisson_seed`.
+        """
+        if generator is None:
+            return trap.poisson_density_from(
+                total_pixels=total_rows, seed=self.poisson_seed
+            )
+
+        poisson_trap = copy.copy(trap)
+        poisson_trap.density = generator.poisson(trap.density * total_rows) / total_rows
+
+        return poisson_trap
 
     def add_cti_poisson_traps(
         self,
@@ -285,6 +842,11 @@ class Clocker2D(AbstractClocker):
         clocking the density of traps in every column is drawn from a Poisson distribution to represent the stochastic
         nature of how many traps are in each column of a real CCD.
 
+        The number of traps drawn in a column is an integer, so many columns draw identical traps. Columns with
+        identical traps are clocked together in one arctic call (provided the `ROE` empties the traps between
+        columns, such that they are clocked independently), which gives the same output as clocking every column
+        separately. If `n_workers` is above 1, these calls are distributed over the worker processes of the `pool`.
+
         Parameters
         ----------
         data
@@ -297,111 +859,97 @@ class Clocker2D(AbstractClocker):
         parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
         serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
 
-        parallel_ccd = self.ccd_from(ccd_phase=parallel_ccd)
-
         try:
             parallel_window_offset = data.readout_offsets[0]
         except AttributeError:
             parallel_window_offset = self.parallel_window_offset
 
-        image_pre_cti = data.native_skip_mask
-        image_post_cti = np.zeros(data.shape_native)
+        image_pre_cti = np.asarray(data.native_skip_mask, dtype="float")
 
-        total_rows = image_post_cti.shape[0]
-        total_columns = image_post_cti.shape[1]
+        total_rows = image_pre_cti.shape[0]
+        total_columns = image_pre_cti.shape[1]
 
-        parallel_trap_column_list = []
+        generator = None
 
-        for column in range(total_columns):
-            parallel_trap_poisson_list = [
-                parallel_trap.poisson_density_from(
-                    total_pixels=total_rows, seed=self.poisson_seed
+        if random_util.is_stream(self.poisson_seed):
+            generator = random_util.generator_from(rng=self.poisson_seed)
+
+        parallel_trap_column_list = [
+            [
+                self._poisson_trap_from(
+                    trap=parallel_trap, total_rows=total_rows, generator=generator
                 )
                 for parallel_trap in parallel_trap_list
             ]
+            for column in range(total_columns)
+        ]
 
-            parallel_trap_column_list.append(parallel_trap_poisson_list)
-
-            image_pre_cti_pass = np.zeros(shape=(total_rows, 1))
-            image_pre_cti_pass[:, 0] = image_pre_cti[:, column]
+        self.parallel_trap_column_list = parallel_trap_column_list
 
-            try:
-                image_post_cti[:, column] = add_cti(
-                    image=image_pre_cti_pass,
-                    parallel_ccd=parallel_ccd,
-                    parallel_roe=self.parallel_roe,
-                    parallel_traps=parallel_trap_poisson_list,
-                    parallel_express=self.parallel_express,
-                    parallel_window_offset=parallel_window_offset,
-                    parallel_window_start=self.parallel_window_start,
-                    parallel_window_stop=self.parallel_window_stop,
-                    allow_negative_pixels=self.allow_negative_pixels,
-                    verbosity=self.verbosity,
-                )[:, 0]
-            except TypeError:
-                image_post_cti[:, column] = add_cti(
-                    image=image_pre_cti_pass,
-                    parallel_ccd=parallel_ccd,
-                    parallel_roe=self.parallel_roe,
-                    parallel_traps=parallel_trap_poisson_list,
-                    parallel_express=self.parallel_express,
-                    parallel_window_offset=parallel_window_offset,
-                    parallel_window_start=self.parallel_window_start,
-                    parallel_window_stop=self.parallel_window_stop,
-                    verbosity=self.verbosity,
-                )[:, 0]
+        if self.parallel_roe.empty_traps_between_columns:
+            column_lists = clocker_util.trap_column_groups_from(
+                trap_column_list=parallel_trap_column_list
+            )
+        else:
+            column_lists = [[column] for column in range(total_columns)]
+
+        column_group_list = [
+            (
+                column_list,
+                self.add_cti_dict_from(
+                    clock_dict=dict(
+                        parallel_ccd=parallel_ccd,
+                        parallel_roe=self.parallel_roe,
+                        parallel_traps=parallel_trap_column_list[column_list[0]],
+                        parallel_express=self.parallel_express,
+                        parallel_window_offset=parallel_window_offset,
+                        parallel_window_start=self.parallel_window_start,
+                        parallel_window_stop=self.parallel_window_stop,
+                        allow_negative_pixels=self.allow_negative_pixels,
+                        verbosity=self.verbosity,
+                    )
+                ),
+            )
+            for column_list in column_lists
+        ]
 
-        self.parallel_trap_column_list = parallel_trap_column_list
+        if self.n_workers > 1:
+            image_post_cti = self.pool.clock_column_groups_from(
+                image=image_pre_cti, column_group_list=column_group_list
+            )
+        else:
+            image_post_cti = np.zeros(data.shape_native)
 
-        serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
+            for column_list, clock_dict in column_group_list:
+                image_post_cti[:, column_list] = self._add_cti_from(
+                    image=np.take(image_pre_cti, column_list, axis=1),
+                    clock_dict=clock_dict,
+                )
 
         try:
             serial_window_offset = data.readout_offsets[1]
         except AttributeError:
             serial_window_offset = self.serial_window_offset
 
-        try:
-            image_post_cti = add_cti(
-                image=image_post_cti,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=serial_window_offset,
-                serial_window_start=self.serial_window_start,
-                serial_window_stop=self.serial_window_stop,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
-            )
-        except TypeError:
-            image_post_cti = add_cti(
-                image=image_post_cti,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=serial_window_offset,
-                serial_window_start=self.serial_window_start,
-                serial_window_stop=self.serial_window_stop,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
-            )
+        image_post_cti = self.arctic_add_cti(
+            image=image_post_cti,
+            serial_ccd=serial_ccd,
+            serial_roe=self.serial_roe,
+            serial_traps=serial_trap_list,
+            serial_express=self.serial_express,
+            serial_window_offset=serial_window_offset,
+            serial_window_start=self.serial_window_start,
+            serial_window_stop=self.serial_window_stop,
+            serial_time_start=self.serial_time_start,
+            serial_time_stop=self.serial_time_stop,
+            serial_prune_n_electrons=self.serial_prune_n_electrons,
+            serial_prune_frequency=self.serial_prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            pixel_bounce_list=cti.pixel_bounce_list,
+            verbosity=self.verbosity,
+        )
 
-        try:
-            return aa.Array2D(
-                values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
-            )
-        except AttributeError:
-            return image_post_cti
+        return self._post_cti_array_from(values=image_post_cti, data=data)
 
     def fast_indexes_from(self, data: aa.Array2D, for_parallel: bool):
         """
@@ -418,60 +966,47 @@ class Clocker2D(AbstractClocker):
         `add_cti_parallel_fast` and `add_cti_serial_fast` to create the extracted image that is passed to arctic and
         rebuild the final post CTI image.
 
+        Identical stripes are grouped in a single vectorized pass (see `clocker_util.unique_stripes_from`), so this
+        scales to full CCD quadrants with thousands of columns and rows.
+
         Parameters
         ----------
         data
             The 1D data that is clocked via arctic and has CTI added to it.
         """
 
-        if for_parallel:
-            total_stripes = data.shape[1]
-        else:
-            total_stripes = data.shape[0]
-
-        fast_index_list = []
-        fast_column_lists = []
-
-        unchecked_list = range(0, total_stripes)
-
-        for stripe_index in range(total_stripes):
-            paired = False
-
-            pair_list = []
-            unchecked_list_new = []
-
-            if stripe_index in unchecked_list:
-                for pair_index in unchecked_list:
-                    if for_parallel:
-                        residual_map = np.abs(
-                            data[:, stripe_index] - data[:, pair_index]
-                        )
-                    else:
-                        residual_map = np.abs(
-                            data[stripe_index, :] - data[pair_index, :]
-                        )
+        fast_index_list, inverse = self.fast_indexes_inverse_from(
+            data=data, for_parallel=for_parallel
+        )
 
-                    if np.all(residual_map < 1.0e-8):
-                        if not paired:
-                            fast_index_list.append(stripe_index)
+        fast_column_lists = clocker_util.fast_stripe_lists_from(inverse=inverse)
 
-                        paired = True
+        fast_index_list = fast_index_list.tolist()
 
-                        pair_list.append(pair_index)
+        return fast_index_list, fast_column_lists
 
-                    else:
-                        unchecked_list_new.append(pair_index)
+    def fast_indexes_inverse_from(self, data: aa.Array2D, for_parallel: bool):
+        """
+        Returns the indexes of every unique stripe (column for parallel clocking, row for serial clocking) of the
+        input data, alongside a flat integer array mapping every stripe to the unique stripe it is identical to.
 
-                fast_column_lists.append(pair_list)
-                unchecked_list = unchecked_list_new
+        This is the same information as `fast_indexes_from`, but in a form where extracting the unique stripes
+        which are passed to arctic and rebuilding the post-cti image are each a single NumPy indexing operation.
 
-        return fast_index_list, fast_column_lists
+        Parameters
+        ----------
+        data
+            The 2D data that is clocked via arctic and has CTI added to it.
+        for_parallel
+            If `True` the unique columns are returned (parallel clocking), else the unique rows (serial clocking).
+        """
+        return clocker_util.unique_stripes_from(data=data, for_parallel=for_parallel)
 
     def add_cti_parallel_fast(
         self,
         data: aa.Array2D,
         cti: CTI2D,
-        preloads: Preloads = Preloads(),
+        preloads: Optional[Preloads] = None,
     ):
         """
         Add CTI to a 2D dataset by passing it to the c++ arctic clocking algorithm.
@@ -497,112 +1032,68 @@ class Clocker2D(AbstractClocker):
             and all entries outside this region are zero).
         """
 
+        if preloads is None:
+            preloads = Preloads()
+
         parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
 
         image_pre_cti = data.native_skip_mask
 
-        parallel_ccd = self.ccd_from(ccd_phase=parallel_ccd)
-
         if preloads.parallel_fast_index_list is None:
-            fast_index_list, fast_column_lists = self.fast_indexes_from(
+            fast_index_list, fast_inverse_indexes = self.fast_indexes_inverse_from(
                 data=image_pre_cti, for_parallel=True
             )
         else:
             fast_index_list = preloads.parallel_fast_index_list
-            fast_column_lists = preloads.parallel_fast_column_lists
-
-        image_pre_cti_pass = np.zeros(
-            shape=(data.shape_native[0], len(fast_index_list))
+            fast_inverse_indexes = preloads.parallel_fast_inverse_indexes
+
+        image_pre_cti_pass = np.take(image_pre_cti, fast_index_list, axis=1)
+
+        image_post_cti_pass = self.arctic_add_cti(
+            image=image_pre_cti_pass,
+            parallel_ccd=parallel_ccd,
+            parallel_roe=self.parallel_roe,
+            parallel_traps=parallel_trap_list,
+            parallel_express=self.parallel_express,
+            parallel_window_offset=self.parallel_window_offset,
+            parallel_time_start=self.parallel_time_start,
+            parallel_time_stop=self.parallel_time_stop,
+            parallel_prune_n_electrons=self.parallel_prune_n_electrons,
+            parallel_prune_frequency=self.parallel_prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            verbosity=self.verbosity,
         )
-        for i, fast_index in enumerate(fast_index_list):
-            image_pre_cti_pass[:, i] = image_pre_cti[:, fast_index]
 
-        try:
-            image_post_cti_pass = add_cti(
-                image=image_pre_cti_pass,
-                parallel_ccd=parallel_ccd,
-                parallel_roe=self.parallel_roe,
-                parallel_traps=parallel_trap_list,
-                parallel_express=self.parallel_express,
-                parallel_window_offset=self.parallel_window_offset,
-                parallel_time_start=self.parallel_time_start,
-                parallel_time_stop=self.parallel_time_stop,
-                parallel_prune_n_electrons=self.parallel_prune_n_electrons,
-                parallel_prune_frequency=self.parallel_prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                verbosity=self.verbosity,
-            )
-        except TypeError:
-            image_post_cti_pass = add_cti(
-                image=image_pre_cti_pass,
-                parallel_ccd=parallel_ccd,
-                parallel_roe=self.parallel_roe,
-                parallel_traps=parallel_trap_list,
-                parallel_express=self.parallel_express,
-                parallel_window_offset=self.parallel_window_offset,
-                parallel_time_start=self.parallel_time_start,
-                parallel_time_stop=self.parallel_time_stop,
-                parallel_prune_n_electrons=self.parallel_prune_n_electrons,
-                parallel_prune_frequency=self.parallel_prune_frequency,
-                verbosity=self.verbosity,
-            )
-
-        image_post_cti = np.zeros(shape=data.shape_native)
-
-        for i, fast_column_list in enumerate(fast_column_lists):
-            for fast_column in fast_column_list:
-                image_post_cti[:, fast_column] = image_post_cti_pass[:, i]
+        image_post_cti = np.take(image_post_cti_pass, fast_inverse_indexes, axis=1)
 
         if cti.serial_trap_list is None:
-            return aa.Array2D(
-                values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
-            )
+            return self._post_cti_array_from(values=image_post_cti, data=data)
 
         serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
 
-        serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
-
-        try:
-            image_post_cti = add_cti(
-                image=image_post_cti,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=self.serial_window_offset,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
-            )
-        except TypeError:
-            image_post_cti = add_cti(
-                image=image_post_cti,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=self.serial_window_offset,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
-            )
-
-        return aa.Array2D(
-            values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
+        image_post_cti = self.arctic_add_cti(
+            image=image_post_cti,
+            serial_ccd=serial_ccd,
+            serial_roe=self.serial_roe,
+            serial_traps=serial_trap_list,
+            serial_express=self.serial_express,
+            serial_window_offset=self.serial_window_offset,
+            serial_time_start=self.serial_time_start,
+            serial_time_stop=self.serial_time_stop,
+            serial_prune_n_electrons=self.serial_prune_n_electrons,
+            serial_prune_frequency=self.serial_prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            pixel_bounce_list=cti.pixel_bounce_list,
+            verbosity=self.verbosity,
         )
 
+        return self._post_cti_array_from(values=image_post_cti, data=data)
+
     def add_cti_serial_fast(
         self,
         data: aa.Array2D,
         cti: CTI2D,
-        preloads: Preloads = Preloads(),
+        preloads: Optional[Preloads] = None,
     ):
         """
         Add CTI to a 2D dataset by passing it to the c++ arctic clocking algorithm.
@@ -632,68 +1123,164 @@ class Clocker2D(AbstractClocker):
             and all entries outside this region are zero).
         """
 
+        if preloads is None:
+            preloads = Preloads()
+
         serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
 
         image_pre_cti = data.native_skip_mask
 
-        serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
-
         if preloads.serial_fast_index_list is None:
-            fast_index_list, fast_row_lists = self.fast_indexes_from(
+            fast_index_list, fast_inverse_indexes = self.fast_indexes_inverse_from(
                 data=image_pre_cti, for_parallel=False
             )
         else:
             fast_index_list = preloads.serial_fast_index_list
-            fast_row_lists = preloads.serial_fast_row_lists
+            fast_inverse_indexes = preloads.serial_fast_inverse_indexes
+
+        image_pre_cti_pass = np.take(image_pre_cti, fast_index_list, axis=0)
+
+        image_post_cti_pass = self.arctic_add_cti(
+            image=image_pre_cti_pass,
+            serial_ccd=serial_ccd,
+            serial_roe=self.serial_roe,
+            serial_traps=serial_trap_list,
+            serial_express=self.serial_express,
+            serial_window_offset=self.serial_window_offset,
+            serial_time_start=self.serial_time_start,
+            serial_time_stop=self.serial_time_stop,
+            serial_prune_n_electrons=self.serial_prune_n_electrons,
+            serial_prune_frequency=self.serial_prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            pixel_bounce_list=cti.pixel_bounce_list,
+            verbosity=self.verbosity,
+        )
+
+        image_post_cti = np.take(image_post_cti_pass, fast_inverse_indexes, axis=0)
+
+        return self._post_cti_array_from(values=image_post_cti, data=data)
+
+    def add_cti_parallel_serial_fast(
+        self,
+        data: aa.Array2D,
+        cti: CTI2D,
+        preloads: Optional[Preloads] = None,
+    ):
+        """
+        Add CTI to a 2D dataset by passing it to the c++ arctic clocking algorithm.
+
+        Clocking is performed towards the readout register and electronics, with parallel CTI added first followed
+        by serial CTI, where both parallel and serial clocking only pass unique stripes of the image to arctic.
 
-        image_pre_cti_pass = np.zeros(
-            shape=(len(fast_index_list), data.shape_native[1])
+        Parallel CTI is added in the same way as `add_cti_parallel_fast`, by extracting all identical columns,
+        adding CTI via arctic to only these columns. Two rows of the full parallel clocked image are identical if
+        and only if they are identical in this reduced image (as every column of the full image is a copy of one
+        of its columns), therefore the unique rows are found from the reduced image, which is cheap. Only these
+        rows are expanded to the full image width and passed to arctic for serial clocking, with the output
+        copied to every identical row to construct the final post-cti image.
+
+        For uniform charge injection most rows within an injection region are identical after parallel clocking,
+        such that serial clocking passes a small fraction of all rows to arctic.
+
+        The unique rows of the parallel clocked image depend on the CTI model and are therefore not known before
+        the model-fit. The rows found by the previous call are stored in the `preloads` and reused if they are
+        verified to still group the rows of the new parallel clocked image correctly, which is the case for most
+        models evaluated during a fit. If the check fails, the rows are recomputed and stored.
+
+        Parameters
+        ----------
+        data
+            The 2D data that is clocked via arctic and has CTI added to it.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
+        preloads
+            The preloads which contain the unique columns of the pre-cti data and store the unique rows of the
+            parallel clocked image.
+        """
+
+        if preloads is None:
+            preloads = Preloads()
+
+        parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
+
+        image_pre_cti = data.native_skip_mask
+
+        if preloads.parallel_fast_index_list is None:
+            fast_index_list, fast_inverse_indexes = self.fast_indexes_inverse_from(
+                data=image_pre_cti, for_parallel=True
+            )
+        else:
+            fast_index_list = preloads.parallel_fast_index_list
+            fast_inverse_indexes = preloads.parallel_fast_inverse_indexes
+
+        image_pre_cti_pass = np.take(image_pre_cti, fast_index_list, axis=1)
+
+        image_post_cti_pass = self.arctic_add_cti(
+            image=image_pre_cti_pass,
+            parallel_ccd=parallel_ccd,
+            parallel_roe=self.parallel_roe,
+            parallel_traps=parallel_trap_list,
+            parallel_express=self.parallel_express,
+            parallel_window_offset=self.parallel_window_offset,
+            parallel_time_start=self.parallel_time_start,
+            parallel_time_stop=self.parallel_time_stop,
+            parallel_prune_n_electrons=self.parallel_prune_n_electrons,
+            parallel_prune_frequency=self.parallel_prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            verbosity=self.verbosity,
         )
-        for i, fast_index in enumerate(fast_index_list):
-            image_pre_cti_pass[i, :] = image_pre_cti[fast_index, :]
 
-        try:
-            image_post_cti_pass = add_cti(
-                image=image_pre_cti_pass,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=self.serial_window_offset,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
+        if cti.serial_trap_list is None:
+            return self._post_cti_array_from(
+                values=np.take(image_post_cti_pass, fast_inverse_indexes, axis=1),
+                data=data,
             )
-        except TypeError:
-            image_post_cti_pass = add_cti(
-                image=image_pre_cti_pass,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=self.serial_window_offset,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                pixel_bounce_list=cti.pixel_bounce_list,
-                verbosity=self.verbosity,
+
+        row_index_list = preloads.serial_fast_post_parallel_index_list
+        row_inverse_indexes = preloads.serial_fast_post_parallel_inverse_indexes
+
+        if row_index_list is None or not clocker_util.stripes_match_groups(
+            data=image_post_cti_pass,
+            for_parallel=False,
+            first_index=row_index_list,
+            inverse=row_inverse_indexes,
+        ):
+            row_index_list, row_inverse_indexes = self.fast_indexes_inverse_from(
+                data=image_post_cti_pass, for_parallel=False
             )
 
-        image_post_cti = np.zeros(shape=data.shape_native)
+            preloads.serial_fast_post_parallel_index_list = row_index_list
+            preloads.serial_fast_post_parallel_inverse_indexes = row_inverse_indexes
 
-        for i, fast_row_list in enumerate(fast_row_lists):
-            for fast_row in fast_row_list:
-                image_post_cti[fast_row, :] = image_post_cti_pass[i, :]
+        image_pre_serial_pass = np.take(
+            np.take(image_post_cti_pass, row_index_list, axis=0),
+            fast_inverse_indexes,
+            axis=1,
+        )
 
-        return aa.Array2D(
-            values=image_post_cti, mask=data.mask, store_native=True, skip_mask=True
+        serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
+
+        image_post_serial_pass = self.arctic_add_cti(
+            image=image_pre_serial_pass,
+            serial_ccd=serial_ccd,
+            serial_roe=self.serial_roe,
+            serial_traps=serial_trap_list,
+            serial_express=self.serial_express,
+            serial_window_offset=self.serial_window_offset,
+            serial_time_start=self.serial_time_start,
+            serial_time_stop=self.serial_time_stop,
+            serial_prune_n_electrons=self.serial_prune_n_electrons,
+            serial_prune_frequency=self.serial_prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            pixel_bounce_list=cti.pixel_bounce_list,
+            verbosity=self.verbosity,
         )
 
+        image_post_cti = np.take(image_post_serial_pass, row_inverse_indexes, axis=0)
+
+        return self._post_cti_array_from(values=image_post_cti, data=data)
+
     def remove_cti(
         self,
         data: aa.Array2D,
@@ -717,74 +1304,84 @@ class Clocker2D(AbstractClocker):
             and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
         """
 
+        if self.n_workers > 1:
+            return self.remove_cti_pool(data=data, cti=cti)
+
         parallel_trap_list, parallel_ccd = self._parallel_traps_ccd_from(cti=cti)
         serial_trap_list, serial_ccd = self._serial_traps_ccd_from(cti=cti)
 
-        parallel_ccd = self.ccd_from(ccd_phase=parallel_ccd)
-        serial_ccd = self.ccd_from(ccd_phase=serial_ccd)
+        image_cti_removed = self.arctic_remove_cti(
+            image=data,
+            n_iterations=self.iterations,
+            parallel_ccd=parallel_ccd,
+            parallel_roe=self.parallel_roe,
+            parallel_traps=parallel_trap_list,
+            parallel_express=self.parallel_express,
+            parallel_window_offset=data.readout_offsets[0],
+            parallel_window_start=self.parallel_window_start,
+            parallel_window_stop=self.parallel_window_stop,
+            parallel_time_start=self.parallel_time_start,
+            parallel_time_stop=self.parallel_time_stop,
+            parallel_prune_n_electrons=self.parallel_prune_n_electrons,
+            parallel_prune_frequency=self.parallel_prune_frequency,
+            serial_ccd=serial_ccd,
+            serial_roe=self.serial_roe,
+            serial_traps=serial_trap_list,
+            serial_express=self.serial_express,
+            serial_window_offset=data.readout_offsets[1],
+            serial_window_start=self.serial_window_start,
+            serial_window_stop=self.serial_window_stop,
+            serial_time_start=self.serial_time_start,
+            serial_time_stop=self.serial_time_stop,
+            serial_prune_n_electrons=self.serial_prune_n_electrons,
+            serial_prune_frequency=self.serial_prune_frequency,
+            allow_negative_pixels=self.allow_negative_pixels,
+            pixel_bounce_list=cti.pixel_bounce_list,
+        )
 
-        try:
-            image_cti_removed = remove_cti(
-                image=data,
-                n_iterations=self.iterations,
-                parallel_ccd=parallel_ccd,
-                parallel_roe=self.parallel_roe,
-                parallel_traps=parallel_trap_list,
-                parallel_express=self.parallel_express,
-                parallel_window_offset=data.readout_offsets[0],
-                parallel_window_start=self.parallel_window_start,
-                parallel_window_stop=self.parallel_window_stop,
-                parallel_time_start=self.parallel_time_start,
-                parallel_time_stop=self.parallel_time_stop,
-                parallel_prune_n_electrons=self.parallel_prune_n_electrons,
-                parallel_prune_frequency=self.parallel_prune_frequency,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
-                serial_window_offset=data.readout_offsets[1],
-                serial_window_start=self.serial_window_start,
-                serial_window_stop=self.serial_window_stop,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                allow_negative_pixels=self.allow_negative_pixels,
-                pixel_bounce_list=cti.pixel_bounce_list,
-            )
-        except TypeError:
-            image_cti_removed = remove_cti(
-                image=data,
-                n_iterations=self.iterations,
-                parallel_ccd=parallel_ccd,
-                parallel_roe=self.parallel_roe,
-                parallel_traps=parallel_trap_list,
-                parallel_express=self.parallel_express,
+        return self._post_cti_array_from(
+            values=image_cti_removed, data=data, header=data.header
+        )
+
+    def remove_cti_pool(
+        self,
+        data: aa.Array2D,
+        cti: CTI2D,
+    ) -> aa.Array2D:
+        """
+        Remove CTI from a 2D dataset using `n_workers` processes.
+
+        This follows the iterative algorithm of arctic's `remove_cti` exactly, where every iteration adds CTI to the
+        current estimate of the CTI-free image and corrects the estimate by the difference between this image and
+        the input data. CTI is added using the worker processes in the same way as `add_cti_pool`.
+
+        Parameters
+        ----------
+        data
+            The 2D data that is clocked via arctic and has CTI removed from it.
+        cti
+            An object which represents the CTI properties of 2D clocking, including the trap species which capture
+            and release electrons and the volume-filling behaviour of the CCD for parallel and serial clocking.
+        """
+        image = np.array(data.native_skip_mask, dtype="float")
+        image_cti_removed = np.copy(image)
+
+        for iteration in range(1, self.iterations + 1):
+            image_add_cti = self._add_cti_pool_from(
+                image=image_cti_removed,
+                cti=cti,
                 parallel_window_offset=data.readout_offsets[0],
-                parallel_window_start=self.parallel_window_start,
-                parallel_window_stop=self.parallel_window_stop,
-                parallel_time_start=self.parallel_time_start,
-                parallel_time_stop=self.parallel_time_stop,
-                parallel_prune_n_electrons=self.parallel_prune_n_electrons,
-                parallel_prune_frequency=self.parallel_prune_frequency,
-                serial_ccd=serial_ccd,
-                serial_roe=self.serial_roe,
-                serial_traps=serial_trap_list,
-                serial_express=self.serial_express,
                 serial_window_offset=data.readout_offsets[1],
-                serial_window_start=self.serial_window_start,
-                serial_window_stop=self.serial_window_stop,
-                serial_time_start=self.serial_time_start,
-                serial_time_stop=self.serial_time_stop,
-                serial_prune_n_electrons=self.serial_prune_n_electrons,
-                serial_prune_frequency=self.serial_prune_frequency,
-                pixel_bounce_list=cti.pixel_bounce_list,
             )
 
-        return aa.Array2D(
-            values=image_cti_removed,
-            mask=data.mask,
-            header=data.header,
-            store_native=True,
-            skip_mask=True,
+            image_cti_removed += image - image_add_cti
+
+            if not self.allow_negative_pixels:
+                image_cti_removed[image_cti_removed < 0.0] = 0.0
+
+            if iteration == 1 and self.iterations >= 2:
+                image_cti_removed[image_cti_removed < 0.0] = 0.0
+
+        return self._post_cti_array_from(
+            values=image_cti_removed, data=data, header=data.header
         )
@@ -6,6 +6,32 @@ from typing import Tuple
 
 import autoarray as aa
 
+from autocti.util import random_util
+
+
+def grid_coordinates_from(
+    lower: np.ndarray, upper: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns every integer pixel-grid coordinate from `lower` (inclusive) to `upper` (exclusive) of every cosmic ray
+    track, and the index of the track each coordinate belongs to, as two flat arrays.
+
+    Parameters
+    ----------
+    lower
+        The first grid coordinate crossed by every track.
+    upper
+        The grid coordinate after the last one crossed by every track.
+    """
+    total = upper - lower
+
+    track = np.repeat(np.arange(len(total)), total)
+    coordinate = (
+        lower[track] + np.arange(len(track)) - (np.cumsum(total) - total)[track]
+    )
+
+    return track, coordinate
+
 
 class SimulatorCosmicRayMap:
     def __init__(
@@ -15,7 +41,7 @@ class SimulatorCosmicRayMap:
         distances: np.ndarray,
         flux_scaling: float = 1.0,
         pixel_scale: float = 0.1,
-        seed=-1,
+        seed: random_util.RandomState = -1,
     ):
         """
         Returns a map of cosmic rays.
@@ -31,7 +57,10 @@ class SimulatorCosmicRayMap:
         settings_dict
             A dictionary of all settings that control the behaviour of the cosmic ray simulator.
         seed
-            Random number seed, set to positive value for reproduceable cosmic ray maps.
+            Random number seed, set to positive value for reproduceable cosmic ray maps. An integer seeds numpy's
+            global random state, whereas a `np.random.Generator` or `np.random.SeedSequence` gives an independent
+            stream the cosmic rays are drawn from without using the global random state (e.g. for simulating frames
+            concurrently).
         """
 
         self.shape_native = shape_native
@@ -44,6 +73,15 @@ class SimulatorCosmicRayMap:
 
         self.pixel_scale = pixel_scale
 
+        self._length_interpolator = None
+        self._distance_interpolator = None
+
+        self.generator = None
+
+        if random_util.is_stream(seed):
+            self.generator = random_util.generator_from(rng=seed)
+            return
+
         if seed == -1:
             seed = np.random.randint(
                 0, 1e9
@@ -58,7 +96,7 @@ class SimulatorCosmicRayMap:
         shape_native: Tuple[int, int],
         flux_scaling: float = 1.0,
         pixel_scale: float = 0.1,
-        seed=-1,
+        seed: random_util.RandomState = -1,
     ) -> "SimulatorCosmicRayMap":
         """
         Creates a cosmic ray simulator where the length and distance arrays are loaded from user supplied .fits files.
@@ -96,7 +134,7 @@ class SimulatorCosmicRayMap:
         shape_native: Tuple[int, int],
         flux_scaling: float = 1.0,
         pixel_scale: float = 0.1,
-        seed=-1,
+        seed: random_util.RandomState = -1,
     ) -> "SimulatorCosmicRayMap":
         """
         Creates a cosmic ray simulator where the length and distance arrays are loaded from the default files stored
@@ -128,9 +166,49 @@ class SimulatorCosmicRayMap:
             seed=seed,
         )
 
-    def intercepts_from(self, luminosities, x0, y0, lengths, angles, flux_scaling):
+    @property
+    def length_interpolator(self) -> interp1d:
+        """
+        The inverse cumulative distribution function of the cosmic ray track lengths, which is built once and reused
+        for every batch of cosmic rays.
+        """
+        if self._length_interpolator is None:
+            try:
+                self._length_interpolator = interp1d(
+                    self.lengths[:, 1], self.lengths[:, 0], kind="slinear"
+                )
+            except ValueError:
+                self._length_interpolator = interp1d(
+                    self.lengths[:, 1], self.lengths[:, 0], kind="linear"
+                )
+
+        return self._length_interpolator
+
+    @property
+    def distance_interpolator(self) -> interp1d:
+        """
+        The inverse cumulative distribution function of the cosmic ray energies, which is built once and reused
+        for every batch of cosmic rays.
+        """
+        if self._distance_interpolator is None:
+            self._distance_interpolator = interp1d(
+                self.distances[:, 1], self.distances[:, 0], kind="slinear"
+            )
+
+        return self._distance_interpolator
+
+    def deposits_from(
+        self, luminosities, x0, y0, lengths, angles, flux_scaling
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Derive cosmic ray streak intercept points.
+        Derive the charge deposited in the pixels crossed by cosmic ray streaks, returned as the y and x pixel
+        indexes and value of every deposit in the order of the tracks.
+
+        The intercepts of every track with the pixel grid are computed for all tracks at once. The intercepts of each
+        track are sorted along the track and every interval between consecutive intercepts deposits a charge
+        proportional to its path length in the pixel it traverses.
+
+        A track is drawn for every luminosity, using the first entries of the position, length and angle arrays.
 
         Parameters
         ----------
@@ -145,8 +223,13 @@ class SimulatorCosmicRayMap:
         angles
             The orientation angles of the cosmic ray tracks.
         """
-        # create empty arrays
-        image = np.zeros((self.shape_native[0], self.shape_native[1]), dtype=np.float64)
+        total_tracks = len(luminosities)
+
+        luminosities = np.asarray(luminosities, dtype=np.float64)
+        x0 = np.asarray(x0, dtype=np.float64)[:total_tracks]
+        y0 = np.asarray(y0, dtype=np.float64)[:total_tracks]
+        lengths = np.asarray(lengths, dtype=np.float64)[:total_tracks]
+        angles = np.asarray(angles, dtype=np.float64)[:total_tracks]
 
         # x and y shifts
         dx = lengths * np.cos(angles) / 2.0  # beware! 0<phi< pi, dx < 0
@@ -180,75 +263,115 @@ class SimulatorCosmicRayMap:
 
         offending_delta = 1.0
 
-        # loop over the individual events
-        for i, luminosity in enumerate(luminosities):
-            n = 0  # count the intercepts
-
-            u = []
-            x = []
-            y = []
-
-            # Compute X intercepts on the pixel grid
-            if ilo[i] < ihi[i]:
-                for xcoord in range(ilo[i], ihi[i]):
-                    ok = (xcoord - x0[i]) / dx[i]
-                    if np.abs(ok) <= offending_delta:
-                        n += 1
-                        u.append(ok)
-                        x.append(xcoord)
-                        y.append(y0[i] + ok * dy[i])
-            else:
-                for xcoord in range(ihi[i], ilo[i]):
-                    ok = (xcoord - x0[i]) / dx[i]
-                    if np.abs(ok) <= offending_delta:
-                        n += 1
-                        u.append(ok)
-                        x.append(xcoord)
-                        y.append(y0[i] + ok * dy[i])
-
-            # Compute Y intercepts on the pixel grid
-            if jlo[i] < jhi[i]:
-                for ycoord in range(jlo[i], jhi[i]):
-                    ok = (ycoord - y0[i]) / dy[i]
-                    if np.abs(ok) <= offending_delta:
-                        n += 1
-                        u.append(ok)
-                        x.append(x0[i] + ok * dx[i])
-                        y.append(ycoord)
-            else:
-                for ycoord in range(jhi[i], jlo[i]):
-                    ok = (ycoord - y0[i]) / dy[i]
-                    if np.abs(ok) <= offending_delta:
-                        n += 1
-                        u.append(ok)
-                        x.append(x0[i] + ok * dx[i])
-                        y.append(ycoord)
-
-            # check if no intercepts were found
-            if n < 1:
-                xc = int(np.floor(x0[i]))
-                yc = int(np.floor(y0[i]))
-                image[yc, xc] += luminosity * flux_scaling
-
-            # Find the arguments that sort the intersections along the track
-            u = np.asarray(u)
-            x = np.asarray(x)
-            y = np.asarray(y)
-
-            args = np.argsort(u)
-
-            u = u[args]
-            x = x[args]
-            y = y[args]
-
-            # Decide which cell each interval traverses, and the path length
-            for j in range(1, n - 1):
-                w = (u[j + 1] - u[j]) / 2.0
-                cx = int(1 + np.floor((x[j + 1] + x[j]) / 2.0))
-                cy = int(1 + np.floor((y[j + 1] + y[j]) / 2.0))
-
-                if 0 <= cx < self.shape_native[1] and 0 <= cy < self.shape_native[0]:
-                    image[cy, cx] += w * luminosity * flux_scaling
+        # Compute the X and Y intercepts on the pixel grid of every track
+        x_track, x_coord = grid_coordinates_from(
+            lower=np.minimum(ilo, ihi), upper=np.maximum(ilo, ihi)
+        )
+        y_track, y_coord = grid_coordinates_from(
+            lower=np.minimum(jlo, jhi), upper=np.maximum(jlo, jhi)
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_ok = (x_coord - x0[x_track]) / dx[x_track]
+            y_ok = (y_coord - y0[y_track]) / dy[y_track]
+
+        x_keep = np.abs(x_ok) <= offending_delta
+        y_keep = np.abs(y_ok) <= offending_delta
+
+        x_track = x_track[x_keep]
+        x_ok = x_ok[x_keep]
+        x_coord = x_coord[x_keep]
+
+        y_track = y_track[y_keep]
+        y_ok = y_ok[y_keep]
+        y_coord = y_coord[y_keep]
+
+        track = np.concatenate((x_track, y_track))
+        u = np.concatenate((x_ok, y_ok))
+        x = np.concatenate((x_coord, x0[y_track] + y_ok * dx[y_track]))
+        y = np.concatenate((y0[x_track] + x_ok * dy[x_track], y_coord))
+
+        # Find the arguments that sort the intersections along every track
+        args = np.lexsort((u, track))
+
+        track = track[args]
+        u = u[args]
+        x = x[args]
+        y = y[args]
+
+        n = np.bincount(track, minlength=total_tracks)
+        index = np.arange(len(track)) - (np.cumsum(n) - n)[track]
+
+        # Decide which cell each interval traverses, and the path length
+        interval = (index >= 1) & (index <= n[track] - 2)
+        interval_track = track[interval]
+
+        start = interval[:-1]
+
+        w = (u[1:][start] - u[:-1][start]) / 2.0
+        cx = (1 + np.floor((x[1:][start] + x[:-1][start]) / 2.0)).astype(int)
+        cy = (1 + np.floor((y[1:][start] + y[:-1][start]) / 2.0)).astype(int)
+
+        inside = (
+            (0 <= cx)
+            & (cx < self.shape_native[1])
+            & (0 <= cy)
+            & (cy < self.shape_native[0])
+        )
+
+        interval_track = interval_track[inside]
+        interval_value = w[inside] * luminosities[interval_track] * flux_scaling
+
+        # Tracks with no intercepts deposit all their charge in their central pixel
+        central_track = np.flatnonzero(n < 1)
+
+        deposit_track = np.concatenate((central_track, interval_track))
+        deposit_y = np.concatenate(
+            (np.floor(y0[central_track]).astype(int), cy[inside])
+        )
+        deposit_x = np.concatenate(
+            (np.floor(x0[central_track]).astype(int), cx[inside])
+        )
+        deposit_value = np.concatenate(
+            (luminosities[central_track] * flux_scaling, interval_value)
+        )
+
+        args = np.argsort(deposit_track, kind="stable")
+
+        return deposit_y[args], deposit_x[args], deposit_value[args]
+
+    def intercepts_from(self, luminosities, x0, y0, lengths, angles, flux_scaling):
+        """
+        Derive cosmic ray streak intercept points, returning an image of the charge deposited by every track.
+
+        The deposits of every track are computed via `deposits_from` and added to the image via a single `np.add.at`
+        call in the order of the tracks.
+
+        Parameters
+        ----------
+        luminosities
+            The luminosities of the cosmic ray tracks.
+        x0
+            Central positions of the cosmic ray tracks in x-direction.
+        y0
+            Central positions of the cosmic ray tracks in y-direction.
+        lengths
+            The lengths of the cosmic ray tracks.
+        angles
+            The orientation angles of the cosmic ray tracks.
+        """
+        image = np.zeros((self.shape_native[0], self.shape_native[1]), dtype=np.float64)
+
+        deposit_y, deposit_x, deposit_value = self.deposits_from(
+            luminosities=luminosities,
+            x0=x0,
+            y0=y0,
+            lengths=lengths,
+            angles=angles,
+            flux_scaling=flux_scaling,
+        )
+
+        np.add.at(image, (deposit_y, deposit_x), deposit_value)
 
         return image
 
@@ -258,6 +381,13 @@ class SimulatorCosmicRayMap:
         """
         Return a cosmic ray, where cosmic rays are generated using the lengths and distance of the class instance.
 
+        Cosmic rays are drawn in batches until the covering fraction is reached. The number of pixels covered is
+        updated from the pixels each batch deposits charge in, rather than by counting the whole map. The size of
+        every batch is 90% of the number of cosmic rays still needed, estimated from the pixels covered per cosmic
+        ray so far (the first batch is half the initial estimate), such that the covering fraction is reached in a
+        few batches. A batch is never smaller than 5% of
+        the initial estimate of the total number of cosmic rays, which bounds how far the covering fraction is
+        exceeded.
 
         Parameters
         ----------
@@ -271,65 +401,78 @@ class SimulatorCosmicRayMap:
         # Prepare the CR map
         cosmic_ray_map = np.zeros((self.shape_native[0], self.shape_native[1]))
 
-        # how many events to draw at once, too large number leads to exceeding the covering fraction
+        total_pixels = self.shape_native[0] * self.shape_native[1]
 
         cdf = self.lengths[:, 1]
         ucr = self.lengths[:, 0]
         approx_pdf = (cdf[1:] - cdf[0:-1]) / (ucr[1:] - ucr[0:-1])
         average_length = (approx_pdf * ucr[1:]).sum() / approx_pdf.sum()
-        total_guess = (
-            cover_fraction
-            / 100.0
-            * self.shape_native[1]
-            * self.shape_native[0]
-            / average_length
-        )
+        total_guess = cover_fraction / 100.0 * total_pixels / average_length
 
         # allocating for a max. 5% error in cover. fraction, aprox.
         # Notice that the minimum number of events will be one...
-        cr_n = max(int(total_guess * 0.05), 1)
+        cr_n_min = max(int(total_guess * 0.05), 1)
 
         covering = 0.0
-        lengths = []
-        energies = []
+        area = 0
         total_cosmics = 0
 
+        random = np.random if self.generator is None else self.generator
+
         while covering < cover_fraction:
+            # estimate how many more events reach the covering fraction from the area covered per event so far,
+            # where the first batch is half the initial guess as the area covered per event is not yet known
+            if area > 0:
+                batch_fraction = 0.9
+                area_per_cosmic = area / total_cosmics
+            else:
+                batch_fraction = 0.5
+                area_per_cosmic = average_length
+
+            cr_n = max(
+                int(
+                    batch_fraction
+                    * (cover_fraction / 100.0 * total_pixels - area)
+                    / area_per_cosmic
+                ),
+                cr_n_min,
+            )
+
             # pseudo-random numbers taken from a uniform distribution between 0 and 1
-            luck = np.random.rand(cr_n)
+            luck = random.random(cr_n)
 
             # draw the length of the tracks
-            try:
-                ius = interp1d(self.lengths[:, 1], self.lengths[:, 0], kind="slinear")
-            except ValueError:
-                ius = interp1d(self.lengths[:, 1], self.lengths[:, 0], kind="linear")
-            length = ius(luck)
+            length = self.length_interpolator(luck)
 
             if limit is None:
-                ius = interp1d(
-                    self.distances[:, 1], self.distances[:, 0], kind="slinear"
-                )
-                energy = ius(luck)
+                energy = self.distance_interpolator(luck)
             else:
                 # set the energy directly to the limit
-                energy = np.asarray([limit])
-
-            lengths += length.tolist()
-            energies += energy.tolist()
+                energy = np.full(cr_n, limit)
 
             # Choose the properties such as positions and an angle from a random Uniform dist
-            x = self.shape_native[1] * np.random.rand(int(np.floor(cr_n)))
-            y = self.shape_native[0] * np.random.rand(int(np.floor(cr_n)))
-            angle = np.pi * np.random.rand(int(np.floor(cr_n)))
+            x = self.shape_native[1] * random.random(cr_n)
+            y = self.shape_native[0] * random.random(cr_n)
+            angle = np.pi * random.random(cr_n)
 
             # find the intercepts
-            cosmic_ray_map += self.intercepts_from(
+            deposit_y, deposit_x, deposit_value = self.deposits_from(
                 energy, x, y, length, angle, self.flux_scaling
             )
 
+            # count the pixels covered for the first time by this batch
+            deposit_index = np.ravel_multi_index(
+                (deposit_y, deposit_x), cosmic_ray_map.shape
+            )
+
+            covered_index = np.unique(deposit_index[deposit_value != 0.0])
+
+            area += np.count_nonzero(cosmic_ray_map.flat[covered_index] == 0.0)
+
+            np.add.at(cosmic_ray_map, (deposit_y, deposit_x), deposit_value)
+
             # count the covering factor
-            area = np.count_nonzero(cosmic_ray_map)
-            covering = 100.0 * area / (self.shape_native[1] * self.shape_native[0])
+            covering = 100.0 * area / total_pixels
 
             total_cosmics += cr_n
 
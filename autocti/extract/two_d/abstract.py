@@ -6,6 +6,7 @@ import autoarray as aa
 from autocti.charge_injection.imaging.imaging import ImagingCI
 from autocti.dataset_1d.dataset_1d.dataset_1d import Dataset1D
 from autocti.extract.settings import SettingsExtract
+from autocti.extract.two_d import extract_2d_util
 from autocti.layout.one_d import Layout1D
 from autocti.mask.mask_2d import Mask2D
 
@@ -346,12 +347,14 @@ class Extract2D:
 
         mask_list = np.asarray([array.mask[region.slice] for region in region_list])
 
-        stacked_array_2d = np.mean(arr_list, axis=0, where=np.invert(mask_list))
+        stacked_array_2d = extract_2d_util.binned_array_from(
+            array=arr_list, mask=mask_list, axis=0
+        )
 
-        binned_array_1d = np.mean(
-            stacked_array_2d,
+        binned_array_1d = extract_2d_util.binned_array_from(
+            array=stacked_array_2d,
+            mask=np.isnan(stacked_array_2d),
             axis=self.binning_axis,
-            where=np.invert(np.isnan(stacked_array_2d)),
         )
         return aa.Array1D.no_mask(
             values=binned_array_1d, pixel_scales=array.pixel_scale
@@ -464,11 +467,15 @@ class Extract2D:
         settings: SettingsExtract,
         noise_sigma: float,
         noise_seed: int = -1,
+        generator: Optional[np.random.Generator] = None,
     ) -> aa.Array2D:
         """
         Adds Gaussian noise of an input sigma value to the regions of the `Extract` object and returns the overall
         input array with this noise added.
 
+        If a `generator` is input the noise is drawn from it, otherwise the `noise_seed` seeds numpy's global random
+        state.
+
         Parameters
         ----------
         array
@@ -480,6 +487,8 @@ class Extract2D:
             The sigma value (standard deviation) of the Gaussian from which noise values are drann.
         noise_seed
             The seed of the random number generator, used for the random noises maps.
+        generator
+            The random number generator the noise is drawn from, which does not use numpy's global random state.
         """
 
         region_list = self.region_list_from(settings=settings)
@@ -489,10 +498,13 @@ class Extract2D:
         array = array.native
 
         for arr, region in zip(array_2d_list, region_list):
-            array[
-                region.y0 : region.y1, region.x0 : region.x1
-            ] = aa.preprocess.data_with_gaussian_noise_added(
-                data=arr, sigma=noise_sigma, seed=noise_seed
-            )
+            if generator is None:
+                arr_with_noise = aa.preprocess.data_with_gaussian_noise_added(
+                    data=arr, sigma=noise_sigma, seed=noise_seed
+                )
+            else:
+                arr_with_noise = arr + generator.normal(0.0, noise_sigma, arr.shape)
+
+            array[region.y0 : region.y1, region.x0 : region.x1] = arr_with_noise
 
         return array
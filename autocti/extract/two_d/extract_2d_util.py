@@ -1,7 +1,11 @@
-from typing import Tuple
+import numpy as np
+import warnings
+from typing import List, Tuple, Union
 
 import autoarray as aa
 
+from autocti import exc
+
 
 def binned_region_1d_fpr_from(pixels: Tuple[int, int]) -> aa.Region1D:
     """
@@ -54,3 +58,78 @@ def binned_region_1d_eper_from(pixels: Tuple[int, int]) -> aa.Region1D:
     elif pixels[1] >= 0:
         return aa.Region1D(region=(0, -pixels[0]))
     return aa.Region1D(region=(0, pixels[1] - pixels[0]))
+
+
+def binned_array_from(
+    array: np.ndarray,
+    mask: np.ndarray,
+    axis: Union[int, Tuple[int, ...]],
+) -> np.ndarray:
+    """
+    Returns the mean of the unmasked values of an array taken along the input axis or axes, which is how arrays
+    (e.g. the data and pre-cti data) are binned when a 1D dataset is extracted from a 2D CTI dataset.
+
+    Binning every array of a dataset via this function ensures that they are binned over the same pixels, for
+    example that the pre-cti data is not binned over pixels which are masked in the data. A row or column whose
+    values are all masked gives a value of NaN.
+
+    Parameters
+    ----------
+    array
+        The array (e.g. the extracted regions of a 2D array stacked into a 3D array) which is binned.
+    mask
+        The mask of the array, where `True` entries are omitted from the mean.
+    axis
+        The axis or axes of the array which are binned.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+
+        return np.mean(array, axis=axis, where=np.invert(mask))
+
+
+def value_list_from(
+    array: np.ndarray,
+    mask: np.ndarray,
+    axis: Union[int, Tuple[int, ...]],
+    value_str: str,
+) -> List[float]:
+    """
+    Returns the median, mean or standard deviation of the unmasked values of an array (e.g. the stacked FPRs of every
+    charge injection region) taken along the input axis or axes, for example giving one value per column when the
+    parallel axis is reduced.
+
+    Masked values are set to NaN and the values are computed via a single NaN-aware reduction over the whole array,
+    instead of boolean indexing every row or column separately. A row or column whose values are all masked gives
+    a value of NaN.
+
+    Parameters
+    ----------
+    array
+        The array (e.g. the extracted regions of a 2D array stacked into a 3D array) the values are computed from.
+    mask
+        The mask of the array, where `True` entries are omitted from every value.
+    axis
+        The axis or axes of the array which are reduced to compute each value.
+    value_str
+        The value computed, which is either `median`, `mean` or `std`, where any other string raises an
+        `ExtractException`.
+    """
+    array = np.where(mask, np.nan, array)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+
+        if value_str == "median":
+            value_array = np.nanmedian(array, axis=axis)
+        elif value_str == "mean":
+            value_array = np.nanmean(array, axis=axis)
+        elif value_str == "std":
+            value_array = np.nanstd(array, axis=axis)
+        else:
+            raise exc.ExtractException(
+                f"The value_str {value_str} is not supported, it must be one of "
+                "median, mean or std."
+            )
+
+    return [float(value) for value in value_array]
@@ -1,3 +1,4 @@
+import numpy as np
 from copy import deepcopy
 from typing import Tuple
 
@@ -5,7 +6,9 @@ import autoarray as aa
 
 from autocti.charge_injection.layout import Layout2DCI
 from autocti.charge_injection.imaging.imaging import ImagingCI
+from autocti.extract.two_d import extract_2d_util
 from autocti.mask.mask_2d import Mask2D
+from autocti.util import dtype_util
 
 
 class Extract2DParallelCalibration:
@@ -145,10 +148,12 @@ class Extract2DParallelCalibration:
         extraction_region = self.extraction_region_from(columns=columns)
         mask_2d = self.mask_2d_from(mask=array.mask, columns=columns)
 
-        return aa.Array2D(
-            values=array.native[extraction_region.slice],
+        return dtype_util.array_2d_view_from(
+            array=array,
             mask=mask_2d,
-            header=array.header,
+            values=dtype_util.native_array_2d_from(array=array).values[
+                extraction_region.slice
+            ],
         )
 
     def extracted_layout_from(self, layout, columns: Tuple[int, int]) -> Layout2DCI:
@@ -279,3 +284,86 @@ class Extract2DParallelCalibration:
         )
 
         return dataset.apply_mask(mask=mask)
+
+    def dataset_1d_from(self, dataset: ImagingCI, columns: Tuple[int, int]):
+        """
+        Returns a 1D dataset of the parallel calibration columns of a charge injection imaging dataset, which are
+        binned into a single column by taking the mean of every row over its unmasked pixels via
+        `extract_2d_util.binned_array_from`.
+
+        The pre-cti data is the charge-free input which is clocked to model the data, therefore masking the data
+        (e.g. a cosmic ray or a full row) does not remove injected charge from it and every row of the pre-cti data
+        is binned over all of its pixels.
+
+        For a parallel-only CTI model and a uniform charge injection, every parallel calibration column has the same
+        pre-cti data and therefore the same post-cti data after parallel clocking. The binned 1D dataset therefore
+        contains almost all of the information of the 2D dataset on the parallel CTI model, but the likelihood of
+        a fit to it is computed by clocking one column via arctic.
+
+        The noise of every binned pixel is the noise of its unmasked pixels added in quadrature and divided by their
+        number. Rows which are fully masked are masked in the 1D dataset.
+
+        Parameters
+        ----------
+        dataset
+            The charge injection imaging dataset which is binned.
+        columns
+            The columns of the charge injection regions which are extracted and binned, relative to the left column
+            of the first charge injection region.
+        """
+        from autocti.dataset_1d.dataset_1d.dataset_1d import Dataset1D
+        from autocti.layout.one_d import Layout1D
+
+        extraction_region = self.extraction_region_from(columns=columns)
+
+        mask = np.asarray(dataset.mask[extraction_region.slice])
+        unmasked = np.invert(mask)
+
+        total_pixels = np.sum(unmasked, axis=1)
+        binned_mask = total_pixels == 0
+        total_pixels = np.where(binned_mask, 1, total_pixels)
+
+        data = np.asarray(dataset.data.native)[extraction_region.slice]
+        noise_map = np.asarray(dataset.noise_map.native)[extraction_region.slice]
+        pre_cti_data = np.asarray(dataset.pre_cti_data.native)[extraction_region.slice]
+
+        binned_data = np.where(
+            binned_mask,
+            0.0,
+            extract_2d_util.binned_array_from(array=data, mask=mask, axis=1),
+        )
+        binned_noise_map = np.where(
+            binned_mask,
+            1.0,
+            np.sqrt(np.sum(np.square(noise_map), axis=1, where=unmasked))
+            / total_pixels,
+        )
+
+        pixel_scales = (dataset.data.pixel_scales[0],)
+
+        header = aa.Header(readout_offsets=(dataset.pre_cti_data.readout_offsets[0],))
+
+        dataset_1d = Dataset1D(
+            data=aa.Array1D.no_mask(values=binned_data, pixel_scales=pixel_scales),
+            noise_map=aa.Array1D.no_mask(
+                values=binned_noise_map, pixel_scales=pixel_scales
+            ),
+            pre_cti_data=aa.Array1D.no_mask(
+                values=np.mean(pre_cti_data, axis=1),
+                pixel_scales=pixel_scales,
+                header=header,
+            ),
+            layout=Layout1D(
+                shape_1d=(binned_data.shape[0],),
+                region_list=[
+                    aa.Region1D(region=(region.y0, region.y1))
+                    for region in self.region_list
+                ],
+            ),
+            fpr_value=dataset.fpr_value,
+            settings_dict=dataset.settings_dict,
+        )
+
+        return dataset_1d.apply_mask(
+            mask=aa.Mask1D(mask=binned_mask, pixel_scales=pixel_scales)
+        )
@@ -4,6 +4,7 @@ from typing import List, Optional, Tuple
 import autoarray as aa
 
 from autocti.extract.two_d.abstract import Extract2D
+from autocti.extract.two_d import extract_2d_util
 from autocti.extract.settings import SettingsExtract
 
 
@@ -39,8 +40,6 @@ class Extract2DSerial(Extract2D):
     def _value_list_from(
         self, array: aa.Array2D, value_str: str, settings: SettingsExtract
     ):
-        value_list = []
-
         arr_list = [
             array.native[region.slice]
             for region in self.region_list_from(settings=settings)
@@ -51,23 +50,12 @@ class Extract2DSerial(Extract2D):
             for region in self.region_list_from(settings=settings)
         ]
 
-        arr_stack = np.stack(arr_list)
-        mask_stack = np.stack(mask_list)
-
-        for row_index in range(arr_list[0].shape[0]):
-            arr_extract = arr_stack[:, row_index, :]
-            mask_extract = mask_stack[:, row_index, :]
-
-            arr_unmasked = arr_extract[np.invert(mask_extract)]
-
-            if value_str == "median":
-                value_list.append(float(np.median(arr_unmasked)))
-            elif value_str == "mean":
-                value_list.append(float(np.mean(arr_unmasked)))
-            elif value_str == "std":
-                value_list.append(float(np.std(arr_unmasked)))
-
-        return value_list
+        return extract_2d_util.value_list_from(
+            array=np.stack(arr_list),
+            mask=np.stack(mask_list),
+            axis=(0, 2),
+            value_str=value_str,
+        )
 
     def median_list_from(
         self, array: aa.Array2D, settings: SettingsExtract
@@ -110,8 +98,6 @@ class Extract2DSerial(Extract2D):
     def _value_list_of_lists_from(
         self, array: aa.Array2D, value_str: str, settings: SettingsExtract
     ):
-        value_lists = []
-
         arr_list = [
             array.native[region.slice]
             for region in self.region_list_from(settings=settings)
@@ -122,27 +108,12 @@ class Extract2DSerial(Extract2D):
             for region in self.region_list_from(settings=settings)
         ]
 
-        for array_2d, mask in zip(arr_list, mask_list):
-            value_list = []
-
-            for row_index in range(array_2d.shape[0]):
-                arr_extract = array_2d[row_index, :]
-                mask_extract = mask[row_index, :]
-
-                arr_unmasked = arr_extract[np.invert(mask_extract)]
-
-                if value_str == "median":
-                    value = float(np.median(arr_unmasked))
-                elif value_str == "mean":
-                    value = float(np.mean(arr_unmasked))
-                elif value_str == "std":
-                    value = float(np.std(arr_unmasked))
-
-                value_list.append(value)
-
-            value_lists.append(value_list)
-
-        return value_lists
+        return [
+            extract_2d_util.value_list_from(
+                array=array_2d, mask=mask, axis=1, value_str=value_str
+            )
+            for array_2d, mask in zip(arr_list, mask_list)
+        ]
 
     def median_list_of_lists_from(
         self, array: aa.Array2D, settings: SettingsExtract
@@ -6,6 +6,7 @@ import autoarray as aa
 
 from autocti.charge_injection.imaging.imaging import ImagingCI
 from autocti.mask.mask_2d import Mask2D
+from autocti.util import dtype_util
 
 
 class Extract2DSerialCalibration:
@@ -63,9 +64,9 @@ class Extract2DSerialCalibration:
                 self.region_list,
             )
         )
-        return list(
-            map(lambda region: array.native[region.slice], calibration_region_list)
-        )
+        array = dtype_util.native_array_2d_from(array=array)
+
+        return list(map(lambda region: array[region.slice], calibration_region_list))
 
     def mask_2d_from(self, mask: aa.Mask2D, rows: Tuple[int, int]) -> Mask2D:
         """
@@ -182,10 +183,8 @@ class Extract2DSerialCalibration:
 
         mask_2d = self.mask_2d_from(mask=array.mask, rows=rows)
 
-        return aa.Array2D(
-            values=new_array,
-            mask=mask_2d,
-            header=array.header,
+        return dtype_util.array_2d_view_from(
+            array=array, mask=mask_2d, values=new_array
         )
 
     def extracted_layout_from(self, layout, new_shape_2d, rows):
@@ -9,6 +9,46 @@ from autocti.extract.settings import SettingsExtract
 from autocti.layout.two_d import Layout2D
 
 
+def buffed_mask_from(mask: np.ndarray, buffer: int, axis: int) -> np.ndarray:
+    """
+    Returns a boolean mask where every `True` entry of the input mask is extended by `buffer` pixels in the positive
+    direction of the input axis (e.g. away from the readout register for `axis=0`), which is a one-sided binary
+    dilation of the mask.
+
+    Entry `i` of the buffed mask is `True` if any of the entries `i - buffer` to `i` of the input mask are. This is
+    computed for every entry at once via the difference of the cumulative sum of the mask along the axis, so the
+    run time does not depend on the number of `True` entries or the size of the buffer.
+
+    A negative `buffer` returns an all `False` mask.
+
+    Parameters
+    ----------
+    mask
+        The 2D boolean mask (e.g. flagging cosmic rays) which is buffed.
+    buffer
+        The number of pixels every `True` entry is extended by.
+    axis
+        The axis the mask is buffed along, where 0 is the parallel direction and 1 the serial direction.
+    """
+    if buffer < 0:
+        return np.zeros(mask.shape, dtype="bool")
+
+    cumulative = np.cumsum(mask, axis=axis)
+
+    shifted = np.zeros(mask.shape, dtype=cumulative.dtype)
+
+    if buffer + 1 < mask.shape[axis]:
+        source = [slice(None), slice(None)]
+        target = [slice(None), slice(None)]
+
+        source[axis] = slice(None, mask.shape[axis] - buffer - 1)
+        target[axis] = slice(buffer + 1, None)
+
+        shifted[tuple(target)] = cumulative[tuple(source)]
+
+    return cumulative - shifted > 0
+
+
 class SettingsMask2D:
     def __init__(
         self,
@@ -175,32 +215,25 @@ class Mask2D(aa.Mask2D):
 
         cosmic_ray_mask = (cosmic_ray_map.native > 0.0).astype("bool")
 
-        for y in range(mask.shape[0]):
-            for x in range(mask.shape[1]):
-                if cosmic_ray_mask[y, x]:
-                    x0 = int(x)
-
-                    y0 = y
-                    y1 = y + 1 + settings.cosmic_ray_parallel_buffer
-
-                    y1 = mask.shape[0] if y1 > mask.shape[0] else y1
-
-                    mask[y0:y1, x] = True
-
-                    x1 = int(x + 1 + settings.cosmic_ray_serial_buffer)
-
-                    x1 = mask.shape[1] if x1 > mask.shape[1] else x1
-
-                    mask[y, x0:x1] = True
+        parallel_mask = buffed_mask_from(
+            mask=cosmic_ray_mask, buffer=settings.cosmic_ray_parallel_buffer, axis=0
+        )
 
-                    y0 = y
-                    y1 = y + 1 + settings.cosmic_ray_diagonal_buffer
-                    x1 = int(x + 1 + settings.cosmic_ray_diagonal_buffer)
+        serial_mask = buffed_mask_from(
+            mask=cosmic_ray_mask, buffer=settings.cosmic_ray_serial_buffer, axis=1
+        )
 
-                    y1 = mask.shape[0] if y1 > mask.shape[0] else y1
-                    x1 = mask.shape[1] if x1 > mask.shape[1] else x1
+        diagonal_mask = buffed_mask_from(
+            mask=buffed_mask_from(
+                mask=cosmic_ray_mask,
+                buffer=settings.cosmic_ray_diagonal_buffer,
+                axis=0,
+            ),
+            buffer=settings.cosmic_ray_diagonal_buffer,
+            axis=1,
+        )
 
-                    mask[y0:y1, x0:x1] = True
+        mask[:, :] = parallel_mask | serial_mask | diagonal_mask
 
         return mask
 
@@ -0,0 +1,257 @@
+import pickle
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+
+import autofit as af
+
+_shared_analysis_dict = {}
+
+
+def parameter_vector_from(
+    model: af.AbstractPriorModel, instance: af.ModelInstance
+) -> List[float]:
+    """
+    Returns the parameter vector of an instance of a model, which is the value of every free parameter of the
+    instance in the order of the model's priors, such that `model.instance_from_vector` recreates the instance.
+
+    A prior shared by many parameters (e.g. two traps with the same density) is one free parameter, therefore its
+    value is read once, from the first path to it, following the unique priors ordered by id which
+    `model.instance_from_vector` uses.
+
+    Parameters
+    ----------
+    model
+        The model the instance was created from.
+    instance
+        An instance of the model (whose parameters have been set via a non-linear search).
+    """
+    vector = []
+
+    for path in model.unique_prior_paths:
+        parent = instance.object_for_path(path[:-1])
+
+        if isinstance(parent, float):
+            # Models of float subclasses (e.g. `HyperCINoiseScalar`) are instantiated as the value of their only
+            # parameter, which is therefore not an attribute of the instance.
+            vector.append(float(parent))
+        else:
+            vector.append(float(getattr(parent, path[-1])))
+
+    return vector
+
+
+def _shared_analyses_from(
+    name: str, pickle_size: int, buffer_edges: List[Tuple[int, int]]
+):
+    """
+    Returns the model and analyses stored in the shared memory block of the input name, which a worker process
+    unpickles once and then reuses for every likelihood evaluation.
+
+    The ndarrays of the analyses (e.g. the data, noise-map and preloads) are not copied, but are read-only views of
+    the shared memory.
+    """
+    if name not in _shared_analysis_dict:
+        shared_memory = SharedMemory(name=name)
+
+        buffer_list = [
+            shared_memory.buf[start:stop].toreadonly() for start, stop in buffer_edges
+        ]
+
+        model, analysis_list = pickle.loads(
+            shared_memory.buf[:pickle_size], buffers=buffer_list
+        )
+
+        _shared_analysis_dict[name] = (shared_memory, model, analysis_list)
+
+    return _shared_analysis_dict[name][1:]
+
+
+def _log_likelihood_from(
+    name: str,
+    pickle_size: int,
+    buffer_edges: List[Tuple[int, int]],
+    analysis_index: int,
+    vector: List[float],
+) -> float:
+    """
+    Returns the log likelihood of one analysis stored in shared memory for the input parameter vector.
+
+    This is the function every worker process of a `CombinedAnalysisPool` runs.
+    """
+    model, analysis_list = _shared_analyses_from(
+        name=name, pickle_size=pickle_size, buffer_edges=buffer_edges
+    )
+
+    return analysis_list[analysis_index].log_likelihood_function(
+        instance=model.instance_from_vector(vector=vector)
+    )
+
+
+def _close(executor_list, shared_memory_list):
+    for executor in executor_list:
+        executor.shutdown(wait=False)
+
+    for shared_memory in shared_memory_list:
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+class CombinedAnalysisPool(af.CombinedAnalysis):
+    def __init__(
+        self,
+        *analyses: af.Analysis,
+        n_workers: Optional[int] = None,
+        model: Optional[af.AbstractPriorModel] = None,
+    ):
+        """
+        Sums the log likelihoods of many analyses fitting the same model (e.g. an `AnalysisImagingCI` for every
+        charge injection dataset at a different injection level), where every analysis is evaluated concurrently
+        by a persistent pool of worker processes.
+
+        The model and analyses are pickled once into a shared memory block the first time the likelihood is
+        evaluated. The ndarrays of the analyses (e.g. the data, noise-map and `Preloads`) are stored out-of-band, such
+        that every worker process uses read-only views of the same memory rather than its own copy. Every likelihood
+        evaluation then only sends the parameter vector of the instance to the worker processes, which create the
+        instance via the model.
+
+        The model is set by `modify_before_fit`, which is called by the non-linear search before the model-fit
+        begins. Before this (or if `n_workers` is 1) the log likelihoods are summed in this process.
+
+        Every other task (e.g. visualization and outputting results) is performed by the analyses in this process,
+        as for an `af.CombinedAnalysis`.
+
+        Parameters
+        ----------
+        analyses
+            The analyses whose log likelihoods are summed.
+        n_workers
+            The number of worker processes, which is one per analysis if not input.
+        model
+            The model fitted by every analysis, which creates an instance from the parameter vector.
+        """
+        super().__init__(*analyses)
+
+        self.n_workers = len(analyses) if n_workers is None else n_workers
+        self.model = model
+
+        self._init_shared()
+
+    def _init_shared(self):
+        self._executor_list = []
+        self._shared_memory_list = []
+        self._shared_args = None
+
+        self._finalize = weakref.finalize(
+            self, _close, self._executor_list, self._shared_memory_list
+        )
+
+    def __getstate__(self):
+        """
+        The worker processes and shared memory cannot be pickled, so are omitted and created again when the
+        likelihood is next evaluated.
+        """
+        state = self.__dict__.copy()
+
+        for key in ("_executor_list", "_shared_memory_list", "_shared_args"):
+            state.pop(key)
+
+        state.pop("_finalize")
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_shared()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if not self._executor_list:
+            self._executor_list.append(ProcessPoolExecutor(max_workers=self.n_workers))
+
+        return self._executor_list[0]
+
+    @property
+    def shared_args(self) -> Tuple[str, int, List[Tuple[int, int]]]:
+        """
+        The name of the shared memory block storing the model and analyses, the size of their pickle and the start
+        and stop of every out-of-band buffer within the block, which are passed to the worker processes.
+
+        The shared memory block is created the first time it is used.
+        """
+        if self._shared_args is not None:
+            return self._shared_args
+
+        buffer_list = []
+
+        pickled = pickle.dumps(
+            (self.model, list(self.analyses)),
+            protocol=5,
+            buffer_callback=buffer_list.append,
+        )
+
+        buffer_list = [buffer.raw() for buffer in buffer_list]
+
+        buffer_edges = []
+        start = len(pickled)
+
+        for buffer in buffer_list:
+            buffer_edges.append((start, start + buffer.nbytes))
+            start += buffer.nbytes
+
+        shared_memory = SharedMemory(create=True, size=max(start, 1))
+        self._shared_memory_list.append(shared_memory)
+
+        shared_memory.buf[: len(pickled)] = pickled
+
+        for (buffer_start, buffer_stop), buffer in zip(buffer_edges, buffer_list):
+            shared_memory.buf[buffer_start:buffer_stop] = buffer
+
+        self._shared_args = (shared_memory.name, len(pickled), buffer_edges)
+
+        return self._shared_args
+
+    def modify_before_fit(self, paths: af.DirectoryPaths, model: af.Collection):
+        """
+        Call `modify_before_fit` of every analysis (e.g. to set up their preloads) and return a new combined analysis
+        of the modified analyses, which stores the model such that likelihood evaluations are distributed over the
+        worker processes.
+        """
+        combined_analysis = super().modify_before_fit(paths=paths, model=model)
+
+        return CombinedAnalysisPool(
+            *combined_analysis.analyses, n_workers=self.n_workers, model=model
+        )
+
+    def log_likelihood_function(self, instance: af.ModelInstance) -> float:
+        """
+        Returns the sum of the log likelihoods of every analysis, which are evaluated concurrently by the worker
+        processes if the model is set.
+
+        If an analysis fails (or the wait is interrupted) every analysis which has not started is cancelled, such
+        that the worker processes are not left evaluating a likelihood which is discarded.
+        """
+        if self.model is None or self.n_workers < 2:
+            return self._summed_log_likelihood(instance)
+
+        vector = parameter_vector_from(model=self.model, instance=instance)
+
+        future_list = [
+            self.executor.submit(
+                _log_likelihood_from, *self.shared_args, analysis_index, vector
+            )
+            for analysis_index in range(len(self.analyses))
+        ]
+
+        try:
+            return sum(future.result() for future in future_list)
+        finally:
+            for future in future_list:
+                future.cancel()
+
+    def close(self):
+        """
+        Shut down the worker processes and release the shared memory.
+        """
+        self._finalize()
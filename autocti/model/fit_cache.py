@@ -0,0 +1,121 @@
+import numpy as np
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import autofit as af
+
+
+def flat_key_from(obj) -> Hashable:
+    """
+    Flatten an object of a CTI model (e.g. a `CTI2D`, its traps and ccd phases or a hyper noise scalar) into a
+    hashable tuple of its type and parameter values, such that two objects with identical parameters give the same
+    key.
+
+    Parameters
+    ----------
+    obj
+        The object which is flattened.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+
+    if isinstance(obj, np.ndarray):
+        return obj.shape, tuple(obj.ravel().tolist())
+
+    if isinstance(obj, (list, tuple)):
+        return tuple(flat_key_from(obj=value) for value in obj)
+
+    if isinstance(obj, dict):
+        return tuple(
+            (key, flat_key_from(obj=value)) for key, value in sorted(obj.items())
+        )
+
+    return type(obj), flat_key_from(obj=vars(obj))
+
+
+def fit_cache_key_from(
+    instance: af.ModelInstance, hyper_noise_scale: bool = True
+) -> Optional[Hashable]:
+    """
+    Returns the key of a model instance in a `FitCache`, which is the flattened parameter values of its CTI model and,
+    if the noise-map is scaled, its hyper noise scalars.
+
+    If the instance contains an object which cannot be flattened into a hashable key, `None` is returned and the
+    fit of this instance is not cached.
+
+    Parameters
+    ----------
+    instance
+        An instance of the model that is fitted to the data by this analysis (whose parameters have been set
+        via a non-linear search).
+    hyper_noise_scale
+        If `True`, the hyper noise scalars of the instance are part of the key.
+    """
+    hyper_noise_key = None
+
+    if hyper_noise_scale and hasattr(instance, "hyper_noise"):
+        hyper_noise_key = instance.hyper_noise.as_dict
+
+    try:
+        key = flat_key_from(obj=instance.cti), flat_key_from(obj=hyper_noise_key)
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+class FitCache:
+    def __init__(self, size: int = 128):
+        """
+        A bounded cache of the results of fits of a model to a dataset, which are evicted in least-recently-used
+        order.
+
+        Non-linear searches regularly evaluate the likelihood of a model instance with parameters identical to a
+        previous evaluation, and visualization fits the maximum likelihood instance again. For large charge injection
+        datasets adding CTI via arctic dominates the run time of every fit, therefore caching the post-cti data and
+        figure of merit of recent fits means these repeat evaluations are close to free.
+
+        Only instances whose parameters are identical (see `fit_cache_key_from`) are considered to be the same.
+
+        Parameters
+        ----------
+        size
+            The maximum number of fits stored in the cache.
+        """
+        self.size = size
+
+        self.hits = 0
+        self.misses = 0
+
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, key: Optional[Hashable]) -> Optional[Tuple]:
+        """
+        Returns the cached result of the fit of the input key, or `None` if it is not in the cache, updating the
+        hit and miss counters.
+        """
+        if key is None or key not in self._cache:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._cache.move_to_end(key)
+
+        return self._cache[key]
+
+    def set(self, key: Optional[Hashable], value: Tuple):
+        """
+        Store the result of the fit of the input key, evicting the least recently used result if the cache is full.
+        """
+        if key is None or self.size < 1:
+            return
+
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+
+        if len(self._cache) > self.size:
+            self._cache.popitem(last=False)
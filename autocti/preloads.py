@@ -1,5 +1,8 @@
 import numpy as np
-from typing import Optional
+from typing import Dict, Optional
+
+from autocti import exc
+from autocti.clocker import clocker_util
 
 
 class Preloads:
@@ -7,9 +10,18 @@ class Preloads:
         self,
         parallel_fast_index_list: Optional[np.ndarray] = None,
         parallel_fast_column_lists: Optional[np.ndarray] = None,
+        parallel_fast_inverse_indexes: Optional[np.ndarray] = None,
         serial_fast_index_list: Optional[np.ndarray] = None,
         serial_fast_row_lists: Optional[np.ndarray] = None,
+        serial_fast_inverse_indexes: Optional[np.ndarray] = None,
+        serial_fast_post_parallel_index_list: Optional[np.ndarray] = None,
+        serial_fast_post_parallel_inverse_indexes: Optional[np.ndarray] = None,
         noise_normalization: Optional[float] = None,
+        unmasked_indexes: Optional[np.ndarray] = None,
+        data_unmasked: Optional[np.ndarray] = None,
+        inverse_noise_variance_unmasked: Optional[np.ndarray] = None,
+        noise_map_unmasked: Optional[np.ndarray] = None,
+        sparse_noise_scaling_map_dict: Optional[Dict] = None,
     ):
         """
         Class which offers a concise API for settings up the preloads, which before a model-fit are set up via
@@ -31,6 +43,11 @@ class Preloads:
         parallel_fast_column_lists
             The mapping of every repeated column in `parallel_fast_index_list`  to all other columns which are identical.
              This is used to map the reduced arCTIc output to the post-CTI data.
+        parallel_fast_inverse_indexes
+            A flat integer array which for every column of the pre-cti data gives the index of the column in
+            `parallel_fast_index_list` it is identical to. This allows the reduced arCTIc output to be mapped to the
+            post-CTI data via a single fancy-indexing operation. If not input, it is computed from
+            `parallel_fast_column_lists`, one of which must be input with `parallel_fast_index_list`.
         serial_fast_index_list
             The index of a row that is repeated in the pre-cti data. This index corresponds to the first index
             of the repeated rows and this array used to extract the rows from the pre-cti data which are passed
@@ -38,9 +55,33 @@ class Preloads:
         serial_fast_row_lists
             The mapping of every repeated row in `serial_fast_index_list`  to all other rows which are identical.
             This is used to map the reduced arCTIc output to the post-CTI data.
+        serial_fast_inverse_indexes
+            A flat integer array which for every row of the pre-cti data gives the index of the row in
+            `serial_fast_index_list` it is identical to. If not input, it is computed from `serial_fast_row_lists`,
+            one of which must be input with `serial_fast_index_list`.
+        serial_fast_post_parallel_index_list
+            For the combined parallel and serial fast mode, the index of every unique row of the parallel clocked
+            image. This depends on the CTI model, so it is stored by the clocker after each call and reused by the
+            next call if it still groups the rows of the new parallel clocked image correctly.
+        serial_fast_post_parallel_inverse_indexes
+            For the combined parallel and serial fast mode, a flat integer array which for every row of the parallel
+            clocked image gives the index of the row in `serial_fast_post_parallel_index_list` it is identical to.
         noise_normalization
             The noise normalization term of the log likelihood function evaluated in `Analysis` objects. If the
             noise-map is fixed, this can be preloaded as it does not change.
+        unmasked_indexes
+            The flat (row-major) indexes of every unmasked pixel of the native dataset, such that the chi-squared of
+            a fit is computed only from the pixels which contribute to it.
+        data_unmasked
+            The values of the data in every pixel of `unmasked_indexes`.
+        inverse_noise_variance_unmasked
+            The inverse of the noise-map squared in every pixel of `unmasked_indexes`. If the noise-map is fixed, this
+            can be preloaded as it does not change.
+        noise_map_unmasked
+            The values of the noise-map (before any hyper noise scaling) in every pixel of `unmasked_indexes`.
+        sparse_noise_scaling_map_dict
+            The non-zero values of every noise-scaling map in the pixels of `unmasked_indexes` and their positions
+            in these pixels, which are used to scale `noise_map_unmasked` by the hyper noise scalars of a model.
 
         Returns
         -------
@@ -51,4 +92,53 @@ class Preloads:
         self.parallel_fast_column_lists = parallel_fast_column_lists
         self.serial_fast_index_list = serial_fast_index_list
         self.serial_fast_row_lists = serial_fast_row_lists
+
+        if (
+            parallel_fast_index_list is not None
+            and parallel_fast_column_lists is None
+            and parallel_fast_inverse_indexes is None
+        ):
+            raise exc.ClockerException(
+                "The Preloads parallel_fast_index_list was input without the "
+                "parallel_fast_column_lists (or parallel_fast_inverse_indexes), which are "
+                "required to map the unique columns to the post-CTI data."
+            )
+
+        if (
+            serial_fast_index_list is not None
+            and serial_fast_row_lists is None
+            and serial_fast_inverse_indexes is None
+        ):
+            raise exc.ClockerException(
+                "The Preloads serial_fast_index_list was input without the "
+                "serial_fast_row_lists (or serial_fast_inverse_indexes), which are "
+                "required to map the unique rows to the post-CTI data."
+            )
+
+        if (
+            parallel_fast_inverse_indexes is None
+            and parallel_fast_column_lists is not None
+        ):
+            parallel_fast_inverse_indexes = clocker_util.inverse_indexes_from(
+                fast_stripe_lists=parallel_fast_column_lists
+            )
+
+        if serial_fast_inverse_indexes is None and serial_fast_row_lists is not None:
+            serial_fast_inverse_indexes = clocker_util.inverse_indexes_from(
+                fast_stripe_lists=serial_fast_row_lists
+            )
+
+        self.parallel_fast_inverse_indexes = parallel_fast_inverse_indexes
+        self.serial_fast_inverse_indexes = serial_fast_inverse_indexes
+
+        self.serial_fast_post_parallel_index_list = serial_fast_post_parallel_index_list
+        self.serial_fast_post_parallel_inverse_indexes = (
+            serial_fast_post_parallel_inverse_indexes
+        )
         self.noise_normalization = noise_normalization
+
+        self.unmasked_indexes = unmasked_indexes
+        self.data_unmasked = data_unmasked
+        self.inverse_noise_variance_unmasked = inverse_noise_variance_unmasked
+        self.noise_map_unmasked = noise_map_unmasked
+        self.sparse_noise_scaling_map_dict = sparse_noise_scaling_map_dict
@@ -0,0 +1,123 @@
+import numpy as np
+from typing import Optional
+
+from autoconf import conf
+import autoarray as aa
+
+
+def dtype_from(dtype: Optional[str] = None) -> np.dtype:
+    """
+    Returns the floating point data type of the arrays of charge injection datasets, simulations and fits, which
+    is set via the `dtype` entry of the `numerics` section of the `general.yaml` config (`float64` or `float32`)
+    if it is not input.
+
+    For `float32` the memory of a dataset and the memory read when computing the chi-squared of a fit are halved.
+    CTI is always added by arctic in `float64`, with the clocker converting the data to and from `float64` when
+    it is passed to and returned from arctic.
+
+    Parameters
+    ----------
+    dtype
+        The data type, which overrides the config if input.
+    """
+    if dtype is None:
+        dtype = conf.instance["general"]["numerics"]["dtype"]
+
+    return np.dtype(dtype)
+
+
+def array_2d_no_mask_from(
+    values: np.ndarray,
+    pixel_scales: aa.type.PixelScales,
+    dtype: Optional[str] = None,
+) -> aa.Array2D:
+    """
+    Returns an unmasked `Array2D` of native values with the configured data type (see `dtype_from`).
+
+    PyAutoArray maps an array between its `slim` and `native` representations in `float64`, therefore an array of
+    any other data type is stored in its `native` representation. A `float64` array is created via
+    `Array2D.no_mask`, as it is when no data type is configured.
+
+    Parameters
+    ----------
+    values
+        The native values of the array.
+    pixel_scales
+        The (y,x) arcsecond-to-pixel units conversion factor of every pixel.
+    dtype
+        The data type, which overrides the config if input.
+    """
+    dtype = dtype_from(dtype=dtype)
+
+    if dtype == np.float64:
+        return aa.Array2D.no_mask(values=values, pixel_scales=pixel_scales)
+
+    return aa.Array2D(
+        values=np.asarray(values, dtype=dtype),
+        mask=aa.Mask2D.all_false(
+            shape_native=np.shape(values), pixel_scales=pixel_scales
+        ),
+        store_native=True,
+    )
+
+
+def native_array_2d_from(array: aa.Array2D, dtype: Optional[str] = None) -> aa.Array2D:
+    """
+    Returns an `Array2D` in its `native` representation with the configured data type (see `dtype_from`), which
+    is the input array (without a copy) if it is stored in its `native` representation with the data type.
+
+    Parameters
+    ----------
+    array
+        The array which is converted.
+    dtype
+        The data type, which overrides the config if input.
+    """
+    dtype = dtype_from(dtype=dtype)
+
+    if not array.store_native:
+        array = array.native
+
+    if array.dtype == dtype:
+        return array
+
+    return aa.Array2D(
+        values=np.asarray(array).astype(dtype),
+        mask=array.mask,
+        header=array.header,
+        store_native=True,
+    )
+
+
+def array_2d_view_from(
+    array: aa.Array2D, mask: aa.Mask2D, values: Optional[np.ndarray] = None
+) -> aa.Array2D:
+    """
+    Returns an `Array2D` stored in its `native` representation with a new mask, whose values are the native values
+    of an input array (or a view of them, e.g. a slice) without a copy being made.
+
+    Masking an `Array2D` (e.g. via `apply_mask`) copies its values and sets the values of its masked pixels to
+    zero, therefore masking every array of a large dataset multiplies the memory it uses. The returned array is
+    instead created in its `native` representation with `skip_mask=True`, such that it shares its memory with the
+    input array, masked pixels keep their values (calculations on the array use its mask) and changing the values of
+    one array changes the other.
+
+    Parameters
+    ----------
+    array
+        The array whose values and header are shared by the returned array.
+    mask
+        The mask of the returned array, which has the shape of its native values.
+    values
+        The native values of the returned array, which are the native values of the input array if not input.
+    """
+    if values is None:
+        values = array.values if array.store_native else array.native.values
+
+    return aa.Array2D(
+        values=np.asarray(values),
+        mask=mask,
+        header=array.header,
+        store_native=True,
+        skip_mask=True,
+    )
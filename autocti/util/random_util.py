@@ -0,0 +1,125 @@
+import numpy as np
+from typing import List, Union
+
+RandomState = Union[int, np.random.SeedSequence, np.random.Generator]
+
+
+def is_stream(rng) -> bool:
+    """
+    Returns whether an input seed is a random number stream (a `np.random.Generator` or `np.random.SeedSequence`)
+    rather than an integer seed of numpy's global random state.
+
+    Simulation functions which take an integer seed set numpy's global random state, therefore only give reproducible
+    results when they are run one at a time in a single process. If a stream is input instead, random numbers are
+    drawn from it without using the global random state.
+
+    Parameters
+    ----------
+    rng
+        The seed or random number stream.
+    """
+    return isinstance(rng, (np.random.Generator, np.random.SeedSequence))
+
+
+def generator_from(rng: RandomState) -> np.random.Generator:
+    """
+    Returns a `np.random.Generator` from an integer seed, a `np.random.SeedSequence` or a `np.random.Generator`,
+    where an input generator is returned unchanged.
+
+    Parameters
+    ----------
+    rng
+        The seed or random number stream the generator draws from.
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng
+
+    return np.random.default_rng(rng)
+
+
+def seed_sequence_from(rng: RandomState) -> np.random.SeedSequence:
+    """
+    Returns a `np.random.SeedSequence` from an integer seed, a `np.random.SeedSequence` or a `np.random.Generator`,
+    which independent streams are spawned from.
+
+    For an input generator the entropy of the sequence is drawn from the generator, such that the sequence is
+    reproducible for a given state of the generator.
+
+    Parameters
+    ----------
+    rng
+        The seed or random number stream the sequence is created from.
+    """
+    if isinstance(rng, np.random.SeedSequence):
+        return rng
+
+    if isinstance(rng, np.random.Generator):
+        return np.random.SeedSequence(
+            rng.integers(0, np.iinfo(np.int64).max, size=4).tolist()
+        )
+
+    return np.random.SeedSequence(rng)
+
+
+def seed_sequence_list_from(
+    rng: RandomState, total: int
+) -> List[np.random.SeedSequence]:
+    """
+    Returns a list of independent `np.random.SeedSequence` objects spawned from a master seed, for example one for
+    every frame of a simulation campaign.
+
+    The sequence at index `i` only depends on the master seed and `i`, therefore every frame can be simulated in any
+    order by any process (e.g. via a process pool) and give bit-identical outputs.
+
+    Parameters
+    ----------
+    rng
+        The master seed or random number stream.
+    total
+        The number of independent sequences spawned.
+    """
+    return seed_sequence_from(rng).spawn(total)
+
+
+def seed_sequence_at_index_from(rng: RandomState, index: int) -> np.random.SeedSequence:
+    """
+    Returns the `np.random.SeedSequence` at `index` of the list `seed_sequence_list_from` spawns from a master seed,
+    without spawning from the master sequence.
+
+    Spawning advances the spawn counter of a sequence, therefore a stream spawned on demand depends on how many
+    streams were spawned before it. The sequence returned by this function only depends on the master sequence and
+    the `index`, therefore the same stream is returned in any order and in any process that holds a copy of the
+    master sequence.
+
+    Parameters
+    ----------
+    rng
+        The master seed or random number stream.
+    index
+        The index of the spawned sequence (e.g. the index of a frame in a simulation campaign).
+    """
+    seed_sequence = seed_sequence_from(rng)
+
+    return np.random.SeedSequence(
+        entropy=seed_sequence.entropy,
+        spawn_key=tuple(seed_sequence.spawn_key) + (index,),
+        pool_size=seed_sequence.pool_size,
+    )
+
+
+def generator_list_from(rng: RandomState, total: int) -> List[np.random.Generator]:
+    """
+    Returns a list of independent `np.random.Generator` objects spawned from a master seed (see
+    `seed_sequence_list_from`).
+
+    Parameters
+    ----------
+    rng
+        The master seed or random number stream.
+    total
+        The number of independent generators spawned.
+    """
+    return [
+        np.random.default_rng(seed_sequence)
+        for seed_sequence in seed_sequence_list_from(rng=rng, total=total)
+    ]
@@ -0,0 +1,137 @@
+"""
+Benchmark of the unique stripe detection used by the `Clocker2D` fast modes (`Clocker2D.fast_indexes_from`).
+
+The vectorized, hash-based grouping in `autocti.util.clocker.unique_stripes_from` is timed against the original
+pairwise comparison of every stripe with every other stripe, for charge injection images the size of a Euclid
+quadrant and of multiple quadrants stitched together in the serial direction.
+
+Both uniform charge injection (few unique columns) and non-uniform charge injection (every injection column
+unique) are benchmarked, the latter being the worst case of the pairwise comparison.
+
+Run via:
+
+    python benchmarks/fast_indexes.py
+
+The pairwise comparison is quadratic in the number of stripes and can take minutes for multi-quadrant images, so
+it can be omitted via `--skip-reference`.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import autocti as ac
+
+
+def fast_indexes_pairwise_from(data: np.ndarray, for_parallel: bool):
+    """
+    The original O(N^2) implementation of `Clocker2D.fast_indexes_from`, kept as a reference for this benchmark.
+    """
+    total_stripes = data.shape[1] if for_parallel else data.shape[0]
+
+    fast_index_list = []
+    fast_column_lists = []
+
+    unchecked_list = range(0, total_stripes)
+
+    for stripe_index in range(total_stripes):
+        paired = False
+
+        pair_list = []
+        unchecked_list_new = []
+
+        if stripe_index in unchecked_list:
+            for pair_index in unchecked_list:
+                if for_parallel:
+                    residual_map = np.abs(data[:, stripe_index] - data[:, pair_index])
+                else:
+                    residual_map = np.abs(data[stripe_index, :] - data[pair_index, :])
+
+                if np.all(residual_map < 1.0e-8):
+                    if not paired:
+                        fast_index_list.append(stripe_index)
+
+                    paired = True
+
+                    pair_list.append(pair_index)
+
+                else:
+                    unchecked_list_new.append(pair_index)
+
+            fast_column_lists.append(pair_list)
+            unchecked_list = unchecked_list_new
+
+    return fast_index_list, fast_column_lists
+
+
+def pre_cti_data_from(total_quadrants: int, non_uniform: bool) -> np.ndarray:
+    """
+    A pre-CTI charge injection image with the dimensions of `total_quadrants` Euclid quadrants (2086 x 2128 each),
+    containing 4 charge injection regions which span all columns except the serial prescan and overscan.
+    """
+    rows, columns = 2086, 2128 * total_quadrants
+
+    pre_cti_data = np.zeros((rows, columns))
+
+    if non_uniform:
+        injection_norms = np.random.default_rng(seed=1).normal(100.0, 10.0, columns)
+    else:
+        injection_norms = np.full(columns, 100.0)
+
+    for y0 in (100, 600, 1100, 1600):
+        pre_cti_data[y0 : y0 + 200, 51:-20] = injection_norms[51:-20]
+
+    return pre_cti_data
+
+
+def timed(func, **kwargs):
+    start = time.perf_counter()
+    result = func(**kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quadrants", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--skip-reference", action="store_true")
+    args = parser.parse_args()
+
+    clocker = ac.Clocker2D(parallel_fast_mode=True)
+
+    for total_quadrants in args.quadrants:
+        for non_uniform in (False, True):
+            data = pre_cti_data_from(
+                total_quadrants=total_quadrants, non_uniform=non_uniform
+            )
+
+            for for_parallel in (True, False):
+                (fast_index_list, fast_lists), time_fast = timed(
+                    clocker.fast_indexes_from, data=data, for_parallel=for_parallel
+                )
+
+                label = (
+                    f"{total_quadrants} quadrant(s) {data.shape} "
+                    f"{'non-uniform' if non_uniform else 'uniform'} "
+                    f"{'parallel' if for_parallel else 'serial'}: "
+                    f"{len(fast_index_list)} unique stripes, vectorized {time_fast:.3f}s"
+                )
+
+                if args.skip_reference:
+                    print(label)
+                    continue
+
+                reference, time_reference = timed(
+                    fast_indexes_pairwise_from, data=data, for_parallel=for_parallel
+                )
+
+                assert reference == (fast_index_list, fast_lists)
+
+                print(
+                    f"{label}, pairwise {time_reference:.3f}s "
+                    f"({time_reference / time_fast:.0f}x speedup)"
+                )
+
+
+if __name__ == "__main__":
+    main()
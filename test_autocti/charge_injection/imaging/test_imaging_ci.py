@@ -75,6 +75,29 @@ def test__norm_columns_list():
 
     assert dataset.norm_columns_list == [2.0, 6.0, 8.5]
 
+    layout = ac.Layout2DCI(
+        shape_2d=data.shape_native, region_list=[(1, 4, 1, 2), (2, 4, 2, 4)]
+    )
+
+    dataset = ac.ImagingCI(
+        data=data,
+        noise_map=noise_map,
+        pre_cti_data=data,
+        layout=layout,
+        fpr_value=1.0,
+    )
+
+    assert dataset.norm_columns_list == [2.0, 6.0, 8.5]
+
+    norm_columns_list = dataset.norm_columns_list
+    norm_columns_list[0] = 100.0
+
+    assert dataset.norm_columns_list == [2.0, 6.0, 8.5]
+
+    dataset.data = dataset.data + 1.0
+
+    assert dataset.norm_columns_list == [3.0, 7.0, 9.5]
+
 
 def test__pre_cti_data_residual_map():
     data = ac.Array2D.full(fill_value=1.0, shape_native=(5, 5), pixel_scales=(1.0, 1.0))
@@ -164,6 +187,45 @@ def test__from_fits__noise_map_from_single_value(layout_ci_7x7):
     assert dataset.layout == layout_ci_7x7
 
 
+def test__from_fits__lazy__components_loaded_when_used(layout_ci_7x7):
+    dataset = ac.ImagingCI.from_fits(
+        pixel_scales=1.0,
+        layout=layout_ci_7x7,
+        data_path=path.join(test_data_path, "3x3_multiple_hdu.fits"),
+        data_hdu=0,
+        noise_map_from_single_value=10.0,
+        pre_cti_data_path=path.join(test_data_path, "3x3_multiple_hdu.fits"),
+        pre_cti_data_hdu=2,
+        cosmic_ray_map_path=path.join(test_data_path, "3x3_multiple_hdu.fits"),
+        cosmic_ray_map_hdu=3,
+        lazy=True,
+    )
+
+    for name in ("data", "noise_map", "pre_cti_data", "cosmic_ray_map", "fpr_value"):
+        assert name not in vars(dataset)
+
+    assert (dataset.noise_map.native == 10.0 * np.ones((3, 3))).all()
+
+    assert "noise_map" in vars(dataset)
+    assert "data" not in vars(dataset)
+
+    assert (dataset.data.native == np.ones((3, 3))).all()
+    assert (dataset.pre_cti_data.native == 3.0 * np.ones((3, 3))).all()
+    assert (dataset.cosmic_ray_map.native == 4.0 * np.ones((3, 3))).all()
+
+    dataset_eager = ac.ImagingCI.from_fits(
+        pixel_scales=1.0,
+        layout=layout_ci_7x7,
+        data_path=path.join(test_data_path, "3x3_multiple_hdu.fits"),
+        data_hdu=0,
+        noise_map_from_single_value=10.0,
+        pre_cti_data_path=path.join(test_data_path, "3x3_multiple_hdu.fits"),
+        pre_cti_data_hdu=2,
+    )
+
+    assert dataset.fpr_value == dataset_eager.fpr_value
+
+
 def test__output_to_fits___all_arrays(imaging_ci_7x7):
     imaging_ci_7x7.output_to_fits(
         data_path=path.join(test_data_path, "data.fits"),
@@ -192,6 +254,47 @@ def test__output_to_fits___all_arrays(imaging_ci_7x7):
     assert (dataset.cosmic_ray_map.native == 0.0 * np.ones((7, 7))).all()
 
 
+def test__output_to_multi_hdu_fits__round_trip(imaging_ci_7x7):
+    mask = ac.Mask2D.all_false(
+        shape_native=imaging_ci_7x7.shape_native, pixel_scales=1.0
+    )
+
+    mask[0, 1] = True
+
+    imaging_ci_7x7 = imaging_ci_7x7.apply_mask(mask=mask)
+    imaging_ci_7x7.settings_dict = {"voltage": 1.0}
+
+    file_path = path.join(test_data_path, "dataset.fits")
+
+    for dtype, compress in (("float64", False), ("float32", True)):
+        imaging_ci_7x7.output_to_multi_hdu_fits(
+            file_path=file_path, overwrite=True, dtype=dtype, compress=compress
+        )
+
+        for lazy in (False, True):
+            dataset = ac.ImagingCI.from_multi_hdu_fits(file_path=file_path, lazy=lazy)
+
+            assert (dataset.data.native == imaging_ci_7x7.data.native).all()
+            assert (dataset.noise_map.native == imaging_ci_7x7.noise_map.native).all()
+            assert (
+                dataset.pre_cti_data.native == imaging_ci_7x7.pre_cti_data.native
+            ).all()
+            assert (
+                dataset.cosmic_ray_map.native == imaging_ci_7x7.cosmic_ray_map.native
+            ).all()
+            assert (
+                dataset.noise_scaling_map_dict["serial_eper"].native
+                == imaging_ci_7x7.noise_scaling_map_dict["serial_eper"].native
+            ).all()
+
+            assert (dataset.mask == mask).all()
+            assert [region.slice for region in dataset.layout.region_list] == [
+                region.slice for region in imaging_ci_7x7.layout.region_list
+            ]
+            assert dataset.settings_dict == {"voltage": 1.0}
+            assert dataset.fpr_value == imaging_ci_7x7.fpr_value
+
+
 def test__apply_mask__masks_arrays_correctly(imaging_ci_7x7):
     mask = ac.Mask2D.all_false(
         shape_native=imaging_ci_7x7.shape_native, pixel_scales=1.0
@@ -203,22 +306,37 @@ def test__apply_mask__masks_arrays_correctly(imaging_ci_7x7):
 
     assert (masked_dataset.mask == mask).all()
 
-    masked_image = imaging_ci_7x7.data
-    masked_image[0, 0] = 0.0
+    assert (masked_dataset.data == imaging_ci_7x7.data).all()
+    assert (masked_dataset.noise_map == imaging_ci_7x7.noise_map).all()
+    assert (masked_dataset.pre_cti_data == imaging_ci_7x7.pre_cti_data).all()
+    assert (masked_dataset.cosmic_ray_map == imaging_ci_7x7.cosmic_ray_map).all()
 
-    assert (masked_dataset.data == masked_image).all()
+    assert masked_dataset.data.slim.shape == (48,)
 
-    masked_noise_map = imaging_ci_7x7.noise_map
-    masked_noise_map[0, 0] = 0.0
 
-    assert (masked_dataset.noise_map == masked_noise_map).all()
+def test__apply_mask__arrays_share_memory_with_dataset(imaging_ci_7x7):
+    mask = ac.Mask2D.all_false(
+        shape_native=imaging_ci_7x7.shape_native, pixel_scales=1.0
+    )
 
-    assert (masked_dataset.pre_cti_data == imaging_ci_7x7.pre_cti_data).all()
+    mask[0, 0] = True
 
-    masked_cosmic_ray_map = imaging_ci_7x7.cosmic_ray_map
-    masked_cosmic_ray_map[0, 0] = 0.0
+    masked_dataset = imaging_ci_7x7.apply_mask(mask=mask)
+    masked_dataset = masked_dataset.apply_mask(mask=mask)
 
-    assert (masked_dataset.cosmic_ray_map == masked_cosmic_ray_map).all()
+    for masked_array, array in [
+        (masked_dataset.data, imaging_ci_7x7.data),
+        (masked_dataset.noise_map, imaging_ci_7x7.noise_map),
+        (masked_dataset.pre_cti_data, imaging_ci_7x7.pre_cti_data),
+        (masked_dataset.cosmic_ray_map, imaging_ci_7x7.cosmic_ray_map),
+    ]:
+        assert np.shares_memory(masked_array.values, array.values)
+
+    masked_dataset = imaging_ci_7x7.apply_settings(
+        settings=ac.SettingsImagingCI(parallel_pixels=(1, 3))
+    )
+
+    assert np.shares_memory(masked_dataset.data.values, imaging_ci_7x7.data.values)
 
 
 def test__apply_settings__include_parallel_columns_extraction(
@@ -240,12 +358,10 @@ def test__apply_settings__include_parallel_columns_extraction(
     assert (masked_dataset.mask == mask).all()
 
     data = np.ones((7, 2))
-    data[0, 0] = 0.0
 
     assert masked_dataset.data == pytest.approx(data, 1.0e-4)
 
     noise_map = 2.0 * np.ones((7, 2))
-    noise_map[0, 0] = 0.0
 
     assert masked_dataset.noise_map == pytest.approx(noise_map, 1.0e-4)
 
@@ -256,14 +372,12 @@ def test__apply_settings__include_parallel_columns_extraction(
     assert masked_dataset.cosmic_ray_map.shape == (7, 2)
 
     noise_scaling_map_0 = np.ones((7, 2))
-    noise_scaling_map_0[0, 0] = 0.0
 
     assert masked_dataset.noise_scaling_map_dict["parallel_eper"] == pytest.approx(
         noise_scaling_map_0, 1.0e-4
     )
 
     noise_scaling_map_1 = 2.0 * np.ones((7, 2))
-    noise_scaling_map_1[0, 0] = 0.0
 
     assert masked_dataset.noise_scaling_map_dict["serial_eper"] == pytest.approx(
         noise_scaling_map_1, 1.0e-4
@@ -289,12 +403,10 @@ def test__apply_settings__serial_masked_imaging_ci(
     assert (masked_dataset.mask == mask).all()
 
     data = np.ones((1, 7))
-    data[0, 0] = 0.0
 
     assert masked_dataset.data == pytest.approx(data, 1.0e-4)
 
     noise_map = 2.0 * np.ones((1, 7))
-    noise_map[0, 0] = 0.0
 
     assert masked_dataset.noise_map == pytest.approx(noise_map, 1.0e-4)
 
@@ -305,14 +417,12 @@ def test__apply_settings__serial_masked_imaging_ci(
     assert masked_dataset.cosmic_ray_map.shape == (1, 7)
 
     noise_scaling_map_0 = np.ones((1, 7))
-    noise_scaling_map_0[0, 0] = 0.0
 
     assert masked_dataset.noise_scaling_map_dict["parallel_eper"] == pytest.approx(
         noise_scaling_map_0, 1.0e-4
     )
 
     noise_scaling_map_1 = 2.0 * np.ones((1, 7))
-    noise_scaling_map_1[0, 0] = 0.0
 
     assert masked_dataset.noise_scaling_map_dict["serial_eper"] == pytest.approx(
         noise_scaling_map_1, 1.0e-4
@@ -334,6 +444,30 @@ def test__fpr_value():
     assert dataset.fpr_value == pytest.approx(1.0, 1.0e-4)
 
 
+def test__dtype_float32__arrays_stored_as_float32(imaging_ci_7x7, monkeypatch):
+    monkeypatch.setattr(
+        ac.util.dtype, "dtype_from", lambda dtype=None: np.dtype(dtype or "float32")
+    )
+
+    dataset = ac.ImagingCI(
+        data=imaging_ci_7x7.data,
+        noise_map=imaging_ci_7x7.noise_map,
+        pre_cti_data=imaging_ci_7x7.pre_cti_data,
+        layout=imaging_ci_7x7.layout,
+        cosmic_ray_map=imaging_ci_7x7.data,
+    )
+
+    assert dataset.data.dtype == np.float32
+    assert dataset.noise_map.dtype == np.float32
+    assert dataset.pre_cti_data.dtype == np.float32
+    assert dataset.cosmic_ray_map.dtype == np.float32
+    assert dataset.data.native == pytest.approx(imaging_ci_7x7.data.native, 1.0e-6)
+
+    fit = ac.FitImagingCI(dataset=dataset, post_cti_data=dataset.pre_cti_data)
+
+    assert fit.log_likelihood == pytest.approx(-575.11719997, 1e-4)
+
+
 def test__set_noise_scaling_map_dict(imaging_ci_7x7, ci_noise_scaling_map_dict_7x7):
     imaging_ci_7x7.noise_scaling_map_dict = None
 
@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pytest
 import autocti as ac
@@ -471,3 +472,92 @@ def test__flat_field_mode(parallel_clocker_2d, traps_x2, ccd):
 
     assert dataset.noise_map[0, 0] == pytest.approx(11.11607, 1.0e-4)
     assert dataset.noise_map[4, 0] == pytest.approx(4.0, 1.0e-4)
+
+
+def test__rng__frames_reproducible_and_independent(parallel_clocker_2d, traps_x2, ccd):
+    layout = ac.Layout2DCI(shape_2d=(5, 5), region_list=[(0, 3, 0, 4)])
+
+    cti = ac.CTI2D(parallel_trap_list=traps_x2, parallel_ccd=ccd)
+
+    state = np.random.get_state()
+
+    simulator = ac.SimulatorImagingCI(
+        pixel_scales=1.0, norm=10.0, column_sigma=1.0, read_noise=1.0, rng=1
+    )
+
+    dataset_0 = simulator.via_layout_from(
+        layout=layout, clocker=parallel_clocker_2d, cti=cti
+    )
+    dataset_1 = simulator.via_layout_from(
+        layout=layout, clocker=parallel_clocker_2d, cti=cti, frame_index=1
+    )
+
+    assert (np.random.get_state()[1] == state[1]).all()
+    assert (dataset_0.pre_cti_data != dataset_1.pre_cti_data).any()
+    assert (dataset_0.data != dataset_1.data).any()
+
+    simulator = ac.SimulatorImagingCI(
+        pixel_scales=1.0, norm=10.0, column_sigma=1.0, read_noise=1.0, rng=1
+    )
+
+    dataset = simulator.via_layout_from(
+        layout=layout, clocker=parallel_clocker_2d, cti=cti
+    )
+
+    assert (dataset.pre_cti_data == dataset_0.pre_cti_data).all()
+    assert (dataset.data == dataset_0.data).all()
+
+
+def _data_via_frame_index_from(simulator_and_frame_index):
+    simulator, frame_index = simulator_and_frame_index
+
+    layout = ac.Layout2DCI(shape_2d=(5, 5), region_list=[(0, 3, 0, 4)])
+
+    dataset = simulator.via_layout_from(
+        layout=layout, clocker=None, cti=None, frame_index=frame_index
+    )
+
+    return np.array(dataset.data.native)
+
+
+def test__rng__frames_independent_of_simulation_order():
+    simulator = ac.SimulatorImagingCI(
+        pixel_scales=1.0, norm=10.0, column_sigma=1.0, read_noise=1.0, rng=1
+    )
+
+    data_list = [
+        _data_via_frame_index_from((simulator, frame_index)) for frame_index in range(3)
+    ]
+
+    simulator = ac.SimulatorImagingCI(
+        pixel_scales=1.0, norm=10.0, column_sigma=1.0, read_noise=1.0, rng=1
+    )
+
+    for frame_index in [2, 0, 2, 1]:
+        assert (
+            _data_via_frame_index_from((simulator, frame_index))
+            == data_list[frame_index]
+        ).all()
+
+
+def test__rng__frames_reproducible_across_processes():
+    simulator = ac.SimulatorImagingCI(
+        pixel_scales=1.0, norm=10.0, column_sigma=1.0, read_noise=1.0, rng=1
+    )
+
+    data_list = [
+        _data_via_frame_index_from((simulator, frame_index)) for frame_index in range(4)
+    ]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        data_via_process_list = list(
+            executor.map(
+                _data_via_frame_index_from,
+                [(simulator, frame_index) for frame_index in [3, 1, 0, 2]],
+            )
+        )
+
+    for data, frame_index in zip(data_via_process_list, [3, 1, 0, 2]):
+        assert (data == data_list[frame_index]).all()
+
+    assert (data_list[0] != data_list[1]).any()
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+import autofit as af
+import autocti as ac
+
+
+def test__dataset_1d_from(imaging_ci_7x7):
+    dataset_1d = imaging_ci_7x7.layout.extract.parallel_calibration.dataset_1d_from(
+        dataset=imaging_ci_7x7, columns=(0, 2)
+    )
+
+    assert dataset_1d.data.shape_native == (7,)
+    assert dataset_1d.pre_cti_data.native == pytest.approx(
+        np.mean(imaging_ci_7x7.pre_cti_data.native[:, 1:3], axis=1), 1.0e-4
+    )
+    assert dataset_1d.layout.region_list[0] == (1, 5)
+
+
+def test__dataset_1d_from__masked__data_binned_over_unmasked_pixels(
+    imaging_ci_7x7,
+):
+    mask = np.full(shape=(7, 7), fill_value=False)
+    mask[2, 1] = True
+    mask[3, 1:3] = True
+
+    dataset = imaging_ci_7x7.apply_mask(
+        mask=ac.Mask2D(mask=mask, pixel_scales=imaging_ci_7x7.data.pixel_scales)
+    )
+
+    dataset_1d = dataset.layout.extract.parallel_calibration.dataset_1d_from(
+        dataset=dataset, columns=(0, 2)
+    )
+
+    assert dataset_1d.data.native[2] == pytest.approx(
+        imaging_ci_7x7.data.native[2, 2], 1.0e-4
+    )
+    assert dataset_1d.pre_cti_data.native[2] == pytest.approx(
+        np.mean(imaging_ci_7x7.pre_cti_data.native[2, 1:3]), 1.0e-4
+    )
+    assert dataset_1d.pre_cti_data.native[3] == pytest.approx(
+        np.mean(imaging_ci_7x7.pre_cti_data.native[3, 1:3]), 1.0e-4
+    )
+    assert dataset_1d.pre_cti_data.native[4] == pytest.approx(
+        np.mean(imaging_ci_7x7.pre_cti_data.native[4, 1:3]), 1.0e-4
+    )
+    assert dataset_1d.mask[3] == True
+
+
+def test__parallel_clocker_1d_from(parallel_clocker_2d):
+    clocker_1d = parallel_clocker_2d.parallel_clocker_1d_from()
+
+    assert isinstance(clocker_1d, ac.Clocker1D)
+    assert clocker_1d.express == parallel_clocker_2d.parallel_express
+    assert clocker_1d.roe is parallel_clocker_2d.parallel_roe
+
+
+def test__log_likelihood_function__fits_binned_dataset_1d(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    analysis = ac.AnalysisImagingCI(dataset=imaging_ci_7x7, clocker=parallel_clocker_2d)
+
+    analysis_binned = ac.AnalysisImagingCIBinned(analysis=analysis, columns=(0, 2))
+
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+    )
+
+    instance = model.instance_from_prior_medians()
+
+    fit = ac.FitDataset1D(
+        dataset=analysis_binned.dataset,
+        post_cti_data=parallel_clocker_2d.parallel_clocker_1d_from().add_cti(
+            data=analysis_binned.dataset.pre_cti_data,
+            cti=ac.CTI1D(trap_list=instance.cti.parallel_trap_list, ccd=ccd),
+        ),
+    )
+
+    assert analysis_binned.log_likelihood_function(instance=instance) == pytest.approx(
+        fit.log_likelihood, 1.0e-4
+    )
+
+
+def test__modify_before_fit__raises_for_serial_model(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    analysis = ac.AnalysisImagingCI(dataset=imaging_ci_7x7, clocker=parallel_clocker_2d)
+
+    analysis_binned = ac.AnalysisImagingCIBinned(analysis=analysis)
+
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, serial_trap_list=traps_x1, serial_ccd=ccd),
+    )
+
+    with pytest.raises(ac.exc.FittingException):
+        analysis_binned.modify_before_fit(paths=af.DirectoryPaths(), model=model)
+
+
+class MockSearchCoarseToFine:
+    def __init__(self):
+        self.model = None
+        self.analysis = None
+
+    def fit(self, model, analysis):
+        self.model = model
+        self.analysis = analysis
+
+        return af.m.MockResult(model=model)
+
+
+def test__fit_coarse_to_fine(imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d):
+    analysis = ac.AnalysisImagingCI(dataset=imaging_ci_7x7, clocker=parallel_clocker_2d)
+
+    analysis_binned = ac.AnalysisImagingCIBinned(analysis=analysis)
+
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+    )
+
+    search_coarse = MockSearchCoarseToFine()
+    search_fine = MockSearchCoarseToFine()
+
+    analysis_binned.fit_coarse_to_fine(
+        model=model, search_coarse=search_coarse, search_fine=search_fine
+    )
+
+    assert search_coarse.analysis is analysis_binned
+    assert search_fine.model is search_coarse.model
+    assert search_fine.analysis is analysis
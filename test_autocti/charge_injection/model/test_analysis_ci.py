@@ -30,6 +30,11 @@ def test__modify_before_fit__noise_normalization_preload(
     analysis.modify_before_fit(paths=af.DirectoryPaths(), model=model)
 
     assert analysis.preloads.noise_normalization == None
+    assert analysis.preloads.inverse_noise_variance_unmasked is None
+    assert analysis.preloads.sparse_noise_scaling_map_dict.keys() == {
+        "parallel_eper",
+        "serial_eper",
+    }
 
 
 def test__region_list_from(
@@ -117,6 +122,7 @@ def test__log_likelihood_via_analysis__fast_settings_same_as_default(
 
     assert analysis.preloads.parallel_fast_index_list is not None
     assert analysis.preloads.parallel_fast_column_lists is not None
+    assert analysis.preloads.parallel_fast_inverse_indexes is not None
 
     assert log_likelihood_via_fast == log_likelihood_via_default
 
@@ -140,6 +146,7 @@ def test__log_likelihood_via_analysis__fast_settings_same_as_default(
 
     assert analysis.preloads.serial_fast_index_list is not None
     assert analysis.preloads.serial_fast_row_lists is not None
+    assert analysis.preloads.serial_fast_inverse_indexes is not None
 
     assert log_likelihood_via_fast == log_likelihood_via_default
 
@@ -178,6 +185,21 @@ def test__log_likelihood_via_analysis__fast_settings_same_as_default(
 
     assert log_likelihood_via_fast == log_likelihood_via_default
 
+    parallel_serial_clocker_2d = copy.copy(parallel_serial_clocker_2d)
+    parallel_serial_clocker_2d.serial_fast_mode = True
+
+    analysis = ac.AnalysisImagingCI(
+        dataset=imaging_ci_7x7, clocker=parallel_serial_clocker_2d
+    )
+
+    log_likelihood_via_fast = analysis.log_likelihood_function(instance=instance)
+
+    assert analysis.preloads.parallel_fast_index_list is not None
+    assert analysis.preloads.serial_fast_index_list is None
+    assert analysis.preloads.serial_fast_post_parallel_index_list is not None
+
+    assert log_likelihood_via_fast == pytest.approx(log_likelihood_via_default, 1.0e-4)
+
 
 def test__full_and_extracted_fits_from_instance_and_imaging_ci(
     imaging_ci_7x7, mask_2d_7x7_unmasked, traps_x1, ccd, parallel_clocker_2d
@@ -310,3 +332,35 @@ def test__extracted_fits_from_instance_and_imaging_ci__include_noise_scaling(
     )
 
     assert fit.log_likelihood != pytest.approx(fit_full_analysis.log_likelihood, 1.0e-4)
+
+
+def test__log_likelihood_via_analysis__fit_cache(
+    imaging_ci_7x7, traps_x1, ccd, parallel_clocker_2d
+):
+    model = af.Collection(
+        cti=af.Model(ac.CTI2D, parallel_trap_list=traps_x1, parallel_ccd=ccd),
+        hyper_noise=af.Model(ac.HyperCINoiseCollection),
+    )
+
+    analysis = ac.AnalysisImagingCI(dataset=imaging_ci_7x7, clocker=parallel_clocker_2d)
+
+    instance = model.instance_from_unit_vector([])
+
+    log_likelihood = analysis.log_likelihood_function(instance=instance)
+
+    analysis = ac.AnalysisImagingCI(
+        dataset=imaging_ci_7x7, clocker=parallel_clocker_2d, fit_cache_size=1
+    )
+
+    assert analysis.log_likelihood_function(instance=instance) == log_likelihood
+    assert analysis.fit_cache.misses == 1
+
+    instance = model.instance_from_unit_vector([])
+
+    assert analysis.log_likelihood_function(instance=instance) == log_likelihood
+    assert analysis.fit_cache.hits == 1
+
+    fit = analysis.fit_via_instance_from(instance=instance)
+
+    assert fit.log_likelihood == log_likelihood
+    assert analysis.fit_cache.hits == 2
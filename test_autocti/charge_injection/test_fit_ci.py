@@ -2,7 +2,13 @@ import numpy as np
 import pytest
 
 import autocti as ac
+from autocti.charge_injection.fit import chi_squared_via_unmasked_indexes_from
 from autocti.charge_injection.fit import hyper_noise_map_from
+from autocti.charge_injection.fit import hyper_noise_map_unmasked_from
+from autocti.charge_injection.fit import native_array_from
+from autocti.charge_injection.fit import sparse_noise_scaling_map_dict_from
+from autocti.charge_injection.fit import unmasked_indexes_from
+from autocti.preloads import Preloads
 
 
 def test__fit_figure_of_merit(imaging_ci_7x7):
@@ -30,6 +36,169 @@ def test__fit_figure_of_merit(imaging_ci_7x7):
     assert fit.log_likelihood == pytest.approx(-180.877585, 1.0e-4)
 
 
+def test__chi_squared__via_unmasked_indexes_preloads(imaging_ci_7x7):
+    mask = ac.Mask2D.all_false(shape_native=(7, 7), pixel_scales=1.0)
+    mask[0:3, :] = True
+    mask[5, 5] = True
+
+    masked_dataset = imaging_ci_7x7.apply_mask(mask=mask)
+
+    post_cti_data = masked_dataset.pre_cti_data + 0.5
+
+    hyper_collection = ac.HyperCINoiseCollection(
+        parallel_eper=ac.HyperCINoiseScalar(scale_factor=1.0),
+        serial_eper=ac.HyperCINoiseScalar(scale_factor=2.0),
+    )
+
+    unmasked_indexes = unmasked_indexes_from(mask=mask)
+
+    preloads = Preloads(
+        unmasked_indexes=unmasked_indexes,
+        data_unmasked=np.take(
+            native_array_from(array=masked_dataset.data), unmasked_indexes
+        ),
+    )
+
+    for hyper_noise_scalar_dict in [None, hyper_collection.as_dict]:
+        fit = ac.FitImagingCI(
+            dataset=masked_dataset,
+            post_cti_data=post_cti_data,
+            hyper_noise_scalar_dict=hyper_noise_scalar_dict,
+        )
+
+        fit_via_preloads = ac.FitImagingCI(
+            dataset=masked_dataset,
+            post_cti_data=post_cti_data,
+            hyper_noise_scalar_dict=hyper_noise_scalar_dict,
+            preloads=preloads,
+        )
+
+        assert fit_via_preloads.chi_squared == pytest.approx(fit.chi_squared, 1.0e-8)
+
+    preloads.inverse_noise_variance_unmasked = 1.0 / np.square(
+        np.take(native_array_from(array=masked_dataset.noise_map), unmasked_indexes)
+    )
+
+    fit = ac.FitImagingCI(dataset=masked_dataset, post_cti_data=post_cti_data)
+
+    fit_via_preloads = ac.FitImagingCI(
+        dataset=masked_dataset, post_cti_data=post_cti_data, preloads=preloads
+    )
+
+    assert fit_via_preloads.chi_squared == pytest.approx(fit.chi_squared, 1.0e-8)
+    assert fit_via_preloads.log_likelihood == pytest.approx(fit.log_likelihood, 1.0e-8)
+
+
+def test__chi_squared_via_unmasked_indexes_from__float32_accumulated_in_float64():
+    model_data = np.full((1000, 1000), 1000.0)
+    data = model_data + np.random.default_rng(1).normal(size=model_data.shape)
+
+    unmasked_indexes = np.arange(model_data.size)
+    inverse_noise_variance_unmasked = np.full(model_data.size, 0.5)
+
+    chi_squared = chi_squared_via_unmasked_indexes_from(
+        model_data=model_data,
+        unmasked_indexes=unmasked_indexes,
+        data_unmasked=data.ravel(),
+        inverse_noise_variance_unmasked=inverse_noise_variance_unmasked,
+    )
+
+    chi_squared_float32 = chi_squared_via_unmasked_indexes_from(
+        model_data=model_data.astype("float32"),
+        unmasked_indexes=unmasked_indexes,
+        data_unmasked=data.ravel().astype("float32"),
+        inverse_noise_variance_unmasked=inverse_noise_variance_unmasked.astype(
+            "float32"
+        ),
+    )
+
+    assert chi_squared_float32 == pytest.approx(chi_squared, 1.0e-4)
+
+
+def test__log_likelihood__via_sparse_noise_scaling_map_preloads(imaging_ci_7x7):
+    mask = ac.Mask2D.all_false(shape_native=(7, 7), pixel_scales=1.0)
+    mask[0, :] = True
+
+    masked_dataset = imaging_ci_7x7.apply_mask(mask=mask)
+
+    post_cti_data = masked_dataset.pre_cti_data + 0.5
+
+    hyper_noise_scalar_dict = ac.HyperCINoiseCollection(
+        parallel_eper=ac.HyperCINoiseScalar(scale_factor=1.0),
+        serial_eper=ac.HyperCINoiseScalar(scale_factor=2.0),
+    ).as_dict
+
+    unmasked_indexes = unmasked_indexes_from(mask=mask)
+
+    preloads = Preloads(
+        unmasked_indexes=unmasked_indexes,
+        data_unmasked=np.take(
+            native_array_from(array=masked_dataset.data), unmasked_indexes
+        ),
+        noise_map_unmasked=np.take(
+            native_array_from(array=masked_dataset.noise_map), unmasked_indexes
+        ),
+        sparse_noise_scaling_map_dict=sparse_noise_scaling_map_dict_from(
+            noise_scaling_map_dict=masked_dataset.noise_scaling_map_dict,
+            unmasked_indexes=unmasked_indexes,
+        ),
+    )
+
+    fit = ac.FitImagingCI(
+        dataset=masked_dataset,
+        post_cti_data=post_cti_data,
+        hyper_noise_scalar_dict=hyper_noise_scalar_dict,
+    )
+
+    fit_via_preloads = ac.FitImagingCI(
+        dataset=masked_dataset,
+        post_cti_data=post_cti_data,
+        hyper_noise_scalar_dict=hyper_noise_scalar_dict,
+        preloads=preloads,
+    )
+
+    assert fit_via_preloads.noise_map_unmasked == pytest.approx(
+        np.take(native_array_from(array=fit.noise_map), unmasked_indexes), 1.0e-8
+    )
+    assert fit_via_preloads.log_likelihood == pytest.approx(fit.log_likelihood, 1.0e-8)
+
+
+def test__hyper_noise_map_unmasked_from():
+    noise_scaling_map_dict = {
+        "parallel_eper": ac.Array2D.no_mask(
+            values=[[0.0, 2.0], [0.0, 4.0]], pixel_scales=1.0
+        ),
+        "serial_eper": ac.Array2D.no_mask(
+            values=[[1.0, 0.0], [0.0, 0.0]], pixel_scales=1.0
+        ),
+    }
+
+    sparse_noise_scaling_map_dict = sparse_noise_scaling_map_dict_from(
+        noise_scaling_map_dict=noise_scaling_map_dict,
+        unmasked_indexes=np.array([0, 1, 3]),
+    )
+
+    assert (sparse_noise_scaling_map_dict["parallel_eper"][0] == np.array([1, 2])).all()
+    assert (
+        sparse_noise_scaling_map_dict["parallel_eper"][1] == np.array([2.0, 4.0])
+    ).all()
+    assert (sparse_noise_scaling_map_dict["serial_eper"][0] == np.array([0])).all()
+
+    noise_map_unmasked = np.array([2.0, 2.0, 2.0])
+
+    hyper_noise_map_unmasked = hyper_noise_map_unmasked_from(
+        hyper_noise_scalar_dict={
+            "parallel_eper": ac.HyperCINoiseScalar(scale_factor=1.0),
+            "serial_eper": ac.HyperCINoiseScalar(scale_factor=2.0),
+        },
+        sparse_noise_scaling_map_dict=sparse_noise_scaling_map_dict,
+        noise_map_unmasked=noise_map_unmasked,
+    )
+
+    assert (hyper_noise_map_unmasked == np.array([4.0, 4.0, 6.0])).all()
+    assert (noise_map_unmasked == np.array([2.0, 2.0, 2.0])).all()
+
+
 def test__hyper_noise_map_from():
     noise_map = ac.Array2D.full(fill_value=2.0, shape_native=(2, 2), pixel_scales=1.0)
     noise_scaling_map_dict = {
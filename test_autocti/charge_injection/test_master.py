@@ -4,6 +4,7 @@ import pytest
 import autocti as ac
 
 from autocti.charge_injection.master import master_ci_from
+from autocti.charge_injection.master import master_ci_stack_from
 
 
 def test__master_ci_from():
@@ -13,3 +14,65 @@ def test__master_ci_from():
     master_ci = master_ci_from(ci_list=[ci_0, ci_1])
 
     assert master_ci.native == pytest.approx(np.array([[1.5, 1.5], [3.0, 3.0]]), 1.0e-4)
+
+
+def test__master_ci_from__frames_via_iterator_and_fits_paths(tmp_path):
+    values_list = [np.random.default_rng(seed).normal(size=(5, 3)) for seed in range(4)]
+
+    master_ci = master_ci_from(
+        ci_list=(
+            ac.Array2D.no_mask(values=values, pixel_scales=1.0)
+            for values in values_list
+        )
+    )
+
+    assert master_ci.native == pytest.approx(np.mean(values_list, axis=0), 1.0e-8)
+    assert master_ci.pixel_scales == (1.0, 1.0)
+
+    path_list = []
+
+    for index, values in enumerate(values_list):
+        path_list.append(tmp_path / f"ci_{index}.fits")
+
+        ac.Array2D.no_mask(values=values, pixel_scales=1.0).output_to_fits(
+            file_path=path_list[-1]
+        )
+
+    master_ci = master_ci_from(ci_list=path_list, pixel_scales=1.0)
+
+    assert master_ci.native == pytest.approx(np.mean(values_list, axis=0), 1.0e-8)
+
+    master_ci = master_ci_from(
+        ci_list=path_list, pixel_scales=1.0, method="median", rows_per_block=2
+    )
+
+    assert master_ci.native == pytest.approx(np.median(values_list, axis=0), 1.0e-8)
+
+
+def test__master_ci_stack_from__variance():
+    values_list = [np.random.default_rng(seed).normal(size=(5, 3)) for seed in range(4)]
+
+    stack = master_ci_stack_from(ci_list=values_list, pixel_scales=1.0)
+
+    assert stack.total_frames == 4
+    assert stack.mean.native == pytest.approx(np.mean(values_list, axis=0), 1.0e-8)
+    assert stack.variance.native == pytest.approx(
+        np.var(values_list, axis=0, ddof=1), 1.0e-8
+    )
+
+
+def test__master_ci_from__sigma_clip_removes_cosmic_ray():
+    values_list = [np.full((4, 2), 1.0 + 0.01 * index) for index in range(10)]
+    values_list[3][1, 1] = 1000.0
+
+    master_ci = master_ci_from(
+        ci_list=values_list, pixel_scales=1.0, method="sigma_clip", rows_per_block=3
+    )
+
+    master_ci_mean = master_ci_from(ci_list=values_list, pixel_scales=1.0)
+
+    assert master_ci_mean.native[1, 1] > 100.0
+    assert master_ci.native[1, 1] == pytest.approx(
+        np.mean([1.0 + 0.01 * index for index in range(10) if index != 3]), 1.0e-8
+    )
+    assert master_ci.native[0, 0] == pytest.approx(1.045, 1.0e-8)
@@ -0,0 +1,122 @@
+import numpy as np
+
+import autocti as ac
+
+
+def test__unique_stripes_from():
+    arr = np.array(
+        [
+            [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0],
+            [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+            [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 2.0, 1.0],
+        ]
+    )
+
+    first_index, inverse = ac.util.clocker.unique_stripes_from(
+        data=arr, for_parallel=True
+    )
+
+    assert (first_index == np.array([0, 1, 5, 6])).all()
+    assert (inverse == np.array([0, 1, 1, 0, 0, 2, 3, 1])).all()
+
+    first_index, inverse = ac.util.clocker.unique_stripes_from(
+        data=arr, for_parallel=False
+    )
+
+    assert (first_index == np.array([0, 1, 2])).all()
+    assert (inverse == np.array([0, 1, 2])).all()
+
+
+def test__unique_stripes_from__round_off_and_negative_zero_grouped():
+    arr = np.array([[1.0, 1.0 + 1.0e-12, 2.0], [0.0, -0.0, 0.0]])
+
+    first_index, inverse = ac.util.clocker.unique_stripes_from(
+        data=arr, for_parallel=True
+    )
+
+    assert (first_index == np.array([0, 2])).all()
+    assert (inverse == np.array([0, 0, 1])).all()
+
+
+def test__fast_stripe_lists_from():
+    fast_stripe_lists = ac.util.clocker.fast_stripe_lists_from(
+        inverse=np.array([0, 1, 1, 0, 0, 2, 3, 1])
+    )
+
+    assert fast_stripe_lists == [[0, 3, 4], [1, 2, 7], [5], [6]]
+
+
+def test__inverse_indexes_from():
+    inverse = ac.util.clocker.inverse_indexes_from(
+        fast_stripe_lists=[[0, 3, 4], [1, 2, 7], [5], [6]]
+    )
+
+    assert (inverse == np.array([0, 1, 1, 0, 0, 2, 3, 1])).all()
+
+
+def test__stripes_match_groups():
+    arr = np.array(
+        [
+            [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0],
+            [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+            [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 2.0, 1.0],
+        ]
+    )
+
+    first_index = np.array([0, 1, 5, 6])
+    inverse = np.array([0, 1, 1, 0, 0, 2, 3, 1])
+
+    assert ac.util.clocker.stripes_match_groups(
+        data=arr, for_parallel=True, first_index=first_index, inverse=inverse
+    )
+
+    arr[0, 2] = 3.0
+
+    assert not ac.util.clocker.stripes_match_groups(
+        data=arr, for_parallel=True, first_index=first_index, inverse=inverse
+    )
+
+    assert not ac.util.clocker.stripes_match_groups(
+        data=arr, for_parallel=False, first_index=first_index, inverse=inverse
+    )
+
+
+def test__trap_column_groups_from():
+    trap_column_list = [
+        [ac.TrapInstantCapture(density=density, release_timescale=1.0)]
+        for density in [0.1, 0.2, 0.1, 0.3, 0.2]
+    ]
+
+    column_lists = ac.util.clocker.trap_column_groups_from(
+        trap_column_list=trap_column_list
+    )
+
+    assert column_lists == [[0, 2], [1, 4], [3]]
+
+
+def test__active_stripe_indexes_from():
+    arr = np.array(
+        [
+            [0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0, 2.0, 3.0],
+            [0.0, 1.0, 0.0, 0.0, 0.0],
+        ]
+    )
+
+    column_indexes = ac.util.clocker.active_stripe_indexes_from(
+        data=arr, for_parallel=True
+    )
+
+    assert (column_indexes == np.array([1, 3, 4])).all()
+
+    column_indexes = ac.util.clocker.active_stripe_indexes_from(
+        data=arr, for_parallel=True, window_start=2, window_stop=4
+    )
+
+    assert (column_indexes == np.array([3])).all()
+
+    row_indexes = ac.util.clocker.active_stripe_indexes_from(
+        data=arr, for_parallel=False
+    )
+
+    assert (row_indexes == np.array([1, 2])).all()
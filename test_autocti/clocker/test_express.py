@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+import autocti as ac
+
+
+def test__express_calibration__clocker_1d():
+    arr = np.zeros(20)
+    arr[2:6] = 100.0
+
+    data = ac.Array1D.no_mask(values=arr, pixel_scales=1.0)
+
+    cti = ac.CTI1D(
+        trap_list=[ac.TrapInstantCapture(density=10.0, release_timescale=1.0)],
+        ccd=ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0),
+    )
+
+    clocker = ac.Clocker1D(express=5)
+
+    calibration = ac.ExpressCalibration(
+        clocker=clocker, data=data, cti=cti, express_list=(1, 2, 4)
+    )
+
+    trial_list = calibration.trial_list_from(express_key="express")
+
+    assert [trial.express for trial in trial_list] == [0, 1, 2, 4]
+    assert trial_list[0].log_likelihood_error == 0.0
+    assert trial_list[1].max_residual >= 0.0
+
+    calibration.tolerance = 1.0e99
+
+    assert calibration.express_dict == {"express": 1}
+
+    calibration.tolerance = 0.0
+
+    express = calibration.express_from(express_key="express")
+
+    trial_dict = {trial.express: trial for trial in trial_list}
+
+    assert trial_dict[express].log_likelihood_error == pytest.approx(0.0, 1.0e-8)
+
+    clocker_calibrated = calibration.clocker_from()
+
+    assert clocker_calibrated.express == express
+    assert clocker.express == 5
+
+
+def test__express_calibration__clocker_2d():
+    arr = np.zeros((10, 8))
+    arr[1:4, 2:6] = 100.0
+
+    data = ac.Array2D.no_mask(values=arr, pixel_scales=1.0)
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+    trap_list = [ac.TrapInstantCapture(density=10.0, release_timescale=1.0)]
+
+    calibration = ac.ExpressCalibration(
+        clocker=ac.Clocker2D(),
+        data=data,
+        cti=ac.CTI2D(parallel_trap_list=trap_list, parallel_ccd=ccd),
+        noise_map=ac.Array2D.full(
+            fill_value=2.0, shape_native=(10, 8), pixel_scales=1.0
+        ),
+        express_list=(1, 2),
+    )
+
+    assert calibration.express_key_list == ["parallel_express"]
+
+    calibration = ac.ExpressCalibration(
+        clocker=ac.Clocker2D(),
+        data=data,
+        cti=ac.CTI2D(
+            parallel_trap_list=trap_list,
+            parallel_ccd=ccd,
+            serial_trap_list=trap_list,
+            serial_ccd=ccd,
+        ),
+        tolerance=1.0e99,
+        express_list=(1, 2),
+    )
+
+    express_dict = calibration.express_dict
+
+    assert express_dict.keys() == {"parallel_express", "serial_express"}
+
+    clocker = calibration.clocker_from()
+
+    assert clocker.parallel_express == express_dict["parallel_express"]
+    assert clocker.serial_express == express_dict["serial_express"]
+
+
+def test__express_calibration__clocker_2d__combined_express_within_tolerance():
+    arr = np.zeros((10, 8))
+    arr[1:4, 2:6] = 100.0
+
+    data = ac.Array2D.no_mask(values=arr, pixel_scales=1.0)
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+    trap_list = [ac.TrapInstantCapture(density=10.0, release_timescale=1.0)]
+
+    calibration = ac.ExpressCalibration(
+        clocker=ac.Clocker2D(),
+        data=data,
+        cti=ac.CTI2D(
+            parallel_trap_list=trap_list,
+            parallel_ccd=ccd,
+            serial_trap_list=trap_list,
+            serial_ccd=ccd,
+        ),
+        express_list=(1, 2),
+    )
+
+    calibration.tolerance = max(
+        calibration.trial_list_from(express_key=express_key)[1].log_likelihood_error
+        for express_key in calibration.express_key_list
+    )
+
+    assert calibration.express_from(express_key="parallel_express") == 1
+    assert calibration.express_from(express_key="serial_express") == 1
+
+    express_dict = calibration.express_dict
+
+    residual_map, _ = calibration._residual_map_from(express_dict=express_dict)
+
+    assert (
+        calibration.log_likelihood_error_from(residual_map=residual_map)
+        <= calibration.tolerance
+    )
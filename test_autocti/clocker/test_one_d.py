@@ -7,6 +7,8 @@ from arcticpy import add_cti
 
 import autocti as ac
 
+from autocti.clocker.abstract import arctic_unsupported_kwargs_from
+
 path = "{}/".format(os.path.dirname(os.path.realpath(__file__)))
 
 
@@ -59,3 +61,64 @@ def test__data_mapped_to_2d_and_then_1d():
     image_corrected = clocker_1d.remove_cti(data=image_via_clocker, cti=cti)
 
     assert (image_corrected[:] > image_via_clocker[:]).all()
+
+
+def test__traps_ccd_from__arctic_inputs_reused_for_same_parameters():
+    clocker = ac.Clocker1D()
+
+    trap_list, ccd = clocker.traps_ccd_from(
+        trap_list=[ac.TrapInstantCapture(density=1.0, release_timescale=2.0)],
+        ccd_phase=ac.CCDPhase(full_well_depth=1e3, well_fill_power=0.5),
+    )
+
+    assert trap_list[0].density == 1.0
+    assert ccd.full_well_depths[0] == 1e3
+
+    trap_list_cached, ccd_cached = clocker.traps_ccd_from(
+        trap_list=[ac.TrapInstantCapture(density=1.0, release_timescale=2.0)],
+        ccd_phase=ac.CCDPhase(full_well_depth=1e3, well_fill_power=0.5),
+    )
+
+    assert trap_list_cached is trap_list
+    assert ccd_cached is ccd
+
+    trap_list, ccd = clocker.traps_ccd_from(
+        trap_list=[ac.TrapInstantCapture(density=3.0, release_timescale=2.0)],
+        ccd_phase=None,
+    )
+
+    assert trap_list_cached is not trap_list
+    assert trap_list[0].density == 3.0
+    assert ccd is None
+
+
+def test__traps_ccd_from__trap_modified_in_place__cached_inputs_unchanged():
+    clocker = ac.Clocker1D()
+
+    trap = ac.TrapInstantCapture(density=5.0, release_timescale=2.0)
+
+    trap_list, _ = clocker.traps_ccd_from(trap_list=[trap], ccd_phase=None)
+
+    assert trap_list[0] is not trap
+
+    trap.density = 6.0
+
+    assert trap_list[0].density == 5.0
+
+    trap_list, _ = clocker.traps_ccd_from(trap_list=[trap], ccd_phase=None)
+
+    assert trap_list[0].density == 6.0
+
+
+def test__arctic_unsupported_kwargs_from():
+    def add_cti_old(image, parallel_traps=None, verbosity=0):
+        pass
+
+    def add_cti_new(image, allow_negative_pixels=1, pixel_bounce_list=None):
+        pass
+
+    assert arctic_unsupported_kwargs_from(func=add_cti_old) == (
+        "allow_negative_pixels",
+        "pixel_bounce_list",
+    )
+    assert arctic_unsupported_kwargs_from(func=add_cti_new) == ()
@@ -0,0 +1,31 @@
+from multiprocessing.shared_memory import SharedMemory
+
+from autocti.clocker import pool
+
+
+def test__shared_array_from__one_attachment_per_role():
+    shared_memory_0 = SharedMemory(create=True, size=4 * 8)
+    shared_memory_1 = SharedMemory(create=True, size=6 * 8)
+
+    array = pool._shared_array_from(
+        name=shared_memory_0.name, shape=(2, 2), role="input"
+    )
+
+    assert pool._shared_memory_dict["input"].name == shared_memory_0.name
+
+    del array
+
+    array = pool._shared_array_from(
+        name=shared_memory_1.name, shape=(2, 3), role="input"
+    )
+
+    assert array.shape == (2, 3)
+    assert pool._shared_memory_dict["input"].name == shared_memory_1.name
+
+    del array
+
+    pool._shared_memory_dict.pop("input").close()
+
+    for shared_memory in [shared_memory_0, shared_memory_1]:
+        shared_memory.close()
+        shared_memory.unlink()
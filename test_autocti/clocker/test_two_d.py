@@ -8,6 +8,7 @@ from arcticpy import add_cti
 import autocti as ac
 
 from autocti import exc
+from autocti.preloads import Preloads
 
 path = "{}/".format(os.path.dirname(os.path.realpath(__file__)))
 
@@ -126,6 +127,76 @@ def test__add_cti_with_poisson_trap_densities():
     assert (image_via_clocker[:, 3] > 0.0).all()
 
 
+def test__add_cti_with_poisson_trap_densities__columns_grouped_by_traps():
+    arr = ac.Array2D.no_mask(
+        values=np.arange(1.0, 41.0).reshape(10, 4), pixel_scales=1.0
+    ).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=0.3, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(parallel_trap_list=trap_list, parallel_ccd=ccd)
+
+    for n_workers in (1, 2):
+        clocker = ac.Clocker2D(parallel_poisson_traps=True, n_workers=n_workers)
+
+        image_via_clocker = clocker.add_cti(data=arr, cti=cti)
+
+        assert len(clocker.parallel_trap_column_list) == 4
+
+        for column, parallel_traps in enumerate(clocker.parallel_trap_column_list):
+            image_via_arctic = add_cti(
+                image=np.array(arr.native[:, column : column + 1]),
+                parallel_traps=parallel_traps,
+                parallel_ccd=clocker.ccd_from(ccd_phase=ccd),
+                parallel_roe=clocker.parallel_roe,
+                verbosity=0,
+            )
+
+            assert image_via_clocker.native[:, column] == pytest.approx(
+                image_via_arctic[:, 0], 1.0e-8
+            )
+
+
+def test__add_cti_with_poisson_trap_densities__generator_seed():
+    arr = ac.Array2D.no_mask(
+        values=np.arange(1.0, 41.0).reshape(10, 4), pixel_scales=1.0
+    ).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=0.3, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(parallel_trap_list=trap_list, parallel_ccd=ccd)
+
+    state = np.random.get_state()
+
+    clocker = ac.Clocker2D(
+        parallel_poisson_traps=True, poisson_seed=np.random.SeedSequence(1)
+    )
+
+    image_0 = clocker.add_cti(data=arr, cti=cti)
+    image_1 = clocker.add_cti(data=arr, cti=cti)
+
+    assert (np.random.get_state()[1] == state[1]).all()
+    assert (image_0 == image_1).all()
+
+    generator = np.random.default_rng(np.random.SeedSequence(1))
+
+    density_list = [generator.poisson(0.3 * 10) / 10 for column in range(4)]
+
+    assert [
+        parallel_traps[0].density
+        for parallel_traps in clocker.parallel_trap_column_list
+    ] == density_list
+    assert trap_list[0].density == 0.3
+
+
 def test_fast_indexes_from():
     arr = np.array(
         (
@@ -155,6 +226,13 @@ def test_fast_indexes_from():
     assert fast_index_list == [0, 1, 5, 6]
     assert fast_column_lists == [[0, 3, 4], [1, 2, 7], [5], [6]]
 
+    fast_index_list, fast_inverse_indexes = clocker.fast_indexes_inverse_from(
+        data=arr, for_parallel=True
+    )
+
+    assert (fast_index_list == np.array([0, 1, 5, 6])).all()
+    assert (fast_inverse_indexes == np.array([0, 1, 1, 0, 0, 2, 3, 1])).all()
+
     arr = np.array(
         (
             [
@@ -256,3 +334,319 @@ def test__add_cti_serial_fast():
     image_via_clocker_fast = clocker.add_cti(data=arr, cti=cti)
 
     assert image_via_clocker == pytest.approx(image_via_clocker_fast, 1.0e-6)
+
+
+def test__add_cti_parallel_fast__preloads_from_column_lists_only():
+    arr = np.array(
+        (
+            [
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 0.0],
+                [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+                [0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 0.0],
+            ]
+        )
+    )
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(parallel_trap_list=trap_list, parallel_ccd=ccd)
+
+    image_via_clocker = ac.Clocker2D().add_cti(data=arr, cti=cti)
+
+    preloads = Preloads(
+        parallel_fast_index_list=[0, 1, 5, 6],
+        parallel_fast_column_lists=[[0, 3, 4], [1, 2, 7], [5], [6]],
+    )
+
+    assert (
+        preloads.parallel_fast_inverse_indexes == np.array([0, 1, 1, 0, 0, 2, 3, 1])
+    ).all()
+
+    clocker = ac.Clocker2D(parallel_fast_mode=True)
+
+    image_via_clocker_fast = clocker.add_cti(data=arr, cti=cti, preloads=preloads)
+
+    assert image_via_clocker == pytest.approx(image_via_clocker_fast, 1.0e-6)
+
+    with pytest.raises(exc.ClockerException):
+        Preloads(parallel_fast_index_list=[0, 1, 5, 6])
+
+    with pytest.raises(exc.ClockerException):
+        Preloads(serial_fast_index_list=[0, 1, 5, 6])
+
+
+def test__add_cti_parallel_serial_fast():
+    arr = np.array(
+        (
+            [
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0],
+                [0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0],
+                [0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 0.0],
+                [0.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            ]
+        )
+    )
+
+    arr = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(
+        parallel_trap_list=trap_list,
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    image_via_clocker = ac.Clocker2D().add_cti(data=arr, cti=cti)
+
+    clocker = ac.Clocker2D(parallel_fast_mode=True, serial_fast_mode=True)
+
+    preloads = Preloads()
+
+    image_via_clocker_fast = clocker.add_cti(data=arr, cti=cti, preloads=preloads)
+
+    assert image_via_clocker == pytest.approx(image_via_clocker_fast, 1.0e-6)
+    assert preloads.serial_fast_post_parallel_index_list is not None
+
+    row_index_list = preloads.serial_fast_post_parallel_index_list
+
+    image_via_clocker_fast = clocker.add_cti(data=arr, cti=cti, preloads=preloads)
+
+    assert image_via_clocker == pytest.approx(image_via_clocker_fast, 1.0e-6)
+    assert preloads.serial_fast_post_parallel_index_list is row_index_list
+
+
+def test__add_cti_and_remove_cti__n_workers():
+    arr = ac.Array2D.no_mask(
+        values=np.arange(1.0, 61.0).reshape(6, 10),
+        pixel_scales=1.0,
+        header=ac.Header(
+            header_sci_obj=None, header_hdu_obj=None, readout_offsets=(3, 5)
+        ),
+    ).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(
+        parallel_trap_list=trap_list,
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    clocker = ac.Clocker2D(serial_window_start=2, serial_window_stop=7)
+    clocker_pool = ac.Clocker2D(
+        serial_window_start=2, serial_window_stop=7, n_workers=3
+    )
+
+    image_via_clocker = clocker.add_cti(data=arr, cti=cti)
+    image_via_clocker_pool = clocker_pool.add_cti(data=arr, cti=cti)
+
+    assert (image_via_clocker.native == image_via_clocker_pool.native).all()
+
+    image_via_clocker = clocker.remove_cti(data=arr, cti=cti)
+    image_via_clocker_pool = clocker_pool.remove_cti(data=arr, cti=cti)
+
+    assert image_via_clocker.native == pytest.approx(
+        image_via_clocker_pool.native, 1.0e-8
+    )
+
+    clocker_pool.pool.close()
+
+
+def test__add_cti__float32_data__float32_post_cti_data():
+    arr = ac.Array2D.no_mask(
+        values=np.arange(1.0, 61.0).reshape(6, 10), pixel_scales=1.0
+    ).native
+
+    arr_float32 = ac.util.dtype.native_array_2d_from(array=arr, dtype="float32")
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(
+        parallel_trap_list=trap_list,
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    clocker = ac.Clocker2D()
+
+    image_via_clocker = clocker.add_cti(data=arr, cti=cti)
+    image_via_clocker_float32 = clocker.add_cti(data=arr_float32, cti=cti)
+
+    assert image_via_clocker_float32.native.dtype == np.float32
+    assert image_via_clocker_float32.native == pytest.approx(
+        image_via_clocker.native, 1.0e-6
+    )
+
+    image_via_clocker_float32 = clocker.remove_cti(data=arr_float32, cti=cti)
+
+    assert image_via_clocker_float32.native.dtype == np.float32
+
+
+def test__add_cti_batch():
+    arr = np.zeros((10, 8))
+    arr[1:4, 1:7] = 1.0
+    arr[6:8, 1:7] = 2.0
+
+    data_list = [
+        ac.Array2D.no_mask(values=arr * injection, pixel_scales=1.0).native
+        for injection in (1.0, 3.0, 5.0)
+    ]
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(
+        parallel_trap_list=trap_list,
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    for clocker in (
+        ac.Clocker2D(),
+        ac.Clocker2D(parallel_window_start=2, serial_window_stop=6),
+        ac.Clocker2D(parallel_fast_mode=True, serial_fast_mode=True),
+    ):
+        image_list = clocker.add_cti_batch(data_list=data_list, cti=cti)
+
+        assert len(image_list) == 3
+
+        for data, image in zip(data_list, image_list):
+            assert image.native == pytest.approx(
+                clocker.add_cti(data=data, cti=cti).native, 1.0e-6
+            )
+
+    assert ac.Clocker2D().add_cti_batch(data_list=[], cti=cti) == []
+
+
+def test__add_cti_batch__windows_and_readout_offsets__same_as_add_cti_every_mode():
+    arr = np.zeros((10, 8))
+    arr[1:4, 1:7] = 1.0
+    arr[6:8, 1:7] = 2.0
+
+    data_list = [
+        ac.Array2D.no_mask(
+            values=arr * injection,
+            pixel_scales=1.0,
+            header=ac.Header(
+                header_sci_obj=None, header_hdu_obj=None, readout_offsets=(3, 5)
+            ),
+        ).native
+        for injection in (1.0, 3.0)
+    ]
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    cti = ac.CTI2D(
+        parallel_trap_list=trap_list,
+        parallel_ccd=ccd,
+        serial_trap_list=trap_list,
+        serial_ccd=ccd,
+    )
+
+    window_dict = dict(
+        parallel_window_start=2,
+        parallel_window_stop=9,
+        serial_window_start=1,
+        serial_window_stop=6,
+    )
+
+    for clocker in (
+        ac.Clocker2D(**window_dict),
+        ac.Clocker2D(parallel_fast_mode=True, **window_dict),
+        ac.Clocker2D(serial_fast_mode=True, **window_dict),
+        ac.Clocker2D(parallel_fast_mode=True, serial_fast_mode=True, **window_dict),
+        ac.Clocker2D(active_window_mode=True, **window_dict),
+        ac.Clocker2D(n_workers=2, **window_dict),
+    ):
+        image_list = clocker.add_cti_batch(data_list=data_list, cti=cti)
+
+        for data, image in zip(data_list, image_list):
+            assert image.native == pytest.approx(
+                clocker.add_cti(data=data, cti=cti).native, 1.0e-6
+            )
+
+        if clocker.n_workers > 1:
+            clocker.pool.close()
+
+
+def test__add_cti_active_window():
+    arr = np.zeros((10, 8))
+    arr[1:4, 2:6] = 1.0
+    arr[6:8, 2:6] = 2.0
+
+    data = ac.Array2D.no_mask(values=arr, pixel_scales=1.0).native
+
+    ccd = ac.CCDPhase(full_well_depth=1e3, well_notch_depth=0.0, well_fill_power=1.0)
+
+    trap_list = [
+        ac.TrapInstantCapture(density=10.0, release_timescale=-1.0 / np.log(0.5))
+    ]
+
+    for cti in (
+        ac.CTI2D(parallel_trap_list=trap_list, parallel_ccd=ccd),
+        ac.CTI2D(serial_trap_list=trap_list, serial_ccd=ccd),
+        ac.CTI2D(
+            parallel_trap_list=trap_list,
+            parallel_ccd=ccd,
+            serial_trap_list=trap_list,
+            serial_ccd=ccd,
+        ),
+    ):
+        for clocker_kwargs in (
+            {},
+            {"parallel_window_start": 2, "serial_window_stop": 4},
+            {"parallel_roe": ac.ROE(empty_traps_between_columns=False)},
+        ):
+            clocker = ac.Clocker2D(**clocker_kwargs)
+
+            clocker_active_window = ac.Clocker2D(
+                active_window_mode=True, **clocker_kwargs
+            )
+
+            image = clocker.add_cti(data=data, cti=cti)
+            image_active_window = clocker_active_window.add_cti(data=data, cti=cti)
+
+            assert image_active_window.native == pytest.approx(image.native, 1.0e-6)
+
+    image = ac.Clocker2D(active_window_mode=True).add_cti(
+        data=ac.Array2D.zeros(shape_native=(4, 4), pixel_scales=1.0), cti=cti
+    )
+
+    assert (image.native == np.zeros((4, 4))).all()
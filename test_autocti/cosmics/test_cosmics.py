@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+import autocti as ac
+
+from autocti.cosmics.cosmics import grid_coordinates_from
+
+
+def test__grid_coordinates_from():
+    track, coordinate = grid_coordinates_from(
+        lower=np.array([1, 4, 2]), upper=np.array([3, 4, 5])
+    )
+
+    assert (track == np.array([0, 0, 2, 2, 2])).all()
+    assert (coordinate == np.array([1, 2, 2, 3, 4])).all()
+
+
+def test__intercepts_from():
+    simulator = ac.SimulatorCosmicRayMap.defaults(shape_native=(5, 5), seed=1)
+
+    image = simulator.intercepts_from(
+        luminosities=np.array([10.0, 20.0]),
+        x0=np.array([1.5, 2.2]),
+        y0=np.array([3.5, 1.4]),
+        lengths=np.array([0.1, 4.0]),
+        angles=np.array([0.5, 0.3]),
+        flux_scaling=2.0,
+    )
+
+    assert image[3, 1] == pytest.approx(20.0, 1.0e-4)
+    assert image[2, 2] == pytest.approx(10.46752, 1.0e-4)
+    assert image[2, 3] == pytest.approx(10.46752, 1.0e-4)
+    assert np.sum(image) == pytest.approx(40.93504, 1.0e-4)
+
+
+def test__cosmic_ray_map_from__covering_fraction_reached():
+    simulator = ac.SimulatorCosmicRayMap.defaults(shape_native=(200, 200), seed=1)
+
+    cosmic_ray_map = simulator.cosmic_ray_map_from(cover_fraction=1.4)
+
+    covering = 100.0 * np.count_nonzero(cosmic_ray_map.native) / 200**2
+
+    assert 1.4 <= covering < 1.6
+    assert simulator.length_interpolator is simulator.length_interpolator
+
+
+def test__cosmic_ray_map_from__generator_seed_reproducible():
+    state = np.random.get_state()
+
+    cosmic_ray_map_0 = ac.SimulatorCosmicRayMap.defaults(
+        shape_native=(50, 50), seed=np.random.SeedSequence(1)
+    ).cosmic_ray_map_from()
+
+    cosmic_ray_map_1 = ac.SimulatorCosmicRayMap.defaults(
+        shape_native=(50, 50), seed=np.random.default_rng(np.random.SeedSequence(1))
+    ).cosmic_ray_map_from()
+
+    assert (cosmic_ray_map_0 == cosmic_ray_map_1).all()
+    assert np.sum(cosmic_ray_map_0) > 0.0
+
+    assert (np.random.get_state()[1] == state[1]).all()
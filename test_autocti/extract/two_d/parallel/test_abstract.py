@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 import autocti as ac
+from autocti import exc
 
 
 def test__row_column_index_list_of_lists_from(parallel_array, parallel_masked_array):
@@ -311,3 +312,32 @@ def test__median_list_of_lists_via_array_list_from(
     # and then the median of 2.5 and 3.0 = 2.75.
 
     assert median_list_of_lists[1] == [2.75, 2.75, 2.75]
+
+
+def test__value_list_from__masked_values_omitted():
+    array = np.array([[[1.0, 2.0], [3.0, 4.0]], [[5.0, 6.0], [7.0, 8.0]]])
+    mask = np.array([[[False, True], [False, True]], [[True, True], [False, True]]])
+
+    value_list = ac.util.extract_2d.value_list_from(
+        array=array, mask=mask, axis=(0, 1), value_str="median"
+    )
+
+    assert value_list[0] == 3.0
+    assert np.isnan(value_list[1])
+
+    value_list = ac.util.extract_2d.value_list_from(
+        array=array, mask=mask, axis=(0, 1), value_str="mean"
+    )
+
+    assert value_list[0] == pytest.approx(11.0 / 3.0, 1.0e-4)
+
+    value_list = ac.util.extract_2d.value_list_from(
+        array=array, mask=mask, axis=(0, 1), value_str="std"
+    )
+
+    assert value_list[0] == pytest.approx(np.std([1.0, 3.0, 7.0]), 1.0e-4)
+
+    with pytest.raises(exc.ExtractException):
+        ac.util.extract_2d.value_list_from(
+            array=array, mask=mask, axis=(0, 1), value_str="max"
+        )
@@ -212,6 +212,37 @@ def test__cosmic_ray_mask_included_in_total_mask():
         )
     ).all()
 
+    cosmic_ray_map = ac.Array2D.no_mask(
+        values=[
+            [False, False, False, False, False],
+            [False, False, False, True, False],
+            [True, False, False, False, False],
+            [False, False, False, False, False],
+        ],
+        pixel_scales=1.0,
+    )
+
+    mask = ac.Mask2D.from_cosmic_ray_map_buffed(
+        cosmic_ray_map=cosmic_ray_map,
+        settings=ac.SettingsMask2D(
+            cosmic_ray_parallel_buffer=1,
+            cosmic_ray_serial_buffer=3,
+            cosmic_ray_diagonal_buffer=1,
+        ),
+    )
+
+    assert (
+        mask
+        == np.array(
+            [
+                [False, False, False, False, False],
+                [False, False, False, True, True],
+                [True, True, True, True, True],
+                [True, True, False, False, False],
+            ]
+        )
+    ).all()
+
 
 def test__load_and_output_mask_to_fits():
     mask = ac.Mask2D.from_fits(
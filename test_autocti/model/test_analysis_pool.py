@@ -0,0 +1,128 @@
+import copy
+import pickle
+import pytest
+
+import autofit as af
+import autocti as ac
+
+from autocti.model.analysis_pool import parameter_vector_from
+
+
+def test__parameter_vector_from():
+    model = af.Collection(
+        cti=af.Model(
+            ac.CTI2D,
+            parallel_trap_list=[af.Model(ac.TrapInstantCapture)],
+            parallel_ccd=af.Model(ac.CCDPhase),
+        ),
+        hyper_noise=af.Model(
+            ac.HyperCINoiseCollection, regions_ci=ac.HyperCINoiseScalar
+        ),
+    )
+
+    instance = model.instance_from_prior_medians()
+
+    vector = parameter_vector_from(model=model, instance=instance)
+
+    assert len(vector) == model.prior_count
+
+    instance_via_vector = model.instance_from_vector(vector=vector)
+
+    assert instance_via_vector.cti.parallel_trap_list[0].density == pytest.approx(
+        instance.cti.parallel_trap_list[0].density, 1.0e-8
+    )
+    assert instance_via_vector.hyper_noise.regions_ci == pytest.approx(
+        instance.hyper_noise.regions_ci, 1.0e-8
+    )
+
+
+def test__parameter_vector_from__shared_priors():
+    trap_0 = af.Model(ac.TrapInstantCapture)
+    trap_1 = af.Model(ac.TrapInstantCapture)
+
+    trap_1.density = trap_0.density
+
+    model = af.Collection(
+        cti=af.Model(
+            ac.CTI2D,
+            parallel_trap_list=[trap_0, trap_1],
+            parallel_ccd=ac.CCDPhase(),
+        ),
+    )
+
+    instance = model.instance_from_prior_medians()
+
+    vector = parameter_vector_from(model=model, instance=instance)
+
+    assert len(model.paths) > model.prior_count
+    assert len(vector) == model.prior_count
+
+    instance_via_vector = model.instance_from_vector(vector=vector)
+
+    for trap, trap_via_vector in zip(
+        instance.cti.parallel_trap_list, instance_via_vector.cti.parallel_trap_list
+    ):
+        assert trap_via_vector.density == pytest.approx(trap.density, 1.0e-8)
+        assert trap_via_vector.release_timescale == pytest.approx(
+            trap.release_timescale, 1.0e-8
+        )
+
+
+def test__log_likelihood_function__sum_of_analyses(imaging_ci_7x7, parallel_clocker_2d):
+    model = af.Collection(
+        cti=af.Model(
+            ac.CTI2D,
+            parallel_trap_list=[af.Model(ac.TrapInstantCapture)],
+            parallel_ccd=ac.CCDPhase(),
+        ),
+    )
+
+    imaging_ci_offset = copy.deepcopy(imaging_ci_7x7)
+    imaging_ci_offset.data = imaging_ci_offset.data + 1.0
+
+    analysis_list = [
+        ac.AnalysisImagingCI(dataset=dataset, clocker=parallel_clocker_2d)
+        for dataset in (imaging_ci_7x7, imaging_ci_offset)
+    ]
+
+    instance = model.instance_from_prior_medians()
+
+    log_likelihood = sum(
+        analysis.log_likelihood_function(instance=instance)
+        for analysis in analysis_list
+    )
+
+    analysis = ac.CombinedAnalysisPool(*analysis_list, n_workers=2)
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        log_likelihood, 1.0e-8
+    )
+
+    analysis = analysis.modify_before_fit(paths=af.DirectoryPaths(), model=model)
+
+    assert analysis.model is model
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        log_likelihood, 1.0e-8
+    )
+
+    instance = model.instance_from_unit_vector([0.3, 0.6])
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        sum(
+            analysis.log_likelihood_function(instance=instance)
+            for analysis in analysis_list
+        ),
+        1.0e-8,
+    )
+
+    analysis = pickle.loads(pickle.dumps(analysis))
+
+    assert analysis.log_likelihood_function(instance=instance) == pytest.approx(
+        sum(
+            analysis.log_likelihood_function(instance=instance)
+            for analysis in analysis_list
+        ),
+        1.0e-8,
+    )
+
+    analysis.close()
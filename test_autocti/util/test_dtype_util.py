@@ -0,0 +1,65 @@
+import numpy as np
+
+from autocti.util import dtype_util
+
+import autocti as ac
+
+
+def test__dtype_from():
+    assert dtype_util.dtype_from() == np.float64
+    assert dtype_util.dtype_from(dtype="float32") == np.float32
+
+
+def test__array_2d_no_mask_from():
+    values = np.arange(6.0).reshape(2, 3)
+
+    array = dtype_util.array_2d_no_mask_from(values=values, pixel_scales=1.0)
+
+    assert array.dtype == np.float64
+    assert (array.native == values).all()
+
+    array = dtype_util.array_2d_no_mask_from(
+        values=values, pixel_scales=1.0, dtype="float32"
+    )
+
+    assert array.native.dtype == np.float32
+    assert (array.native == values).all()
+    assert array.pixel_scales == (1.0, 1.0)
+
+
+def test__native_array_2d_from():
+    array = ac.Array2D.no_mask(values=np.arange(6.0).reshape(2, 3), pixel_scales=1.0)
+
+    array_native = dtype_util.native_array_2d_from(array=array.native)
+
+    assert array_native.dtype == np.float64
+    assert (array_native == array.native).all()
+
+    array_native = dtype_util.native_array_2d_from(array=array, dtype="float32")
+
+    assert array_native.dtype == np.float32
+    assert array_native.native.dtype == np.float32
+    assert (array_native == array.native).all()
+    assert (array_native.mask == array.mask).all()
+
+
+def test__array_2d_view_from():
+    array = ac.Array2D.no_mask(values=np.arange(6.0).reshape(2, 3), pixel_scales=1.0)
+
+    mask = ac.Mask2D.all_false(shape_native=(2, 3), pixel_scales=1.0)
+    mask[0, 0] = True
+
+    array_view = dtype_util.array_2d_view_from(array=array.native, mask=mask)
+
+    assert (array_view.mask == mask).all()
+    assert (array_view.native == array.native).all()
+    assert (array_view.slim == np.arange(1.0, 6.0)).all()
+
+    array_native = array.native
+
+    array_view = dtype_util.array_2d_view_from(
+        array=array_native, mask=mask[:, 1:], values=array_native.values[:, 1:]
+    )
+
+    assert array_view.shape_native == (2, 2)
+    assert np.shares_memory(array_view.values, array_native.values)
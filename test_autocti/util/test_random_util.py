@@ -0,0 +1,52 @@
+import numpy as np
+
+from autocti.util import random_util
+
+
+def test__is_stream():
+    assert random_util.is_stream(rng=1) is False
+    assert random_util.is_stream(rng=np.random.SeedSequence(1)) is True
+    assert random_util.is_stream(rng=np.random.default_rng(1)) is True
+
+
+def test__generator_from():
+    generator = np.random.default_rng(1)
+
+    assert random_util.generator_from(rng=generator) is generator
+
+    assert (
+        random_util.generator_from(rng=1).random() == np.random.default_rng(1).random()
+    )
+
+
+def test__generator_list_from__streams_reproducible_and_independent():
+    generator_list = random_util.generator_list_from(rng=1, total=3)
+
+    value_list = [generator.random() for generator in generator_list]
+
+    assert len(set(value_list)) == 3
+
+    generator_list = random_util.generator_list_from(rng=1, total=5)
+
+    assert [generator.random() for generator in generator_list[:3]] == value_list
+
+    generator_list = random_util.generator_list_from(
+        rng=np.random.SeedSequence(1), total=3
+    )
+
+    assert [generator.random() for generator in generator_list] == value_list
+
+
+def test__seed_sequence_at_index_from__independent_of_spawn_counter():
+    seed_sequence_list = random_util.seed_sequence_list_from(rng=1, total=3)
+
+    seed_sequence = np.random.SeedSequence(1)
+    seed_sequence.spawn(5)
+
+    for index in [2, 0, 1]:
+        assert (
+            np.random.default_rng(
+                random_util.seed_sequence_at_index_from(rng=seed_sequence, index=index)
+            ).random()
+            == np.random.default_rng(seed_sequence_list[index]).random()
+        )